@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Time the wisdom pipeline stages on synthetic masters and catch regressions.
+
+For every --scales entry EMOTIONSxLOCALES a synthetic master shaped like
+the real one is generated (pipeline/synthetic.py) and four stages run on
+it, each repeated --repeat times (fastest kept):
+
+  load    json parse of the master file
+  apply   translation-memory lookup of every cell + patch application
+          through MasterIndex (what build-wisdom.py --memory does)
+  derive  the Model of the patched master, then in-memory documents as
+          the two build scripts derive them: the constellation graph
+          (appearance, adjacency, related emotions) and per-locale
+          constellation, shard, record and search-index documents, plus
+          the source-stamp pass
+  emit    the real writers into an empty directory: master, then the
+          constellation graph and locale files, shards, packed records,
+          search index and manifest from the derive stage's Model
+          (derive + serialize + write)
+
+A final pass under tracemalloc records each stage's peak Python heap
+above what was live when it started. Results are written as JSON (--out)
+and compared with the stored baseline: a stage regresses when it is both
+more than --tolerance slower (or bigger) and past a small absolute noise
+floor. Regressions make the exit status 1. --save-baseline replaces the
+baseline with this run. Baselines are only comparable on the same
+machine, so the default one lives under .cache/ and is never committed;
+a baseline recorded elsewhere is flagged before the comparison.
+
+The default scales take about five minutes. Derive and emit grow with
+emotions × locales (related emotions with the square of emotions), and
+the tracemalloc pass is several times slower than that, so 1000x60 or 10000x11 take ten minutes and more each; compare such
+runs against a baseline saved at the same scales (--baseline).
+
+Usage:
+    python scripts/bench-pipeline.py [--scales 39x11,1000x11,200x60]
+        [--repeat 5] [--out PATH] [--baseline PATH] [--tolerance 0.25] [--save-baseline]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pipeline import MasterIndex, Model, load_master, write_master
+from pipeline.adjacency import adjacency_index
+from pipeline.appearance import emotion_appearance
+from pipeline.constellation import (
+    constellation_for_locale, constellation_graph, need_colors, write_constellation, write_constellation_graph,
+)
+from pipeline.master import localized_cells
+from pipeline.memory import TranslationMemory, memory_batches
+from pipeline.paths import ROOT
+from pipeline.records import emotion_record, write_emotion_records
+from pipeline.search import search_index, write_search_index
+from pipeline.similarity import related_emotions
+from pipeline.shards import wisdom_for_locale, write_locale_shards, write_manifest
+from pipeline.stamps import update_stamps
+from pipeline.synthetic import synthetic_locales, synthetic_master
+
+FORMAT = "pipeline-bench/1"
+BASELINE_PATH = os.path.join(ROOT, ".cache", "bench", "baseline.json")
+OUT_PATH = os.path.join(ROOT, ".cache", "bench", "pipeline.json")
+STAGES = ("load", "apply", "derive", "emit")
+
+# Differences below these are noise whatever the ratio (fastest-of-5
+# timings of the small scales still move by ~10 ms between runs)
+SECONDS_FLOOR = 0.025
+BYTES_FLOOR = 1 << 20
+
+
+def stage_load(ctx):
+    ctx["data"] = load_master(ctx["path"])
+
+
+def stage_apply(ctx):
+    data = ctx["data"]
+    batches, _ = memory_batches(ctx["memory"], localized_cells(Model.from_document(data)), ctx["translated"])
+    index = MasterIndex(data)
+    for batch in batches:
+        batch.apply(index)
+
+
+def _graph_parts(model):
+    colors = need_colors(model)
+    adjacency = {**adjacency_index(model), "related": related_emotions(model)}
+    return colors, emotion_appearance(model, colors), adjacency
+
+
+def stage_derive(ctx):
+    model = ctx["model"] = Model.from_document(ctx["data"])
+    colors, appearance, adjacency = _graph_parts(model)
+    constellation_graph(model, appearance, adjacency)
+    for locale in ctx["locales"]:
+        constellation_for_locale(model, locale, colors)
+        wisdom_for_locale(model, locale)
+        for emotion in model.emotions:
+            emotion_record(emotion, locale)
+        search_index(model, locale)
+    update_stamps(model, {}, ctx["translated"])
+
+
+def stage_emit(ctx):
+    model, out, locales = ctx["model"], ctx["out"], ctx["locales"]
+    write_master(ctx["data"], os.path.join(out, "master.json"))
+    colors, appearance, adjacency = _graph_parts(model)
+    write_constellation_graph(model, appearance, adjacency, out_dir=out)
+    for locale in locales:
+        write_constellation(model, locale, colors, out)
+    shards, _ = write_locale_shards(model, out, locales)
+    records, _ = write_emotion_records(model, out, locales, layout="packed")
+    search, _ = write_search_index(model, out, locales)
+    write_manifest(model, shards, records, search, out)
+
+
+RUNNERS = {"load": stage_load, "apply": stage_apply, "derive": stage_derive, "emit": stage_emit}
+
+
+def run_stages(ctx, tmp, trace=False):
+    """{stage: seconds} or, with trace, {stage: peak bytes}, for one pass."""
+    measured = {}
+    ctx["out"] = tempfile.mkdtemp(dir=tmp)
+    try:
+        for stage in STAGES:
+            if trace:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                RUNNERS[stage](ctx)
+                measured[stage] = tracemalloc.get_traced_memory()[1] - before
+            else:
+                start = time.perf_counter()
+                RUNNERS[stage](ctx)
+                measured[stage] = time.perf_counter() - start
+    finally:
+        shutil.rmtree(ctx["out"])
+    return measured
+
+
+def bench_scale(base, emotions, locales, repeat, tmp):
+    data = synthetic_master(base, emotions, locales)
+    codes = synthetic_locales(locales)
+    translated = [loc for loc in codes if loc != "en"]
+    memory = TranslationMemory()
+    for _, _, cell in localized_cells(Model.from_document(data)):
+        memory.merge_cell(cell, translated)
+    path = os.path.join(tmp, "master.json")
+    write_master(data, path)
+    del data
+
+    ctx = {"path": path, "locales": codes, "translated": translated, "memory": memory}
+    seconds = {}
+    for _ in range(repeat):
+        for stage, sec in run_stages(ctx, tmp).items():
+            seconds[stage] = min(sec, seconds.get(stage, sec))
+    tracemalloc.start()
+    try:
+        peaks = run_stages(ctx, tmp, trace=True)
+    finally:
+        tracemalloc.stop()
+    return [
+        {"scale": f"{emotions}x{locales}", "emotions": emotions, "locales": locales, "stage": stage,
+         "seconds": round(seconds[stage], 5), "peakBytes": peaks[stage], "masterBytes": os.path.getsize(path)}
+        for stage in STAGES
+    ]
+
+
+def compare(results, baseline, tolerance):
+    """Print each row against the baseline. Returns the regressed rows."""
+    before = {(r["scale"], r["stage"]): r for r in baseline.get("results", [])}
+    regressions = []
+    print(f"{'scale':>10} {'stage':<7} {'ms':>10} {'base ms':>10} {'Δ':>7} {'peak MiB':>9} {'base MiB':>9} {'Δ':>7}")
+    for row in results:
+        old = before.get((row["scale"], row["stage"]))
+        ms, mib = row["seconds"] * 1e3, row["peakBytes"] / (1 << 20)
+        if old is None:
+            print(f"{row['scale']:>10} {row['stage']:<7} {ms:>10.1f} {'-':>10} {'':>7} {mib:>9.1f} {'-':>9}")
+            continue
+        slow = row["seconds"] > old["seconds"] * (1 + tolerance) and row["seconds"] - old["seconds"] > SECONDS_FLOOR
+        big = (row["peakBytes"] > old["peakBytes"] * (1 + tolerance)
+               and row["peakBytes"] - old["peakBytes"] > BYTES_FLOOR)
+        time_delta = row["seconds"] / old["seconds"] - 1 if old["seconds"] else 0.0
+        mem_delta = row["peakBytes"] / old["peakBytes"] - 1 if old["peakBytes"] else 0.0
+        flag = "  REGRESSION" if slow or big else ""
+        print(f"{row['scale']:>10} {row['stage']:<7} {ms:>10.1f} {old['seconds'] * 1e3:>10.1f} {time_delta:>+7.0%}"
+              f" {mib:>9.1f} {old['peakBytes'] / (1 << 20):>9.1f} {mem_delta:>+7.0%}{flag}")
+        if slow or big:
+            regressions.append(row)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scales", default="39x11,1000x11,200x60",
+                        help="comma-separated EMOTIONSxLOCALES")
+    parser.add_argument("--repeat", type=int, default=5, help="timed passes per scale (fastest kept)")
+    parser.add_argument("--out", default=OUT_PATH, help=f"results JSON (default {os.path.relpath(OUT_PATH)})")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown/growth ratio")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    args = parser.parse_args(argv)
+
+    try:
+        scales = [tuple(int(n) for n in spec.lower().split("x")) for spec in args.scales.split(",") if spec]
+    except ValueError:
+        parser.error(f"Expected EMOTIONSxLOCALES, got {args.scales!r}")
+
+    base = load_master()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for emotions, locales in scales:
+            print(f"  {emotions} emotions × {locales} locales ...", flush=True)
+            results.extend(bench_scale(base, emotions, locales, max(1, args.repeat), tmp))
+
+    document = {
+        "format": FORMAT,
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "cpus": os.cpu_count()},
+        "repeat": args.repeat,
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    if baseline and baseline.get("machine") != document["machine"]:
+        print(f"Note: {os.path.relpath(args.baseline)} was recorded on {baseline.get('machine')};"
+              " differences include the machine")
+    regressions = compare(results, baseline, args.tolerance)
+    print(f"Results: {os.path.relpath(args.out)}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"Baseline saved: {os.path.relpath(args.baseline)}")
+        return 0
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed beyond {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Peak-RSS comparison: full load/dump vs streaming rewrite of the master.
+
+Builds synthetic masters by replicating the real emotions (with suffixed
+ids) at several scales, then rewrites each one in a fresh interpreter with
+json.load + json.dump and with MasterReader/MasterWriter, reporting peak
+resident memory (VmHWM, Linux only) above a bare interpreter and checking
+the two outputs are byte-identical.
+
+Usage:
+    python scripts/bench-stream.py [--scales 39,1000,5000]
+"""
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+
+from pipeline import load_master, write_master
+from pipeline.synthetic import synthetic_master
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Each mode runs in its own interpreter so its high-water mark is that mode's peak.
+CHILD = """
+import sys
+sys.path.insert(0, {scripts!r})
+from pipeline import load_master, write_master
+from pipeline.synthetic import synthetic_master
+from pipeline.stream import MasterReader, MasterWriter
+mode, src, dst = sys.argv[1:4]
+if mode == "load":
+    write_master(load_master(src), dst)
+elif mode == "stream":
+    with MasterReader(src) as reader, MasterWriter(dst, reader.head) as writer:
+        for emotion in reader.emotions():
+            writer.write_emotion(emotion)
+        writer.tail = reader.tail
+# VmHWM, unlike ru_maxrss, is not inherited from the forked parent image
+print(next(l.split()[1] for l in open("/proc/self/status") if l.startswith("VmHWM:")))
+"""
+
+
+def peak_kib(mode, src, dst):
+    code = CHILD.format(scripts=SCRIPTS_DIR)
+    out = subprocess.run([sys.executable, "-c", code, mode, src, dst],
+                         check=True, capture_output=True, text=True).stdout
+    return int(out.strip())
+
+
+def sha(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scales", default="39,1000,5000", help="comma-separated emotion counts")
+    args = parser.parse_args(argv)
+
+    base = load_master()
+    print(f"{'emotions':>9} {'file MB':>8} {'load+dump MiB':>14} {'stream MiB':>11} {'ratio':>6}  identical")
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "master.json")
+        write_master(base, src)
+        idle = peak_kib("none", src, os.devnull)
+
+        for count in [int(s) for s in args.scales.split(",") if s]:
+            write_master(synthetic_master(base, count), src)
+            loaded, streamed = os.path.join(tmp, "load.json"), os.path.join(tmp, "stream.json")
+            full = peak_kib("load", src, loaded) - idle
+            stream = peak_kib("stream", src, streamed) - idle
+            same = sha(loaded) == sha(streamed) == sha(src)
+            print(f"{count:>9} {os.path.getsize(src) / 1e6:>8.1f} {full / 1024:>14.1f} "
+                  f"{stream / 1024:>11.1f} {full / max(stream, 1):>6.1f}  {'yes' if same else 'NO'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
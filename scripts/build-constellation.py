@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Generate every public/data/constellation-{locale}.json from the master.
+
+The master is loaded into the compact model (pipeline/model.py) and the
+locale-independent parts are derived once: emotion colors/sizes/centroids
+and related emotions (needs NumPy), the selection adjacency, and
+layout-presets.json if present. They are written once, to
+constellation-graph.json, so the per-locale files carry only localized
+text plus need colors. Each locale is projected and written by a worker
+in a process pool.
+Adding a locale or an emotion to the master is one run of this script
+instead of eleven hand edits.
+
+Usage:
+    python scripts/build-constellation.py [--jobs N] [--locales en,es,...] [--production]
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from pipeline import LOCALES, PhaseTimer, load_model
+from pipeline.adjacency import adjacency_index
+from pipeline.appearance import emotion_appearance
+from pipeline.constellation import (
+    GRAPH_NAME, load_layout_presets, need_colors, write_constellation, write_constellation_graph,
+)
+from pipeline.emit import set_production
+from pipeline.similarity import related_emotions
+
+# Set once per worker by the pool initializer so the model is pickled
+# per process, not per task.
+_worker_model = None
+_worker_colors = None
+
+
+def _init_worker(model, colors, production):
+    global _worker_model, _worker_colors
+    _worker_model, _worker_colors = model, colors
+    set_production(production)
+
+
+def _build_locale(locale):
+    return write_constellation(_worker_model, locale, _worker_colors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (1 = build in this process)")
+    parser.add_argument("--locales", default=",".join(LOCALES),
+                        help="comma-separated locale codes to emit")
+    parser.add_argument("--production", action="store_true",
+                        help="compact JSON with sorted keys")
+    args = parser.parse_args(argv)
+    set_production(args.production)
+    locales = [loc for loc in args.locales.split(",") if loc]
+
+    timer = PhaseTimer()
+
+    with timer.phase("load master"):
+        model = load_model()
+        colors = need_colors(model)
+        layouts = load_layout_presets()
+
+    with timer.phase("emit graph"):
+        adjacency = {**adjacency_index(model), "related": related_emotions(model)}
+        graph_size, graph_written = write_constellation_graph(
+            model, emotion_appearance(model, colors), adjacency, layouts)
+
+    with timer.phase("emit locales"):
+        jobs = max(1, min(args.jobs, len(locales)))
+        if jobs == 1:
+            results = [write_constellation(model, loc, colors) for loc in locales]
+        else:
+            with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(model, colors, args.production)) as pool:
+                results = list(pool.map(_build_locale, locales))
+
+    print(f"  {GRAPH_NAME}  {graph_size:7d} B  {'written' if graph_written else 'unchanged'}")
+    for locale, size, written in results:
+        print(f"  constellation-{locale}.json  {size:7d} B  {'written' if written else 'unchanged'}")
+    print(f"{len(model.emotions)} emotions, {len(model.needs)} needs, {len(results)} locales ({jobs} jobs)")
+    if layouts is None:
+        print(f"No layout-presets.json: {GRAPH_NAME} carries no precomputed layouts (run build-layout.py)")
+    print(timer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Precompute settled constellation positions for canonical viewports.
+
+Runs the force layout offline (pipeline/layout.py, needs NumPy) with the
+PHYSICS and LAYOUT values from src/core/constants.js and writes
+public/data/layout-presets.json. build-constellation.py embeds it in
+constellation-graph.json, and createSimulation() starts from the
+preset nearest the viewport's aspect ratio instead of running the warmup.
+
+Re-run after changing PHYSICS/LAYOUT or the emotion/need links, then run
+build-constellation.py.
+
+Usage:
+    python scripts/build-layout.py [--seed N] [--ticks N]
+"""
+import argparse
+import os
+import sys
+
+from pipeline import PhaseTimer, load_model
+from pipeline.constellation import LAYOUT_PRESETS_PATH
+from pipeline.emit import dumps, write_if_changed
+from pipeline.layout import settle_presets
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--seed", type=int, default=0, help="random seed for start offsets, drift and jitter")
+    parser.add_argument("--ticks", type=int, help="ticks per preset (default PHYSICS.warmupTicks)")
+    args = parser.parse_args(argv)
+
+    timer = PhaseTimer()
+    with timer.phase("load master"):
+        model = load_model()
+    with timer.phase("settle presets"):
+        presets = settle_presets(model, ticks=args.ticks, seed=args.seed)
+    with timer.phase("write"):
+        blob = dumps(presets)
+        written = write_if_changed(LAYOUT_PRESETS_PATH, blob)
+
+    for preset in presets["presets"]:
+        print(f"  {preset['name']:<10} {preset['width']:>5}x{preset['height']:<5} {len(preset['positions'])} emotions")
+    print(f"{os.path.relpath(LAYOUT_PRESETS_PATH)}: {len(blob):,} B, {presets['ticks']} ticks,"
+          f" {'written' if written else 'unchanged'}")
+    print(timer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Split the UI string table into per-locale chunks loaded on demand.
+
+Reads src/core/ui-strings.source.js (pipeline/ui_strings.py) and writes
+the flat, dot-keyed tables src/core/ui-strings.js serves:
+
+  src/core/ui-strings-en.js              English, bundled as t()'s fallback
+  public/data/ui-strings/{locale}.json   every other locale, fetched by
+                                         loadUiStrings() before that locale
+                                         is shown
+
+so the bundle carries one language of UI text instead of eleven and t()
+does a single property read instead of walking the key path. Chunks are
+complete: keys a locale lacks are filled along its fallback chain
+(pipeline/fallback.py) and recorded in the "ui" section of
+scripts/locale-coverage.json. Keys a locale lacks (or has that English
+does not) are also printed; --strict makes missing keys an error.
+
+--production writes the chunks compact with sorted keys.
+
+Usage:
+    python scripts/build-ui-strings.py [--production] [--strict]
+"""
+import argparse
+import os
+import sys
+
+from pipeline import PhaseTimer
+from pipeline.emit import set_production
+from pipeline.fallback import coverage, write_coverage
+from pipeline.paths import COVERAGE_PATH, LOCALES, UI_CHUNK_DIR, UI_STRINGS_PATH
+from pipeline.ui_strings import missing_keys, read_ui_strings, ui_cells, write_ui_chunks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--production", action="store_true", help="compact, key-sorted chunks")
+    parser.add_argument("--strict", action="store_true", help="exit 1 if any locale is missing keys")
+    args = parser.parse_args(argv)
+    set_production(args.production)
+
+    timer = PhaseTimer()
+    with timer.phase("read table"):
+        table = read_ui_strings()
+    with timer.phase("write chunks"):
+        sizes, written = write_ui_chunks(table)
+    with timer.phase("locale coverage"):
+        covered = write_coverage("ui", coverage(ui_cells(table), LOCALES))
+
+    for locale, size in sizes.items():
+        print(f"  {locale}  {size:6d} B")
+    print(f"UI strings from {os.path.relpath(UI_STRINGS_PATH)}: {len(sizes)} locales,"
+          f" {written} files updated under {os.path.relpath(UI_CHUNK_DIR)}")
+
+    report = missing_keys(table)
+    for locale, (missing, extra) in report.items():
+        if missing:
+            print(f"  {locale}: {len(missing)} missing: {', '.join(missing)}")
+        if extra:
+            print(f"  {locale}: {len(extra)} not in en: {', '.join(extra)}")
+    if not report:
+        print("Every locale has every key")
+    print(f"{os.path.relpath(COVERAGE_PATH)}: {'written' if covered else 'unchanged'}")
+    print(timer.report())
+    return 1 if args.strict and any(missing for missing, _ in report.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
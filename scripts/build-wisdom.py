@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Single-pass build of emotion-constellation-more-info-data.json.
+
+Loads the master document once, applies every translation batch through
+one indexed emotion/need map and writes the result once. Replaces running
+translate-wisdom.py, translate-part2.py and tp3.py–tp7.py one after another
+(each of which re-parsed and re-serialized the whole file), then emits
+the per-locale wisdom-{locale}.json shards, the per-emotion records
+the panel fetches on selection and the per-locale search indexes, and
+refreshes the source-hash stamps that flag translations of since-edited
+English (scripts/translation-stamps.json; list them with
+stale-translations.py). Every derived file is fully populated per locale:
+missing cells are filled along the locale's fallback chain
+(pipeline/fallback.py), and which cells fell back is written to the
+"master" section of scripts/locale-coverage.json.
+
+Results are cached under .cache/wisdom-build/ keyed by content hash: when
+no batch script, search-keywords.json nor any output (the master, stamps,
+shards, records, search indexes) changed since the last build the run is a
+no-op; a deleted or edited output is rebuilt.
+
+--stream rewrites the master one emotion at a time (pipeline/stream.py),
+keeping memory bounded by a single record; it skips the derived
+shard/record/search outputs, the source stamps and the coverage report,
+which need the whole document.
+
+--production writes the derived artifacts compact with sorted keys and
+prints a payload size report (also available alone via --size-report).
+The committed outputs stay in the readable development form; the deploy
+workflow rebuilds them with --production before `npm run build`.
+
+--memory takes translations from the translation memory instead of
+executing the batch scripts: every cell whose English text has an exact
+entry gets that entry's strings, and cells without one are listed with the
+closest fuzzy matches (fill the store with translation-memory.py import).
+
+Usage:
+    python scripts/build-wisdom.py [--dry-run] [--force] [--no-cache]
+                                   [--records files|packed] [--stream]
+                                   [--production] [--size-report]
+                                   [--memory [PATH]]
+"""
+import argparse
+import glob
+import os
+import sys
+
+from pipeline import MASTER_PATH, MasterIndex, Model, PhaseTimer, load_batch, load_master, load_model, write_master
+from pipeline.batch import BATCH_SCRIPTS
+from pipeline.cache import BuildCache, file_digest, group_patches
+from pipeline.emit import set_production
+from pipeline.fallback import coverage, write_coverage
+from pipeline.master import localized_cells
+from pipeline.memory import load_memory, memory_batches, stream_cells
+from pipeline.paths import COVERAGE_PATH, DATA_DIR, LOCALES, MEMORY_PATH, SEARCH_KEYWORDS_PATH, STAMPS_PATH
+from pipeline.records import LAYOUTS, RECORDS_DIR, write_emotion_records
+from pipeline.search import SEARCH_DIR, write_search_index
+from pipeline.shards import write_locale_shards, write_manifest
+from pipeline.stamps import refresh_stamps
+from pipeline.sizes import size_report
+from pipeline.stream import stream_apply
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def build_outputs():
+    """Every file a full build leaves behind (the writers prune what they no longer produce)."""
+    derived = [os.path.join(DATA_DIR, "wisdom-*.json"), os.path.join(DATA_DIR, RECORDS_DIR, "**", "*"),
+               os.path.join(DATA_DIR, SEARCH_DIR, "*.json")]
+    paths = [path for pattern in derived for path in glob.glob(pattern, recursive=True) if os.path.isfile(path)]
+    return [MASTER_PATH, STAMPS_PATH, *paths]
+
+
+def report_misses(memory, misses, limit=10):
+    """List master cells whose English text has no exact translation-memory entry."""
+    print(f"Translation memory: {len(memory)} sources, {len(misses)} cells without an exact entry")
+    for target, source in misses[:limit]:
+        kind, rid, key = target
+        where = f"{kind} {rid}" + ("" if key is None else f" [{key}]")
+        print(f"  {where}: {source[:60]!r}")
+        for score, match, _ in memory.fuzzy(source, limit=1):
+            print(f"    closest ({score:.2f}): {match[:60]!r}")
+    if len(misses) > limit:
+        print(f"  ... and {len(misses) - limit} more")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--dry-run", action="store_true", help="apply batches but do not write")
+    parser.add_argument("--force", action="store_true", help="rebuild even if sources are unchanged")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the build cache")
+    parser.add_argument("--records", choices=LAYOUTS, default="files",
+                        help="per-emotion record layout: one file each, or one packed blob per locale")
+    parser.add_argument("--stream", action="store_true",
+                        help="patch the master record by record in bounded memory (master only)")
+    parser.add_argument("--production", action="store_true",
+                        help="compact, key-sorted derived JSON plus a size report")
+    parser.add_argument("--size-report", action="store_true",
+                        help="print bytes by field, by locale and per artifact, raw vs gzip")
+    parser.add_argument("--memory", nargs="?", const=MEMORY_PATH, metavar="PATH",
+                        help=f"translate from the translation memory (default {os.path.relpath(MEMORY_PATH)})"
+                             " instead of the batch scripts")
+    args = parser.parse_args(argv)
+    set_production(args.production)
+    report = args.production or args.size_report
+
+    timer = PhaseTimer()
+    cache = None if args.no_cache else BuildCache()
+
+    with timer.phase("fingerprint sources"):
+        if args.memory:
+            sources = {"@memory": file_digest(args.memory)}
+        else:
+            sources = {name: file_digest(os.path.join(SCRIPTS_DIR, name)) for name in BATCH_SCRIPTS}
+        sources["@keywords"] = file_digest(SEARCH_KEYWORDS_PATH)
+        # Derived outputs differ by layout and mode even when the inputs don't
+        mode = "stream" if args.stream else "production" if args.production else "development"
+        sources["@outputs"] = f"{args.records}/{mode}"
+        fresh = cache is not None and not args.force and cache.is_fresh(sources)
+
+    if fresh:
+        print(f"Up to date: no {'memory' if args.memory else 'batch script'} or output change since the last build.")
+        print(timer.report())
+        if report:
+            print("\n" + size_report(load_master()))
+        return 0
+
+    with timer.phase("collect batches"):
+        if args.memory:
+            memory = load_memory(args.memory)
+            cells = stream_cells(MASTER_PATH) if args.stream else localized_cells(load_model())
+            batches, misses = memory_batches(memory, cells)
+        else:
+            batches = [load_batch(os.path.join(SCRIPTS_DIR, name)) for name in BATCH_SCRIPTS]
+    if args.memory:
+        report_misses(memory, misses)
+
+    if args.stream:
+        with timer.phase("stream master"):
+            count = stream_apply(group_patches(batches), dst=None if args.dry_run else MASTER_PATH)
+        print(f"Streamed {count} emotions" + ("" if args.dry_run else f" into {os.path.relpath(MASTER_PATH)}"))
+        if cache is not None and not args.dry_run:
+            cache.save(sources, [MASTER_PATH])
+        print(timer.report())
+        return 0
+
+    with timer.phase("load master"):
+        data = load_master()
+        index = MasterIndex(data)
+
+    with timer.phase("apply patches"):
+        for batch in batches:
+            count = batch.apply(index)
+            print(f"{batch.name}: {count} patches")
+
+    if not args.dry_run:
+        with timer.phase("write master"):
+            write_master(data)
+        print(f"Wrote {os.path.relpath(MASTER_PATH)}")
+        with timer.phase("build model"):
+            model = Model.from_document(data)
+        with timer.phase("source stamps"):
+            stale, written = refresh_stamps(model)
+        print(f"Source stamps: {len(stale)} stale translations"
+              f" ({'written' if written else 'unchanged'} {os.path.relpath(STAMPS_PATH)})")
+        with timer.phase("locale coverage"):
+            coverage_report = coverage(((name, cell) for name, _, cell in localized_cells(model)), LOCALES)
+            written = write_coverage("master", coverage_report)
+        fell_back = sum(len(entry["cells"]) for entry in coverage_report.values())
+        print(f"Locale coverage: {fell_back} cells resolved by fallback"
+              f" ({'written' if written else 'unchanged'} {os.path.relpath(COVERAGE_PATH)})")
+        with timer.phase("emit locale shards"):
+            shards, written = write_locale_shards(model)
+        print(f"Locale shards: {len(shards)} locales, {written} files updated")
+        with timer.phase("emit emotion records"):
+            records, written = write_emotion_records(model, layout=args.records)
+        print(f"Emotion records ({args.records}): {written} files updated")
+        with timer.phase("emit search index"):
+            search, written = write_search_index(model)
+            written += write_manifest(model, shards, records, search)
+        print(f"Search index: {written} files updated")
+        if cache is not None:
+            cache.save(sources, build_outputs())
+
+    print(timer.report())
+    if report:
+        print("\n" + size_report(data))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Write byte-reproducible precompressed sidecars for public/data.
+
+Run after build-wisdom.py / build-constellation.py. Each .json and .pack
+file gets a max-level .gz (plus .br if the `brotli` package is installed)
+that a static host can serve as-is. Unchanged files are skipped by
+content hash.
+
+The sidecars are git-ignored, so the deploy workflow runs this on the
+built site (--root dist/data, after `npm run build`). They only pay off on
+a host that serves a precompressed file in place of the original when the
+request's Accept-Encoding allows it: nginx `gzip_static on;` (and
+`brotli_static on;` with ngx_brotli), Caddy `file_server { precompressed
+br gzip }`, or any host with the equivalent setting. GitHub Pages gzips
+responses itself and does not substitute them.
+
+Usage:
+    python scripts/compress-data.py [--root DIR] [--force] [--summary]
+"""
+import argparse
+import os
+import sys
+
+from pipeline import PhaseTimer
+from pipeline.compress import compress_tree
+from pipeline.paths import DATA_DIR
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--root", default=DATA_DIR,
+                        help="data directory to compress (default: public/data; dist/data for a built site)")
+    parser.add_argument("--force", action="store_true", help="recompress every file")
+    parser.add_argument("--summary", action="store_true", help="print totals only, not one line per file")
+    args = parser.parse_args(argv)
+
+    timer = PhaseTimer()
+    with timer.phase("compress"):
+        rows, removed = compress_tree(root=os.path.abspath(args.root), force=args.force)
+
+    suffixes = sorted({s for _, _, sizes, _ in rows for s in sizes})
+    totals = {s: 0 for s in suffixes}
+    raw_total = 0
+    if not args.summary:
+        print(f"  {'file':<44} {'raw B':>9}" + "".join(f" {s + ' B':>9} {'ratio':>6}" for s in suffixes))
+    for rel, raw, sizes, recompressed in rows:
+        raw_total += raw
+        for s in suffixes:
+            totals[s] += sizes.get(s, 0)
+        if not args.summary:
+            cols = "".join(f" {sizes[s]:>9,} {raw / sizes[s]:>5.1f}x" for s in suffixes)
+            print(f"  {rel:<44} {raw:>9,}{cols}  {'compressed' if recompressed else 'cached'}")
+
+    done = sum(1 for row in rows if row[3])
+    cols = "".join(f", {s} {totals[s]:,} B ({raw_total / totals[s]:.1f}x)" for s in suffixes if totals[s])
+    print(f"{len(rows)} files, {done} compressed, {len(rows) - done} unchanged, {removed} orphan sidecars removed")
+    print(f"raw {raw_total:,} B{cols}")
+    print(timer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Export the master to a normalized SQLite database for backend lookups.
+
+Writes needs, emotions, links and every localized string to one file with
+indexes for point lookups and an FTS5 table over the emotion labels and
+wisdom text (schema in pipeline/sqlite_export.py). The output is a build
+artifact, git-ignored under build/ by default; ship it next to the chat
+backend or any analytics job that would otherwise parse the JSON.
+
+--check opens the result and times a few typical queries against loading
+the JSON master.
+
+Usage:
+    python scripts/export-sqlite.py [--out PATH] [--check]
+"""
+import argparse
+import contextlib
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from pipeline import MASTER_PATH, PhaseTimer, load_model
+from pipeline.paths import ROOT
+from pipeline.sqlite_export import emotion_context, export_sqlite, search
+
+DEFAULT_OUT = os.path.join(ROOT, "build", "emotion-constellations.sqlite")
+CHECK_REPEAT = 200
+
+
+def _per_call(fn, repeat=CHECK_REPEAT):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def _load_json():
+    with open(MASTER_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check(path, model):
+    """Print per-call timings of typical queries next to a cold JSON load."""
+    json_sec, _ = _per_call(_load_json, repeat=5)
+    open_sec, _ = _per_call(lambda: sqlite3.connect(path).close())
+    emotion = model.emotions[0].id
+    # sqlite3's own context manager only commits; closing() releases the connection
+    with contextlib.closing(sqlite3.connect(path)) as db:
+        context_sec, context = _per_call(lambda: emotion_context(db, emotion, "ja"))
+        search_sec, hits = _per_call(lambda: search(db, "trapped and powerless", "en"))
+    if context is None or not context["inquiries"]:
+        raise SystemExit(f"{path}: no context for {emotion!r}")
+    print(f"  json.load master          {json_sec * 1e3:9.2f} ms")
+    print(f"  sqlite3.connect           {open_sec * 1e6:9.1f} µs")
+    print(f"  emotion_context({emotion!r}, ja) {context_sec * 1e6:9.1f} µs")
+    print(f"  search('trapped and powerless') {search_sec * 1e6:9.1f} µs → {[e for e, _ in hits]}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"database path (default {os.path.relpath(DEFAULT_OUT)})")
+    parser.add_argument("--check", action="store_true", help="time sample queries against the JSON load")
+    args = parser.parse_args(argv)
+
+    timer = PhaseTimer()
+    with timer.phase("load master"):
+        model = load_model()
+    with timer.phase("export"):
+        strings = export_sqlite(model, args.out)
+
+    print(f"{os.path.relpath(args.out)}: {os.path.getsize(args.out):,} B, {len(model.emotions)} emotions,"
+          f" {len(model.needs)} needs, {strings} strings")
+    if args.check:
+        with timer.phase("check"):
+            check(args.out, model)
+    print(timer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
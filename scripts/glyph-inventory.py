@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Compute the codepoints each locale renders and write the font-subsetting manifest.
+
+Scans every string a locale ships — master cells with the English fallback
+resolved, src/core/ui-strings.js and the language menu's native names
+(pipeline/glyphs.py) — and writes scripts/glyph-manifest.json with one CSS
+unicode-range per locale plus their union. Feed a locale's range to the
+font subsetter, e.g.
+
+    pyftsubset Font.ttf --unicodes="$(jq -r .locales.ko.unicodeRange scripts/glyph-manifest.json)"
+
+and to the unicode-range of its @font-face. When content changes, the
+codepoints added to and removed from each locale since the stored manifest
+are printed (and written with --delta); a non-empty delta means that
+locale's subset must be rebuilt. --check only compares, and exits 1 on a
+delta.
+
+Per-string codepoint sets are cached under .cache/glyphs/, so a rescan
+only walks new or edited strings.
+
+Usage:
+    python scripts/glyph-inventory.py [--out PATH] [--delta PATH] [--check] [--no-cache]
+"""
+import argparse
+import json
+import os
+import sys
+
+from pipeline import LOCALES, PhaseTimer, load_model
+from pipeline.glyphs import (GlyphCache, coverage_delta, glyph_manifest, inventory, load_glyph_manifest,
+                             parse_ranges, write_glyph_manifest)
+from pipeline.paths import GLYPHS_PATH
+from pipeline.ui_strings import native_labels, read_ui_strings
+
+
+def _clip(ranges, width=60):
+    if not ranges:
+        return "-"
+    return ranges if len(ranges) <= width else ranges[:width].rsplit(",", 1)[0] + ",..."
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--out", default=GLYPHS_PATH, help=f"manifest path (default {os.path.relpath(GLYPHS_PATH)})")
+    parser.add_argument("--delta", metavar="PATH", help="also write the coverage delta as JSON")
+    parser.add_argument("--check", action="store_true", help="write nothing; exit 1 if coverage changed")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the per-string cache")
+    args = parser.parse_args(argv)
+
+    timer = PhaseTimer()
+    with timer.phase("load"):
+        model = load_model()
+        table = read_ui_strings()
+        labels = native_labels()
+        previous = load_glyph_manifest(args.out)
+        cache = GlyphCache(None) if args.no_cache else GlyphCache()
+
+    with timer.phase("scan"):
+        sets, counts = inventory(model, table, labels, LOCALES, cache)
+        delta = coverage_delta(previous, sets)
+
+    for locale in LOCALES:
+        print(f"  {locale}  {counts[locale]:5d} strings  {len(sets[locale]):5d} codepoints")
+    print(f"Per-string cache: {cache.hits} hits, {cache.misses} scanned")
+    for locale, change in delta.items():
+        added, removed = len(parse_ranges(change["added"])), len(parse_ranges(change["removed"]))
+        print(f"  {locale}: +{added} -{removed} codepoints  +{_clip(change['added'])}  -{_clip(change['removed'])}")
+    print(f"{len(delta)} locale(s) changed coverage" if delta else "Coverage unchanged")
+
+    if args.delta:
+        with open(args.delta, "w", encoding="utf-8") as f:
+            json.dump({"delta": delta}, f, ensure_ascii=False, indent=2)
+    if args.check:
+        print(timer.report())
+        return 1 if delta else 0
+
+    with timer.phase("write"):
+        written = write_glyph_manifest(glyph_manifest(sets, counts), args.out)
+        cache.save()
+    print(f"{os.path.relpath(args.out)}: {'written' if written else 'unchanged'}")
+    print(timer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Fill missing master translations through a machine-translation provider.
+
+Gathers every (English string, locale) pair the master lacks, answers what
+it can from the translation memory and the results cache, and sends the
+rest through the provider in batches with a concurrent, rate-limited,
+retrying worker pool (pipeline/mt.py).
+
+--provider is "mock" (deterministic and offline; see MockProvider) or
+module:Class for any class implementing pipeline.mt.Provider, importable
+from scripts/. --option KEY=VALUE is passed to its constructor.
+
+--stale also retranslates strings whose English changed since they were
+translated (source-hash stamps, see stale-translations.py).
+
+Nothing is written unless asked: --apply writes the results into the
+master and stamps the cells it wrote as translated from the current
+English (so a --stale retranslation that comes back unchanged still
+clears), --write-memory adds them to the translation memory. Both are
+refused with the mock provider, whose output is not a translation. Run
+build-wisdom.py afterwards to refresh the derived files. --retranslate
+treats every string as missing, which with the mock provider gives a
+full-size offline benchmark.
+
+Usage:
+    python scripts/machine-translate.py [--provider mock|module:Class] [--option KEY=VALUE]
+        [--locales es,fr] [--jobs 4] [--rate 10] [--retries 3] [--batch-size 50]
+        [--batch-chars 8000] [--stale] [--retranslate] [--no-cache] [--apply] [--write-memory]
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+
+from pipeline import MasterIndex, Model, PhaseTimer, TRANSLATED_LOCALES, load_master, write_master
+from pipeline.master import localized_cells
+from pipeline.memory import load_memory, write_memory
+from pipeline.mt import MockProvider, ResultCache, apply_results, gather_pairs, plan_batches, run_batches
+from pipeline.paths import MASTER_PATH, MEMORY_PATH, STAMPS_PATH
+from pipeline.stamps import cell_names, load_stamps, refresh_stamps, update_stamps
+
+PROVIDERS = {"mock": MockProvider}
+
+
+def make_provider(spec, options):
+    if spec in PROVIDERS:
+        cls = PROVIDERS[spec]
+    else:
+        module, sep, name = spec.partition(":")
+        if not sep:
+            raise ValueError(f"Unknown provider {spec!r}; use one of {sorted(PROVIDERS)} or module:Class")
+        cls = getattr(importlib.import_module(module), name)
+    kwargs = {}
+    for option in options:
+        key, sep, value = option.partition("=")
+        if not sep:
+            raise ValueError(f"Expected KEY=VALUE, got {option!r}")
+        kwargs[key] = value
+    return cls(**kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--provider", default="mock", help="mock, or module:Class (default mock)")
+    parser.add_argument("--option", action="append", default=[], metavar="KEY=VALUE",
+                        help="provider constructor argument (repeatable)")
+    parser.add_argument("--locales", default=",".join(TRANSLATED_LOCALES), help="comma-separated target locales")
+    parser.add_argument("--jobs", type=int, default=4, help="concurrent requests")
+    parser.add_argument("--rate", type=float, help="requests per second across all workers")
+    parser.add_argument("--retries", type=int, default=3, help="retries per batch after a transient failure")
+    parser.add_argument("--backoff", type=float, default=0.5, help="first retry delay in seconds (doubles)")
+    parser.add_argument("--batch-size", type=int, default=50, help="strings per request")
+    parser.add_argument("--batch-chars", type=int, default=8000, help="characters per request")
+    parser.add_argument("--memory", default=MEMORY_PATH, help="translation memory consulted first")
+    parser.add_argument("--stale", action="store_true", help="also retranslate stale strings")
+    parser.add_argument("--retranslate", action="store_true", help="translate every string, present or not")
+    parser.add_argument("--no-cache", action="store_true", help="neither read nor write the results cache")
+    parser.add_argument("--apply", action="store_true", help="write the results into the master")
+    parser.add_argument("--write-memory", action="store_true", help="add the results to the translation memory")
+    args = parser.parse_args(argv)
+
+    try:
+        provider = make_provider(args.provider, args.option)
+    except (ValueError, ImportError, AttributeError, TypeError) as err:
+        parser.error(str(err))
+    if provider.name == MockProvider.name and (args.apply or args.write_memory):
+        parser.error("the mock provider returns pseudo-translations; --apply and --write-memory need a real --provider")
+    locales = [loc for loc in args.locales.split(",") if loc]
+
+    timer = PhaseTimer()
+    with timer.phase("load"):
+        data = load_master()
+        index = MasterIndex(data)
+        model = Model.from_document(data)
+        memory = load_memory(args.memory)
+        cache = None if args.no_cache else ResultCache(provider.name)
+
+    with timer.phase("gather"):
+        redo = set()
+        if args.stale:
+            _, stale = update_stamps(model, load_stamps())
+            redo = {(target, locale) for _, target, locale in stale}
+        pending, needs, known = gather_pairs(localized_cells(model), locales, memory, cache, args.retranslate, redo)
+        batches = plan_batches(pending, min(args.batch_size, provider.max_items),
+                               min(args.batch_chars, provider.max_chars))
+    print(f"{len(needs)} missing (locale, string) pairs: {len(known)} from memory/cache,"
+          f" {len(pending)} to translate in {len(batches)} batches")
+
+    results, stats = {}, None
+    if batches:
+        with timer.phase("translate"):
+            results, stats = asyncio.run(run_batches(
+                provider, batches, jobs=args.jobs, rate=args.rate, retries=args.retries, backoff=args.backoff,
+            ))
+        print(f"{provider.name}: {stats['requests']} requests by {stats['workers']} workers,"
+              f" {stats['retries']} retries, {stats['translated']} translated, {stats['failed']} failed")
+        for error in stats["errors"][:10]:
+            print(f"  error: {error}")
+        if cache is not None:
+            with timer.phase("save cache"):
+                for (locale, source), text in results.items():
+                    cache.put(locale, source, text)
+                cache.save()
+
+    results = {**known, **results}
+    if args.apply:
+        with timer.phase("apply"):
+            written = apply_results(index, needs, results)
+            write_master(data)
+            model = Model.from_document(data)
+            names = cell_names(model)
+            _, stamped = refresh_stamps(model, accept={(names[target], locale) for target, locale in written})
+        print(f"Wrote {len(written)} cells into {os.path.relpath(MASTER_PATH)}"
+              f" ({os.path.relpath(STAMPS_PATH)} {'written' if stamped else 'unchanged'})")
+    if args.write_memory:
+        with timer.phase("write memory"):
+            for (locale, source), text in results.items():
+                memory.add(source, locale, text)
+            written = write_memory(memory, args.memory)
+        print(f"{os.path.relpath(args.memory)}: {len(memory)} sources ({'written' if written else 'unchanged'})")
+
+    print(timer.report())
+    return 1 if stats and stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+"""
+Shared helpers for the wisdom data build.
+
+The master document (public/data/emotion-constellation-more-info-data.json)
+is loaded once, indexed by id, patched in memory by every translation batch
+and written once. Entry points live next to this package in scripts/.
+"""
+from pipeline.paths import DATA_DIR, MASTER_PATH, LOCALES, TRANSLATED_LOCALES
+from pipeline.master import MasterIndex, load_master, write_master
+from pipeline.batch import TranslationBatch, load_batch
+from pipeline.model import Model, load_model
+from pipeline.timing import PhaseTimer
+
+__all__ = [
+    "DATA_DIR", "MASTER_PATH", "LOCALES", "TRANSLATED_LOCALES",
+    "MasterIndex", "load_master", "write_master",
+    "TranslationBatch", "load_batch",
+    "Model", "load_model",
+    "PhaseTimer",
+]
@@ -0,0 +1,25 @@
+"""
+Selection lookups precomputed from the emotion → need links.
+
+Selecting an emotion or need used to scan every emotion's links (fellow
+messengers, linked emotions, need → emotions). The build resolves those
+once and ships them as index arrays into the file's emotions list, so the
+client's selection path is a lookup whatever the emotion count:
+
+  needEmotions    need id → indexes of the emotions linking to it
+  related         emotion id → indexes of the emotions with the most
+                  similar need profile, best first (similarity.py; added
+                  by build-constellation.py)
+
+The needEmotions lists are ascending, i.e. in the emotions' file order. An
+emotion's fellow messengers on a need are that need's list minus itself,
+which the client filters on selection rather than shipping per emotion.
+"""
+
+
+def adjacency_index(model):
+    need_emotions = {need.id: [] for need in model.needs}
+    for i, emotion in enumerate(model.emotions):
+        for need_id in dict.fromkeys(link.need_id for link in emotion.links):
+            need_emotions.setdefault(need_id, []).append(i)
+    return {"needEmotions": need_emotions}
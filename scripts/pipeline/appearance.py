@@ -0,0 +1,52 @@
+"""
+Per-emotion display values that depend only on the data.
+
+createSimulation() used to derive these for every emotion on each load and
+locale switch. The build now computes them once for all emotions as matrix
+products over the [emotions × needs] link-strength matrix:
+
+  displayColor  strength-weighted blend of linked needs' colorSecondary
+                (else color) — computeEmotionColor()
+  displaySize   BRIDGE_SIZE for emotions with more than one link, else
+                SINGLE_SIZE
+  centroid      strength-weighted centroid of the linked needs on the unit
+                need ring — weightedCentroid(), normalized like the layout
+                presets so the client scales it to any viewport
+
+Centroids follow LAYOUT in src/core/constants.js; rebuild the constellation
+files after changing the ring.
+"""
+import numpy as np
+
+from pipeline.layout import link_matrix, read_js_constants, ring_unit
+
+BRIDGE_SIZE = 32
+SINGLE_SIZE = 24
+UNLINKED_COLOR = (0.7, 0.7, 0.7)
+
+
+def emotion_appearance(model, colors, layout=None, digits=4):
+    """{emotion id: {"displayColor", "displaySize", "centroid"}} in model order.
+
+    colors is need_colors()'s {need id: {"color", "colorSecondary"}} map.
+    """
+    layout = layout or read_js_constants("LAYOUT")
+    links = link_matrix(model)
+    weight = links.sum(axis=1, keepdims=True)
+    linked = weight[:, 0] > 0
+    safe = np.where(weight > 0, weight, 1.0)
+
+    palette = np.array([colors[n.id].get("colorSecondary") or colors[n.id]["color"] for n in model.needs])
+    blend = np.where(linked[:, None], links @ palette / safe, UNLINKED_COLOR)
+
+    ux, uy = ring_unit(len(model.needs), layout)
+    centroid = np.where(linked[:, None], np.stack([links @ ux, links @ uy], axis=1) / safe, 0.0)
+
+    return {
+        emotion.id: {
+            "displayColor": [round(float(c), digits) for c in blend[i]],
+            "displaySize": BRIDGE_SIZE if len(emotion.links) > 1 else SINGLE_SIZE,
+            "centroid": [round(float(c), digits) for c in centroid[i]],
+        }
+        for i, emotion in enumerate(model.emotions)
+    }
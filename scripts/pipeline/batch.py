@@ -0,0 +1,86 @@
+"""
+Translation batches.
+
+Each translate-*.py / tpN.py script builds one TranslationBatch with the
+same at()/ai() calls it always had. Nothing is read or written while the
+script body runs; the calls only queue patches. build-wisdom.py then
+applies every batch to one in-memory master document, while running a
+script directly still patches the file on its own.
+"""
+import os
+import runpy
+
+from pipeline.master import MasterIndex, load_master, write_master
+from pipeline.paths import TRANSLATED_LOCALES
+
+# The batch scripts under scripts/, in application order: later batches win
+# on overlapping cells.
+BATCH_SCRIPTS = [
+    "translate-wisdom.py",
+    "translate-part2.py",
+    "tp3.py",
+    "tp4.py",
+    "tp5.py",
+    "tp6.py",
+    "tp7.py",
+]
+
+
+class TranslationBatch:
+    def __init__(self, name, summary="", locales=TRANSLATED_LOCALES):
+        self.name = name
+        self.summary = summary
+        self.locales = list(locales)
+        self.patches = []
+
+    # ─── Patch recorders (signatures match the old script helpers) ───
+
+    def at(self, eid, fld, t):
+        """readMore[fld] translations for one emotion."""
+        self._add(("readMore", eid, fld), t)
+
+    def ai(self, eid, idx, t):
+        """needs[idx].inquiry translations for one emotion."""
+        self._add(("inquiry", eid, idx), t)
+
+    def label(self, eid, t):
+        self._add(("label", eid, None), t)
+
+    def need_label(self, nid, t):
+        self._add(("needLabel", nid, None), t)
+
+    def need_description(self, nid, t):
+        self._add(("needDescription", nid, None), t)
+
+    def _add(self, target, t):
+        if len(t) != len(self.locales):
+            raise ValueError(
+                f"{self.name}: {target} has {len(t)} strings, expected {len(self.locales)}")
+        self.patches.append((target, t))
+
+    # ─── Application ───
+
+    def apply(self, index):
+        """Write every queued patch into a MasterIndex. Returns the patch count."""
+        for target, t in self.patches:
+            try:
+                index.assign(target, self.locales, t)
+            except (KeyError, IndexError):
+                raise KeyError(f"{self.name}: no such target {target}") from None
+        return len(self.patches)
+
+    def run(self):
+        """Standalone mode: load the master file, apply this batch, save."""
+        data = load_master()
+        self.apply(MasterIndex(data))
+        write_master(data)
+        print(f"{self.name} done: {self.summary}" if self.summary else f"{self.name} done.")
+
+
+def load_batch(path):
+    """Execute a batch script without its __main__ block and return its BATCH."""
+    ns = runpy.run_path(path, run_name="pipeline_batch")
+    batch = ns.get("BATCH")
+    if not isinstance(batch, TranslationBatch):
+        raise TypeError(f"{os.path.basename(path)} does not define a TranslationBatch named BATCH")
+    return batch
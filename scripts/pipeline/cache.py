@@ -0,0 +1,78 @@
+"""
+Content-hash build cache for the wisdom pipeline.
+
+The manifest holds the sha256 of every source (batch scripts or the
+translation memory, search keywords, build mode) and of every file the
+last build wrote: the master and each derived output. When no source
+changed and every output is still on disk with the content written, the
+build is a no-op and the batch scripts are not even executed; a deleted
+or hand-edited shard, record or search index makes the next run rebuild.
+
+There is no finer level: applying every patch to the loaded master takes
+under a millisecond, less than hashing and reading back a cached copy of
+each record did.
+"""
+import hashlib
+import json
+import os
+
+from pipeline.master import unit_of
+from pipeline.paths import ROOT
+
+CACHE_DIR = os.path.join(ROOT, ".cache", "wisdom-build")
+
+# Bump when patch semantics or the manifest layout change.
+CACHE_VERSION = 2
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def group_patches(batches):
+    """{unit: [(locales, target, texts), ...]} in application order, for pipeline/stream.py."""
+    units = {}
+    for batch in batches:
+        for target, texts in batch.patches:
+            units.setdefault(unit_of(target), []).append((batch.locales, target, list(texts)))
+    return units
+
+
+class BuildCache:
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self.manifest = self._read_manifest()
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return manifest if manifest.get("version") == CACHE_VERSION else {}
+
+    def is_fresh(self, sources):
+        """True when the sources are unchanged and every output of the last build is as it wrote it."""
+        if not self.manifest or self.manifest.get("sources") != sources:
+            return False
+        for name, digest in self.manifest.get("outputs", {}).items():
+            path = os.path.join(ROOT, name)
+            if not os.path.isfile(path) or file_digest(path) != digest:
+                return False
+        return bool(self.manifest.get("outputs"))
+
+    def save(self, sources, outputs):
+        """Record the sources and the digest of every output path."""
+        os.makedirs(self.directory, exist_ok=True)
+        self.manifest = {
+            "version": CACHE_VERSION,
+            "sources": sources,
+            "outputs": {os.path.relpath(path, ROOT): file_digest(path) for path in sorted(outputs)},
+        }
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2)
@@ -0,0 +1,118 @@
+"""
+Precompressed sidecars for the shipped data files.
+
+Every .json / .pack under public/data gets a .gz next to it (and a .br
+when the optional `brotli` package is installed), at maximum level with
+header fields pinned — gzip mtime 0, no file name — so the same input
+always yields the same bytes. A content-hash ledger in the build cache
+skips files whose source has not changed since their sidecars were made;
+it is keyed by path from the repo root, so public/data and a built
+dist/data keep separate entries.
+"""
+import gzip
+import hashlib
+import json
+import os
+
+from pipeline.paths import DATA_DIR, ROOT
+
+try:
+    import brotli
+except ImportError:  # optional: gzip alone is enough for every browser
+    brotli = None
+
+SOURCE_EXTS = (".json", ".pack")
+LEDGER_PATH = os.path.join(ROOT, ".cache", "compress.json")
+
+# Bump to force recompression when settings change.
+LEDGER_VERSION = 2
+
+
+def gzip_bytes(blob):
+    # gzip.compress writes no file name; mtime=0 pins the only varying field
+    return gzip.compress(blob, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(blob):
+    return brotli.compress(blob, quality=11)
+
+
+def encoders():
+    """[(suffix, function)] available in this environment."""
+    found = [(".gz", gzip_bytes)]
+    if brotli is not None:
+        found.append((".br", brotli_bytes))
+    return found
+
+
+def source_files(root=DATA_DIR):
+    for dirpath, _, names in os.walk(root):
+        for name in sorted(names):
+            if name.endswith(SOURCE_EXTS):
+                yield os.path.join(dirpath, name)
+
+
+def _read_ledger():
+    try:
+        with open(LEDGER_PATH, "r", encoding="utf-8") as f:
+            ledger = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return ledger.get("files", {}) if ledger.get("version") == LEDGER_VERSION else {}
+
+
+def _write_ledger(files):
+    os.makedirs(os.path.dirname(LEDGER_PATH), exist_ok=True)
+    with open(LEDGER_PATH, "w", encoding="utf-8") as f:
+        json.dump({"version": LEDGER_VERSION, "files": files}, f, indent=2, sort_keys=True)
+
+
+def _prune_orphans(root, suffixes):
+    removed = 0
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            for suffix in suffixes:
+                if name.endswith(suffix) and not os.path.exists(os.path.join(dirpath, name[:-len(suffix)])):
+                    os.remove(os.path.join(dirpath, name))
+                    removed += 1
+    return removed
+
+
+def compress_tree(root=DATA_DIR, force=False):
+    """Write sidecars for every source file under root.
+
+    Returns (rows, removed) where each row is
+    (relative path, raw bytes, {suffix: compressed bytes}, recompressed?).
+    """
+    known = _read_ledger()
+    ledger = {} if force else known
+    codecs = encoders()
+    suffixes = [suffix for suffix, _ in codecs]
+    fresh, rows = {}, []
+
+    for path in source_files(root):
+        rel = os.path.relpath(path, root)
+        key = os.path.relpath(path, ROOT)
+        with open(path, "rb") as f:
+            blob = f.read()
+        digest = hashlib.sha256(blob).hexdigest()
+        previous = ledger.get(key)
+        reuse = (previous and previous["sha256"] == digest
+                 and all(os.path.exists(path + s) for s in suffixes)
+                 and set(previous["sizes"]) == set(suffixes))
+        if reuse:
+            sizes = previous["sizes"]
+        else:
+            sizes = {}
+            for suffix, encode in codecs:
+                packed = encode(blob)
+                with open(path + suffix, "wb") as f:
+                    f.write(packed)
+                sizes[suffix] = len(packed)
+        fresh[key] = {"sha256": digest, "sizes": sizes}
+        rows.append((rel, len(blob), sizes, not reuse))
+
+    prefix = os.path.relpath(root, ROOT) + os.sep
+    _write_ledger({**{k: v for k, v in known.items() if not k.startswith(prefix)}, **fresh})
+    # Sidecars of every known codec, so dropping brotli also drops stale .br files
+    return rows, _prune_orphans(root, (".gz", ".br"))
@@ -0,0 +1,109 @@
+"""
+Derive constellation-{locale}.json and constellation-graph.json from the master document.
+
+The constellation files the canvas loads (src/core/data-loader.js) are a
+per-locale projection of the master (read through pipeline.model): need
+labels, descriptions and colors, emotion labels and links with their
+inquiry and strength. Colors are stored in the master as hex strings and
+shipped as the [r, g, b] floats in 0–1 the shaders take directly.
+
+What does not depend on the locale is written once, to
+constellation-graph.json, which the loader fetches a single time and
+merges into every locale: each emotion's build-time display color, size
+and centroid (appearance.py), the selection lookups (adjacency.py) and,
+when layout-presets.json exists (build-layout.py), its settled positions
+as "layouts". Its meta.version matches the locale files built with it.
+"""
+import json
+import os
+
+from pipeline.emit import dumps, write_if_changed
+from pipeline.paths import DATA_DIR
+
+COLOR_KEYS = ("color", "colorSecondary")
+GRAPH_NAME = "constellation-graph.json"
+# Written by build-layout.py; optional
+LAYOUT_PRESETS_PATH = os.path.join(DATA_DIR, "layout-presets.json")
+
+
+def hex_to_rgb(value):
+    """'#14337a' → [0.08, 0.2, 0.48] (two decimals, like the hand-written files)."""
+    value = value.lstrip("#")
+    if len(value) != 6:
+        raise ValueError(f"Expected #rrggbb, got {value!r}")
+    return [round(int(value[i:i + 2], 16) / 255, 2) for i in (0, 2, 4)]
+
+
+def need_colors(model):
+    """{need id: {"color": [r, g, b], "colorSecondary": [r, g, b]}}, converted once per build."""
+    colors = {}
+    for need in model.needs:
+        pair = (("color", need.color), ("colorSecondary", need.color_secondary))
+        colors[need.id] = {key: hex_to_rgb(value) for key, value in pair if value is not None}
+    return colors
+
+
+def load_layout_presets(path=LAYOUT_PRESETS_PATH):
+    """Settled positions from build-layout.py, or None if it has not been run."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def constellation_for_locale(model, locale, colors):
+    needs = []
+    for need in model.needs:
+        needs.append({
+            "id": need.id,
+            "label": need.label.resolve(locale, need.id),
+            "description": need.description.resolve(locale),
+            **colors[need.id],
+        })
+
+    emotions = []
+    for emotion in model.emotions:
+        emotions.append({
+            "id": emotion.id,
+            "label": emotion.label.resolve(locale, emotion.id),
+            "links": [
+                {"needId": link.need_id, "inquiry": link.inquiry.resolve(locale), "strength": link.strength}
+                for link in emotion.links
+            ],
+        })
+
+    return {
+        "meta": {"version": model.version, "locale": locale, "source": model.source},
+        "needs": needs,
+        "emotions": emotions,
+    }
+
+
+def constellation_graph(model, appearance, adjacency, layouts=None):
+    """The locale-independent half: {"meta", "emotions": {id: appearance}, "adjacency"[, "layouts"]}."""
+    doc = {
+        "meta": {"version": model.version, "source": model.source},
+        "emotions": appearance,
+        "adjacency": adjacency,
+    }
+    if layouts is not None:
+        doc["layouts"] = layouts
+    return doc
+
+
+def constellation_name(locale):
+    return f"constellation-{locale}.json"
+
+
+def write_constellation(model, locale, colors, out_dir=DATA_DIR):
+    """Build and write one locale's file. Returns (locale, bytes, written)."""
+    blob = dumps(constellation_for_locale(model, locale, colors))
+    written = write_if_changed(os.path.join(out_dir, constellation_name(locale)), blob)
+    return locale, len(blob), written
+
+
+def write_constellation_graph(model, appearance, adjacency, layouts=None, out_dir=DATA_DIR):
+    """Write constellation-graph.json. Returns (bytes, written)."""
+    blob = dumps(constellation_graph(model, appearance, adjacency, layouts))
+    return len(blob), write_if_changed(os.path.join(out_dir, GRAPH_NAME), blob)
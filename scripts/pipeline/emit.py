@@ -0,0 +1,43 @@
+"""Serialization helpers shared by every artifact the build writes."""
+import hashlib
+import json
+import os
+
+
+# Development output mirrors the master file (indent=2, insertion order) so
+# diffs stay readable; production output is compact with sorted keys.
+_production = False
+
+
+def set_production(enabled=True):
+    global _production
+    _production = bool(enabled)
+
+
+def is_production():
+    return _production
+
+
+def dumps(obj):
+    """Serialize a derived artifact in the current output mode."""
+    if _production:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def short_hash(blob):
+    return hashlib.sha256(blob).hexdigest()[:16]
+
+
+def write_if_changed(path, blob):
+    """Write bytes unless the file already holds exactly them. Returns True if written."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == blob:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(blob)
+    return True
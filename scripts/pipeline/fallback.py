@@ -0,0 +1,87 @@
+"""
+Locale fallback chains, resolved at build time.
+
+Every derived artifact (constellation files, wisdom shards and records,
+search indexes, UI string chunks) is written fully populated for its
+locale: a cell the locale lacks takes the first locale in its chain that
+has it, so the browser reads plain properties and never falls back itself.
+
+A chain is the locale, then its BCP 47 parents by dropping subtags, then
+English:
+
+    fallback_chain("pt-BR")       ("pt-BR", "pt", "en")
+    fallback_chain("zh-Hant-TW")  ("zh-Hant-TW", "zh-Hant", "zh", "en")
+
+FALLBACKS inserts extra steps where the parent is not the best match
+(e.g. "pt-AO": ["pt-PT"] tries European Portuguese before "pt").
+coverage() records which cells fell back, and to which locale, for the
+report in scripts/locale-coverage.json (build-wisdom.py writes its
+"master" section, build-ui-strings.py its "ui" section).
+"""
+import functools
+import json
+
+from pipeline.emit import write_if_changed
+from pipeline.paths import COVERAGE_PATH
+
+FALLBACK_LOCALE = "en"
+FORMAT = "locale-coverage/1"
+
+# Explicit steps between a locale and its subtag parents
+FALLBACKS = {}
+
+
+@functools.lru_cache(maxsize=None)
+def fallback_chain(locale):
+    """(locale, ...its fallbacks..., "en"), each locale once."""
+    chain = [locale, *FALLBACKS.get(locale, ())]
+    parts = locale.split("-")
+    chain += ["-".join(parts[:n]) for n in range(len(parts) - 1, 0, -1)]
+    chain.append(FALLBACK_LOCALE)
+    return tuple(dict.fromkeys(chain))
+
+
+def resolve_cell(cell, locale, default=""):
+    """(text, locale it came from) along the chain; (default, None) when no locale has it."""
+    if cell:
+        for candidate in fallback_chain(locale):
+            text = cell.get(candidate)
+            if text:
+                return text, candidate
+    return default, None
+
+
+def coverage(named_cells, locales):
+    """Per locale: how many cells it has itself, how many fell back (by source locale) and which.
+
+    named_cells yields (name, cell); empty English cells count as missing.
+    """
+    report = {loc: {"own": 0, "fallback": {}, "missing": 0, "cells": {}} for loc in locales}
+    for name, cell in named_cells:
+        for locale in locales:
+            _, source = resolve_cell(cell, locale)
+            entry = report[locale]
+            if source == locale:
+                entry["own"] += 1
+            elif source is None:
+                entry["missing"] += 1
+                entry["cells"][name] = None
+            else:
+                entry["fallback"][source] = entry["fallback"].get(source, 0) + 1
+                entry["cells"][name] = source
+    return report
+
+
+def write_coverage(section, report, path=COVERAGE_PATH):
+    """Replace one section ("master", "ui") of the coverage report. Returns True if the file changed."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            document = json.load(f)
+    except (OSError, ValueError):
+        document = {}
+    if document.get("format") != FORMAT:
+        document = {"format": FORMAT, "chains": {}}
+    document["chains"].update({locale: list(fallback_chain(locale)) for locale in report})
+    document[section] = report
+    blob = json.dumps(document, ensure_ascii=False, indent=2).encode("utf-8") + b"\n"
+    return write_if_changed(path, blob)
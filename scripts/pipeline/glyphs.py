@@ -0,0 +1,177 @@
+"""
+Per-locale glyph inventory for font subsetting.
+
+A locale renders a finite set of strings: the master's localized cells and
+the ui-strings table, both resolved along the locale's fallback chain as
+its shipped files are, and the native language names of the language
+menu, which every locale shows. The union of their codepoints, plus
+printable ASCII for digits, punctuation and typed input, is all a subset
+font for that locale has to cover. Chat replies are generated text
+and are not covered; keep the full font later in the font-family stack.
+
+Codepoint sets are cached per string under .cache/glyphs/, keyed by the
+string's hash, so a rescan only walks strings that are new or changed.
+
+Ranges are written in CSS unicode-range syntax ("U+20-7E,U+A9,U+AC00"),
+which pyftsubset --unicodes and fonttools also accept.
+"""
+import json
+import os
+
+from pipeline.emit import dumps, short_hash, write_if_changed
+from pipeline.master import localized_cells
+from pipeline.paths import GLYPHS_PATH, LOCALES, ROOT
+from pipeline.ui_strings import resolved_ui_strings
+
+GLYPH_CACHE_PATH = os.path.join(ROOT, ".cache", "glyphs", "strings.json")
+FORMAT = "glyph-manifest/1"
+
+# Bump when what counts as a codepoint of a string changes.
+GLYPH_CACHE_VERSION = 1
+
+BASE_CODEPOINTS = frozenset(range(0x20, 0x7F))
+
+
+def renders(cp):
+    """False for control characters, which need no glyph."""
+    return cp >= 0x20 and not 0x7F <= cp <= 0x9F
+
+
+def master_strings(model, locale):
+    """Every master string the locale displays, fallbacks resolved."""
+    return (text.resolve(locale) for _, _, text in localized_cells(model))
+
+
+def ui_strings(table, locale):
+    """The locale's UI strings, gaps filled along its fallback chain (as its chunk ships)."""
+    return resolved_ui_strings(table, locale).values()
+
+
+def locale_strings(model, table, labels, locale):
+    yield from master_strings(model, locale)
+    yield from ui_strings(table, locale)
+    for code, label in labels.items():
+        yield label
+        yield code.upper()
+
+
+class GlyphCache:
+    """Per-string codepoint sets: {short hash of the string: its distinct characters, sorted}."""
+
+    def __init__(self, path=GLYPH_CACHE_PATH):
+        self.path = path
+        self.entries = {}
+        self.used = {}
+        self.hits = self.misses = 0
+        if path is None:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return
+        if document.get("version") == GLYPH_CACHE_VERSION:
+            self.entries = document["strings"]
+
+    def chars(self, text):
+        key = short_hash(text.encode("utf-8"))
+        chars = self.used.get(key)
+        if chars is not None:
+            return chars
+        chars = self.entries.get(key)
+        if chars is None:
+            chars = "".join(sorted(set(text)))
+            self.misses += 1
+        else:
+            self.hits += 1
+        self.used[key] = chars
+        return chars
+
+    def save(self):
+        """Write the entries this run used; strings no longer shipped drop out."""
+        if self.path is None:
+            return False
+        blob = json.dumps({"version": GLYPH_CACHE_VERSION, "strings": self.used},
+                          ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+        return write_if_changed(self.path, blob)
+
+
+def inventory(model, table, labels, locales=LOCALES, cache=None):
+    """({locale: set of codepoints}, {locale: strings scanned})."""
+    cache = cache if cache is not None else GlyphCache(None)
+    sets, counts = {}, {}
+    for locale in locales:
+        codepoints, count = set(BASE_CODEPOINTS), 0
+        for text in locale_strings(model, table, labels, locale):
+            if text:
+                codepoints.update(ord(ch) for ch in cache.chars(text))
+                count += 1
+        sets[locale] = {cp for cp in codepoints if renders(cp)}
+        counts[locale] = count
+    return sets, counts
+
+
+def unicode_ranges(codepoints):
+    """Sorted codepoints as "U+20-7E,U+A9,..." with consecutive runs merged."""
+    ranges, start, prev = [], None, None
+    for cp in sorted(codepoints):
+        if prev is not None and cp == prev + 1:
+            prev = cp
+            continue
+        if start is not None:
+            ranges.append((start, prev))
+        start = prev = cp
+    if start is not None:
+        ranges.append((start, prev))
+    return ",".join(f"U+{a:X}" if a == b else f"U+{a:X}-{b:X}" for a, b in ranges)
+
+
+def parse_ranges(text):
+    """The codepoints of a unicode_ranges() string."""
+    codepoints = set()
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        first, _, last = part[2:].partition("-")
+        codepoints.update(range(int(first, 16), int(last or first, 16) + 1))
+    return codepoints
+
+
+def glyph_manifest(sets, counts):
+    everything = set().union(*sets.values()) if sets else set()
+    return {
+        "format": FORMAT,
+        "locales": {
+            locale: {
+                "strings": counts[locale],
+                "codepoints": len(codepoints),
+                "unicodeRange": unicode_ranges(codepoints),
+            }
+            for locale, codepoints in sets.items()
+        },
+        "all": {"codepoints": len(everything), "unicodeRange": unicode_ranges(everything)},
+    }
+
+
+def load_glyph_manifest(path=GLYPHS_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_glyph_manifest(manifest, path=GLYPHS_PATH):
+    return write_if_changed(path, dumps(manifest) + b"\n")
+
+
+def coverage_delta(previous, sets):
+    """{locale: {"added": ranges, "removed": ranges}} for locales whose set changed since `previous`."""
+    before = previous.get("locales", {})
+    delta = {}
+    for locale, codepoints in sets.items():
+        old = parse_ranges(before[locale]["unicodeRange"]) if locale in before else set()
+        added, removed = codepoints - old, old - codepoints
+        if added or removed:
+            delta[locale] = {"added": unicode_ranges(added), "removed": unicode_ranges(removed)}
+    for locale in before.keys() - sets.keys():
+        delta[locale] = {"added": "", "removed": before[locale]["unicodeRange"]}
+    return delta
@@ -0,0 +1,208 @@
+"""
+Offline port of the constellation force layout (src/simulation/force-layout.js).
+
+The browser settles the constellation by running PHYSICS.warmupTicks ticks
+of d3-force before the first frame. This module runs the same forces with
+NumPy, vectorized over every node, so those ticks can happen at build time
+for a few canonical viewports instead:
+
+  center        forceCenter: shift all nodes so their mean sits on (cx, cy)
+  collide       forceCollide, 2 iterations, mass-weighted by radius²
+  charge        forceManyBody on emotions, capped at chargeMaxDistance
+  need-gravity  needGravityForce: link pulls, cosmic drift, perturbation
+
+Need nodes are fixed on the same stretched ring. Two deliberate differences
+from d3: charge is summed exactly over all pairs instead of Barnes-Hut
+(n is tiny), and collide resolves all pairs of an iteration at once
+instead of node by node. Randomness comes from a seeded generator, so a
+preset is reproducible.
+
+Positions are returned normalized to the need ring — (x - cx) / radius,
+(y - cy) / radius — so the client maps them onto any viewport size with
+the same aspect ratio.
+"""
+import math
+import re
+
+import numpy as np
+
+from pipeline.paths import CONSTANTS_PATH
+
+# Canonical CSS-pixel viewports: (name, width, height)
+PRESETS = (
+    ("wide", 1920, 1080),
+    ("desktop", 1440, 900),
+    ("tablet", 1024, 768),
+    ("square", 900, 900),
+    ("portrait", 768, 1024),
+    ("phone", 390, 844),
+)
+
+NEED_RADIUS_KEY = "collisionRadiusNeed"
+EMOTION_RADIUS_KEY = "collisionRadiusEmotion"
+DRIFT_STEP = 0.016  # forces.js advances driftTime by one 60 fps frame per tick
+COLLIDE_ITERATIONS = 2
+CHARGE_MIN_DISTANCE2 = 1.0  # d3-force default distanceMin²
+
+_OBJECT_RE = r"export const {name} = \{{(.*?)\n\}};"
+_ENTRY_RE = re.compile(r"^\s*(\w+):\s*(-?[\d.]+(?:e-?\d+)?),", re.MULTILINE)
+
+
+def read_js_constants(name, path=CONSTANTS_PATH):
+    """The numeric entries of `export const NAME = { ... };` in constants.js."""
+    with open(path, "r", encoding="utf-8") as f:
+        match = re.search(_OBJECT_RE.format(name=name), f.read(), re.DOTALL)
+    if match is None:
+        raise KeyError(f"{name} not found in {path}")
+    return {key: float(value) for key, value in _ENTRY_RE.findall(match.group(1))}
+
+
+def ring_unit(count, layout):
+    """Need positions on the stretched ring, centered at 0 with radius 1."""
+    angles = np.arange(count) / count * 2 * math.pi + layout["needRingOffset"]
+    return np.cos(angles) * layout.get("needHorizontalStretch", 1.0), np.sin(angles)
+
+
+def need_ring(count, width, height, layout):
+    """(fx, fy, cx, cy, radius) exactly as createSimulation places the needs."""
+    cx = width / 2 + width * layout.get("centerXOffset", 0)
+    cy = height / 2
+    radius = min(width, height) * layout["needRingRadius"]
+    ux, uy = ring_unit(count, layout)
+    return cx + ux * radius, cy + uy * radius, cx, cy, radius
+
+
+def link_matrix(model):
+    """[emotions × needs] link strengths, summed like the JS loops; 0 where unlinked."""
+    column = {need.id: j for j, need in enumerate(model.needs)}
+    links = np.zeros((len(model.emotions), len(model.needs)))
+    for i, emotion in enumerate(model.emotions):
+        for link in emotion.links:
+            if link.need_id in column:
+                links[i, column[link.need_id]] += link.strength
+    return links
+
+
+def _center(x, y, cx, cy, strength):
+    x -= (x.mean() - cx) * strength
+    y -= (y.mean() - cy) * strength
+
+
+def _collide(x, y, vx, vy, radius, strength, rng):
+    r2 = radius * radius
+    for _ in range(COLLIDE_ITERATIONS):
+        px, py = x + vx, y + vy
+        dx = px[:, None] - px[None, :]
+        dy = py[:, None] - py[None, :]
+        reach = radius[:, None] + radius[None, :]
+        dist2 = dx * dx + dy * dy
+        hit = dist2 < reach * reach
+        np.fill_diagonal(hit, False)
+        if not hit.any():
+            continue
+        # Coincident nodes get d3's tiny random nudge instead of dividing by 0
+        same = hit & (dist2 == 0)
+        if same.any():
+            dx[same] = (rng.random(same.sum()) - 0.5) * 1e-6
+            dist2 = dx * dx + dy * dy
+        dist = np.sqrt(dist2, where=hit, out=np.ones_like(dist2))
+        push = np.where(hit, (reach - dist) / dist * strength, 0.0)
+        # Each node takes the share of the overlap its partner's mass implies
+        share = r2[None, :] / (r2[:, None] + r2[None, :])
+        vx += (dx * push * share).sum(axis=1)
+        vy += (dy * push * share).sum(axis=1)
+
+
+def _charge(x, y, vx, vy, charge, alpha, max_distance):
+    dx = x[None, :] - x[:, None]
+    dy = y[None, :] - y[:, None]
+    dist2 = dx * dx + dy * dy
+    near = (dist2 < max_distance * max_distance) & (dist2 > 0)
+    dist2 = np.where(dist2 < CHARGE_MIN_DISTANCE2, np.sqrt(CHARGE_MIN_DISTANCE2 * dist2), dist2)
+    weight = np.where(near, charge[None, :] * alpha / np.where(near, dist2, 1.0), 0.0)
+    vx += (dx * weight).sum(axis=1)
+    vy += (dy * weight).sum(axis=1)
+
+
+def _need_gravity(ex, ey, evx, evy, fx, fy, links, alpha, drift_time, seeds, physics, rng):
+    pull = links * (physics["gravityStrength"] * alpha)
+    evx += pull @ fx - pull.sum(axis=1) * ex
+    evy += pull @ fy - pull.sum(axis=1) * ey
+
+    drift_alpha = math.sqrt(alpha)
+    angle = drift_time * physics["driftSpeed"] + (ex * 0.003 + ey * 0.002) + seeds
+    evx += np.cos(angle) * physics["driftStrength"] * drift_alpha
+    evy += np.sin(angle) * physics["driftStrength"] * drift_alpha
+
+    jitter = physics["perturbation"] * drift_alpha
+    evx += (rng.random(ex.size) - 0.5) * jitter
+    evy += (rng.random(ex.size) - 0.5) * jitter
+
+
+def simulate(model, width, height, physics, layout, ticks=None, seed=0, observe=None):
+    """Run the warmup for one viewport. Returns (x, y, cx, cy, radius), emotions only, in px.
+
+    observe(tick, x, y, vx, vy), if given, sees the emotion arrays after
+    every tick (1-based); it must not modify them.
+    """
+    rng = np.random.default_rng(seed)
+    needs, emotions = len(model.needs), len(model.emotions)
+    fx, fy, cx, cy, radius = need_ring(needs, width, height, layout)
+    links = link_matrix(model)
+
+    # Start each emotion near the strength-weighted centroid of its needs
+    weight = links.sum(axis=1)
+    safe = np.where(weight > 0, weight, 1.0)
+    ex = np.where(weight > 0, links @ fx / safe, 0.0) + (rng.random(emotions) - 0.5) * 30
+    ey = np.where(weight > 0, links @ fy / safe, 0.0) + (rng.random(emotions) - 0.5) * 30
+    seeds = rng.random(emotions) * 2 * math.pi
+
+    # Needs first, emotions after, like allNodes in createSimulation
+    x, y = np.concatenate([fx, ex]), np.concatenate([fy, ey])
+    vx, vy = np.zeros_like(x), np.zeros_like(y)
+    is_emotion = np.arange(needs + emotions) >= needs
+    collide_radius = np.where(is_emotion, physics[EMOTION_RADIUS_KEY], physics[NEED_RADIUS_KEY])
+    charge = np.where(is_emotion, physics["chargeStrength"], 0.0)
+
+    alpha, drift_time = 1.0, 0.0
+    keep = 1 - physics["velocityDecay"]
+    for tick in range(1, int(physics["warmupTicks"] if ticks is None else ticks) + 1):
+        alpha += (physics["alphaTarget"] - alpha) * physics["alphaDecay"]
+        drift_time += DRIFT_STEP
+        _center(x, y, cx, cy, physics["centeringStrength"])
+        _collide(x, y, vx, vy, collide_radius, physics["collisionStrength"], rng)
+        _charge(x, y, vx, vy, charge, alpha, physics["chargeMaxDistance"])
+        _need_gravity(x[needs:], y[needs:], vx[needs:], vy[needs:], fx, fy, links,
+                      alpha, drift_time, seeds, physics, rng)
+        vx *= keep
+        vy *= keep
+        x += vx
+        y += vy
+        # Fixed nodes: d3 snaps fx/fy back and zeroes their velocity
+        x[:needs], y[:needs] = fx, fy
+        vx[:needs] = vy[:needs] = 0
+        if observe is not None:
+            observe(tick, x[needs:], y[needs:], vx[needs:], vy[needs:])
+
+    return x[needs:], y[needs:], cx, cy, radius
+
+
+def settle_presets(model, presets=PRESETS, physics=None, layout=None, ticks=None, seed=0, digits=4):
+    """Settled, ring-normalized emotion positions for every preset viewport."""
+    physics = physics or read_js_constants("PHYSICS")
+    layout = layout or read_js_constants("LAYOUT")
+    ticks = int(physics["warmupTicks"] if ticks is None else ticks)
+    entries = []
+    for name, width, height in presets:
+        x, y, cx, cy, radius = simulate(model, width, height, physics, layout, ticks, seed)
+        nx, ny = (x - cx) / radius, (y - cy) / radius
+        entries.append({
+            "name": name,
+            "width": width,
+            "height": height,
+            "positions": {
+                emotion.id: [round(float(a), digits), round(float(b), digits)]
+                for emotion, a, b in zip(model.emotions, nx, ny)
+            },
+        })
+    return {"ticks": ticks, "seed": seed, "presets": entries}
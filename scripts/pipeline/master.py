@@ -0,0 +1,104 @@
+"""
+Load, index and write the multilingual master document.
+
+localized_cells() is the one walk over its localized cells: every stage
+that visits them (stamps, coverage, translation memory, machine
+translation, size report, glyph inventory, SQLite export) takes its
+(name, target, Text) triples from a Model (model.py) rather than
+repeating the loop. Names are "need/<id>/<field>" (label, description),
+"emotion/<id>/<field>" (label, essence, signal, reflection, bookRef) and
+"emotion/<id>/inquiry/<needId>"; targets are the (kind, id, key) of
+TranslationBatch patches, which MasterIndex resolves in the plain document.
+"""
+import json
+
+from pipeline.paths import MASTER_PATH
+
+# readMore fields, in master order
+WISDOM_FIELDS = ("essence", "signal", "reflection", "bookRef")
+
+
+def load_master(path=MASTER_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_master(data, path=MASTER_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def need_cells(need):
+    """(name, target, Text) for a model Need's label and description."""
+    yield f"need/{need.id}/label", ("needLabel", need.id, None), need.label
+    yield f"need/{need.id}/description", ("needDescription", need.id, None), need.description
+
+
+def emotion_cells(emotion):
+    """(name, target, Text) for a model Emotion's label, inquiries and readMore fields."""
+    eid = emotion.id
+    yield f"emotion/{eid}/label", ("label", eid, None), emotion.label
+    for i, link in enumerate(emotion.links):
+        yield f"emotion/{eid}/inquiry/{link.need_id}", ("inquiry", eid, i), link.inquiry
+    for fld, text in emotion.read_more.fields():
+        yield f"emotion/{eid}/{fld}", ("readMore", eid, fld), text
+
+
+def localized_cells(model):
+    """(name, target, Text) for every localized cell of a Model, needs first, in master order."""
+    for need in model.needs:
+        yield from need_cells(need)
+    for emotion in model.emotions:
+        yield from emotion_cells(emotion)
+
+
+class MasterIndex:
+    """One id → record map over the master document.
+
+    Every translation patch names its target as (kind, id, key). The index
+    resolves that to the locale dict to write into, so patches never scan
+    the emotions list. record_cell()/assign_record() do the same for a
+    single record, for callers that stream emotions instead of indexing.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.emotions = {e["id"]: e for e in data["emotions"]}
+        self.needs = {n["id"]: n for n in data["needs"]}
+
+    def cell(self, target):
+        return record_cell(self.record(unit_of(target)), target)
+
+    def assign(self, target, locales, texts):
+        """Write one patch: texts[i] becomes the cell's locales[i] string."""
+        assign_record(self.record(unit_of(target)), target, locales, texts)
+
+    def record(self, unit):
+        kind, rid = unit
+        return self.emotions[rid] if kind == "emotion" else self.needs[rid]
+
+
+def record_cell(record, target):
+    """The locale dict a patch target names inside its emotion or need record."""
+    kind, _, key = target
+    if kind == "readMore":
+        return record["readMore"][key]
+    if kind == "inquiry":
+        return record["needs"][key]["inquiry"]
+    if kind in ("label", "needLabel"):
+        return record["label"]
+    if kind == "needDescription":
+        return record["description"]
+    raise ValueError(f"Unknown patch target kind: {kind!r}")
+
+
+def assign_record(record, target, locales, texts):
+    cell = record_cell(record, target)
+    for loc, text in zip(locales, texts):
+        cell[loc] = text
+
+
+def unit_of(target):
+    """The (kind, id) record a patch target lives in: ("emotion", id) or ("need", id)."""
+    kind, rid, _ = target
+    return ("need", rid) if kind in ("needLabel", "needDescription") else ("emotion", rid)
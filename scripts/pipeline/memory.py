@@ -0,0 +1,258 @@
+"""
+Translation memory: English source string → translations per locale.
+
+translation-memory.json is the persistent store: one entry per distinct
+English string, keyed on its normalized form (NFC, whitespace collapsed),
+so it no longer matters which batch script or literal table a translation
+came from. Two in-memory indexes serve lookups:
+
+  exact   dict keyed on the normalized source — the hash index, filled on
+          load; lookups are one probe regardless of store size
+  fuzzy   inverted index of character trigrams (casefolded, padded), built
+          on the first fuzzy() call, since builds that only take exact
+          hits never need it; candidates sharing trigrams with the query
+          are scored by Dice coefficient, and candidates whose length
+          alone rules out the threshold are skipped without scoring
+
+memory_batches() turns exact hits for every localized cell of the master
+into ordinary TranslationBatch patches, so build-wisdom.py --memory runs
+the same apply/cache/stream path without executing the batch scripts.
+
+File layout (one entry per line, sorted by source, for readable diffs):
+
+    {"format": "translation-memory/1", "entries": [
+      ["Anger", {"es": "Ira", "ko": "분노", ...}],
+      ...
+    ]}
+"""
+import ast
+import json
+import os
+import re
+import unicodedata
+from collections import Counter
+
+from pipeline.batch import TranslationBatch
+from pipeline.emit import write_if_changed
+from pipeline.master import emotion_cells, need_cells
+from pipeline.model import Emotion, Need
+from pipeline.paths import LOCALES, MEMORY_PATH, TRANSLATED_LOCALES
+
+FORMAT = "translation-memory/1"
+SOURCE_LOCALE = "en"
+NGRAM = 3
+FUZZY_THRESHOLD = 0.7
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize(source):
+    """Exact-match key: NFC with whitespace runs collapsed and trimmed."""
+    return _SPACE_RE.sub(" ", unicodedata.normalize("NFC", source)).strip()
+
+
+def _key_ngrams(key):
+    text = f" {key.casefold()} "
+    return {text[i:i + NGRAM] for i in range(max(1, len(text) - NGRAM + 1))}
+
+
+def ngrams(source):
+    """Distinct character trigrams of the casefolded key, padded so short strings still index."""
+    return _key_ngrams(normalize(source))
+
+
+class TranslationMemory:
+    def __init__(self):
+        self.entries = {}     # normalized source → {locale: text}
+        self._grams = None    # normalized source → its trigram set, once fuzzy() needs it
+        self._postings = None  # trigram → set of normalized sources
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _targets(self, key):
+        """The {locale: text} dict of a normalized source, created (and fuzzy-indexed) if new."""
+        targets = self.entries.get(key)
+        if targets is None:
+            targets = self.entries[key] = {}
+            if self._grams is not None:
+                self._index_key(key)
+        return targets
+
+    def _index_key(self, key):
+        grams = self._grams[key] = _key_ngrams(key)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(key)
+
+    def add(self, source, locale, text):
+        """Record one translation; a later add for the same source and locale wins.
+        Returns True when the stored text changed."""
+        targets = self._targets(normalize(source))
+        if targets.get(locale) == text:
+            return False
+        targets[locale] = text
+        return True
+
+    def add_entry(self, source, targets):
+        """Record every {locale: text} of one source, normalizing it once."""
+        self._targets(normalize(source)).update(targets)
+
+    def exact(self, source, locale=None):
+        """The translation for one locale, or the whole {locale: text} dict; None on a miss."""
+        targets = self.entries.get(normalize(source))
+        if targets is None or locale is None:
+            return targets
+        return targets.get(locale)
+
+    def fuzzy(self, source, locale=None, threshold=FUZZY_THRESHOLD, limit=3):
+        """[(score, source, targets)] best first, for stored sources with Dice ≥ threshold.
+
+        With a locale, only sources translated into it are considered and
+        targets is that one string.
+        """
+        if self._grams is None:
+            self._grams, self._postings = {}, {}
+            for key in self.entries:
+                self._index_key(key)
+        grams = ngrams(source)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        size = len(grams)
+        matches = []
+        for key, common in shared.items():
+            other = len(self._grams[key])
+            # Dice can't exceed 2·min/(a+b): skip hopeless length mismatches
+            if 2 * min(size, other) < threshold * (size + other):
+                continue
+            score = 2 * common / (size + other)
+            if score < threshold:
+                continue
+            targets = self.entries[key]
+            if locale is not None:
+                if locale not in targets:
+                    continue
+                targets = targets[locale]
+            matches.append((round(score, 4), key, targets))
+        matches.sort(key=lambda m: (-m[0], m[1]))
+        return matches[:limit]
+
+    def merge_cell(self, cell, locales=TRANSLATED_LOCALES):
+        """Add every translation of one {locale: text} cell (or Text) under its English text.
+        Returns the number of stored strings that changed."""
+        source = (cell or {}).get(SOURCE_LOCALE)
+        if not source:
+            return 0
+        texts = ((loc, cell.get(loc)) for loc in locales)
+        return sum(self.add(source, loc, text) for loc, text in texts if text)
+
+    def to_document(self):
+        order = {loc: i for i, loc in enumerate(TRANSLATED_LOCALES)}
+        return {"format": FORMAT, "entries": [
+            [key, dict(sorted(self.entries[key].items(), key=lambda item: (order.get(item[0], len(order)), item[0])))]
+            for key in sorted(self.entries)
+        ]}
+
+
+def harvest_batch(memory, batch, index):
+    """Add a TranslationBatch's patches, keyed on the English text of each target in the master.
+    Returns (strings changed, patches whose target has no English text)."""
+    changed = skipped = 0
+    for target, texts in batch.patches:
+        try:
+            source = index.cell(target).get(SOURCE_LOCALE)
+        except (KeyError, IndexError):
+            source = None
+        if not source:
+            skipped += 1
+            continue
+        changed += sum(memory.add(source, loc, text) for loc, text in zip(batch.locales, texts) if text)
+    return changed, skipped
+
+
+def literal_cells(path):
+    """{locale: text} cells written as literals in a legacy script, found without running it.
+
+    Matches dict displays keyed by locale codes ({"en": ..., "es": ...})
+    and ml(en=..., es=...) calls that include an English string.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Dict):
+            pairs = zip((k.value if isinstance(k, ast.Constant) else None for k in node.keys), node.values)
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "ml":
+            pairs = ((kw.arg, kw.value) for kw in node.keywords)
+        else:
+            continue
+        cell = {}
+        for locale, value in pairs:
+            if locale not in LOCALES:
+                break
+            if isinstance(value, ast.Constant) and isinstance(value.value, str):
+                cell[locale] = value.value
+        else:
+            if cell.get(SOURCE_LOCALE):
+                yield cell
+
+
+def memory_batches(memory, cells, locales=TRANSLATED_LOCALES):
+    """Exact-hit patches for (name, target, cell) triples (master.localized_cells), as TranslationBatches.
+
+    Patches are grouped by the locales the memory has for the source, since
+    a batch's patches share one locale list. Returns (batches, misses) where
+    misses are the (target, English text) pairs with no exact entry.
+    """
+    grouped, misses = {}, []
+    for _, target, cell in cells:
+        source = cell.get(SOURCE_LOCALE)
+        if not source:
+            continue
+        targets = memory.exact(source)
+        if targets is None:
+            misses.append((target, source))
+            continue
+        have = tuple(loc for loc in locales if loc in targets)
+        if have:
+            grouped.setdefault(have, []).append((target, [targets[loc] for loc in have]))
+    batches = []
+    for have, patches in grouped.items():
+        batch = TranslationBatch("Translation memory", locales=have)
+        batch.patches = patches
+        batches.append(batch)
+    return batches, misses
+
+
+def stream_cells(path):
+    """localized_cells() for the master file read one emotion at a time (pipeline/stream.py)."""
+    from pipeline.stream import MasterReader
+
+    with MasterReader(path) as reader:
+        for need in reader.head.get("needs", []):
+            yield from need_cells(Need.from_dict(need))
+        for emotion in reader.emotions():
+            yield from emotion_cells(Emotion.from_dict(emotion))
+
+
+def load_memory(path=MEMORY_PATH):
+    """The store at path; an empty memory when the file doesn't exist yet."""
+    memory = TranslationMemory()
+    if not os.path.exists(path):
+        return memory
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("format") != FORMAT:
+        raise ValueError(f"{path}: expected format {FORMAT!r}, got {document.get('format')!r}")
+    for source, targets in document["entries"]:
+        memory.add_entry(source, targets)
+    return memory
+
+
+def write_memory(memory, path=MEMORY_PATH):
+    """Write the store one entry per line. Returns True if the file changed."""
+    document = memory.to_document()
+    lines = ",\n".join(
+        "    " + json.dumps(entry, ensure_ascii=False, separators=(", ", ": ")) for entry in document["entries"]
+    )
+    blob = f'{{"format": "{FORMAT}", "entries": [\n{lines}\n]}}\n'
+    return write_if_changed(path, blob.encode("utf-8"))
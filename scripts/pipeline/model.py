@@ -0,0 +1,173 @@
+"""
+Typed, compact view of the master document, shared by every stage that
+reads it.
+
+Need, Emotion, NeedLink and ReadMore are __slots__ classes, and every
+localized cell is a Text: a fixed list indexed by locale slot (None where
+a locale has no string) instead of an {"en": ..., "es": ...} dict. The
+constellation path (constellation.py, appearance.py, adjacency.py,
+similarity.py, layout.py), the wisdom outputs (shards.py, records.py,
+search.py), source stamps, the glyph inventory and the SQLite export all
+load the master once with load_model() or Model.from_document() and
+resolve text by locale along its fallback chain; the
+build-constellation.py pool workers receive the compact objects.
+
+Only patching works on the plain dicts of load_master() (MasterIndex in
+master.py), since it writes the document back byte for byte; build-wisdom.py
+builds the Model from the patched document once, for everything after.
+
+    model = load_model()
+    model.emotion("grief").read_more.essence.resolve("ja")
+
+Slots follow LOCALES; add_locales() gives further codes a slot (the
+private-use locales of synthetic.py), and Texts built before keep theirs.
+"""
+import json
+
+from pipeline.fallback import resolve_cell
+from pipeline.master import WISDOM_FIELDS
+from pipeline.paths import LOCALES, MASTER_PATH
+
+_SLOTS = {loc: i for i, loc in enumerate(LOCALES)}
+
+
+def add_locales(locales):
+    """Give each locale not yet known the next slot."""
+    for locale in locales:
+        _SLOTS.setdefault(locale, len(_SLOTS))
+
+
+class Text:
+    """One localized string per locale slot."""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values=None):
+        self.values = values if values is not None else [None] * len(_SLOTS)
+
+    @classmethod
+    def from_dict(cls, cell):
+        cell = cell or {}
+        values = [cell.get(loc) for loc in _SLOTS]
+        if len(cell) != sum(v is not None for v in values):
+            unknown = sorted(set(cell) - set(_SLOTS))
+            raise ValueError(f"Text has locales outside LOCALES: {unknown}")
+        return cls(values)
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def items(self):
+        """(locale, text) for every locale that has one, in slot order."""
+        return ((loc, v) for loc, v in zip(_SLOTS, self.values) if v is not None)
+
+    def get(self, locale, default=None):
+        """The locale's own text (no fallback), as dict.get on the master cell."""
+        i = _SLOTS.get(locale)
+        value = self.values[i] if i is not None and i < len(self.values) else None
+        return default if value is None else value
+
+    def resolve(self, locale, default=""):
+        """The first text along the locale's fallback chain, else default."""
+        return resolve_cell(self, locale, default)[0]
+
+    def __repr__(self):
+        return f"Text({self.to_dict()!r})"
+
+
+class Need:
+    __slots__ = ("id", "label", "description", "color", "color_secondary")
+
+    def __init__(self, id, label, description, color, color_secondary):
+        self.id = id
+        self.label = label
+        self.description = description
+        self.color = color
+        self.color_secondary = color_secondary
+
+    @classmethod
+    def from_dict(cls, record):
+        return cls(record["id"], Text.from_dict(record.get("label")),
+                   Text.from_dict(record.get("description")),
+                   record.get("color"), record.get("colorSecondary"))
+
+
+class NeedLink:
+    __slots__ = ("need_id", "inquiry", "strength")
+
+    def __init__(self, need_id, inquiry, strength):
+        self.need_id = need_id
+        self.inquiry = inquiry
+        self.strength = strength
+
+    @classmethod
+    def from_dict(cls, record):
+        return cls(record["needId"], Text.from_dict(record.get("inquiry")), record["strength"])
+
+
+class ReadMore:
+    __slots__ = ("essence", "signal", "reflection", "book_ref")
+
+    def __init__(self, essence, signal, reflection, book_ref):
+        self.essence = essence
+        self.signal = signal
+        self.reflection = reflection
+        self.book_ref = book_ref
+
+    @classmethod
+    def from_dict(cls, record):
+        record = record or {}
+        return cls(*(Text.from_dict(record.get(fld)) for fld in WISDOM_FIELDS))
+
+    def fields(self):
+        """(JSON field name, Text) pairs in WISDOM_FIELDS order."""
+        return zip(WISDOM_FIELDS, (self.essence, self.signal, self.reflection, self.book_ref))
+
+
+class Emotion:
+    __slots__ = ("id", "label", "links", "read_more")
+
+    def __init__(self, id, label, links, read_more):
+        self.id = id
+        self.label = label
+        self.links = links
+        self.read_more = read_more
+
+    @classmethod
+    def from_dict(cls, record):
+        return cls(record["id"], Text.from_dict(record.get("label")),
+                   [NeedLink.from_dict(link) for link in record.get("needs", [])],
+                   ReadMore.from_dict(record.get("readMore")))
+
+
+class Model:
+    """The whole master: needs and emotions in file order plus id lookups."""
+
+    __slots__ = ("version", "source", "source_url", "needs", "emotions", "_needs_by_id", "_emotions_by_id")
+
+    def __init__(self, version, source, source_url, needs, emotions):
+        self.version = version
+        self.source = source
+        self.source_url = source_url
+        self.needs = needs
+        self.emotions = emotions
+        self._needs_by_id = {n.id: n for n in needs}
+        self._emotions_by_id = {e.id: e for e in emotions}
+
+    @classmethod
+    def from_document(cls, data):
+        return cls(data.get("version"), data.get("source"), data.get("sourceUrl"),
+                   [Need.from_dict(n) for n in data["needs"]],
+                   [Emotion.from_dict(e) for e in data["emotions"]])
+
+    def need(self, need_id):
+        return self._needs_by_id[need_id]
+
+    def emotion(self, emotion_id):
+        return self._emotions_by_id[emotion_id]
+
+
+def load_model(path=MASTER_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return Model.from_document(json.load(f))
+
@@ -0,0 +1,260 @@
+"""
+Batched, concurrent machine translation of missing master strings.
+
+  gather    every localized cell of the master is checked for each target
+            locale; the missing (locale, English source) pairs are
+            deduplicated on the normalized source (pipeline/memory.py), and
+            pairs the translation memory or the results cache already
+            answer never reach the provider
+  plan      pairs are grouped by locale and cut into batches of at most
+            max_items strings / max_chars characters (the tighter of the
+            options and the provider's own caps)
+  run       an asyncio pool of `jobs` workers drains the batch queue; every
+            request waits for the shared rate limiter, and TransientError
+            is retried with exponential backoff up to `retries` times; any
+            other exception fails just that batch
+  apply     results are written back into every cell that needed them
+
+A provider is any object with the Provider interface: an async
+translate(texts, locale) returning one string per input, in order, and
+raising TransientError for failures worth retrying. MockProvider is
+deterministic and offline (pseudo-translations, simulated latency and
+seeded transient failures), so the stage can be benchmarked without a
+network or an API key.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+from pipeline.memory import SOURCE_LOCALE, normalize
+from pipeline.paths import ROOT
+
+MT_CACHE_DIR = os.path.join(ROOT, ".cache", "machine-translation")
+
+# Bump when the cache key or file layout changes.
+MT_CACHE_VERSION = 1
+
+
+class TransientError(Exception):
+    """A provider failure worth retrying: timeout, rate limit, 5xx."""
+
+
+class Provider:
+    """Translate batches of English strings into one locale."""
+
+    name = "provider"
+    max_items = 100      # strings per request the service accepts
+    max_chars = 30000    # characters per request the service accepts
+
+    async def translate(self, texts, locale):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class MockProvider(Provider):
+    """Offline stand-in: "[locale] text" after a simulated round trip.
+
+    latency + per_char × characters seconds per request; fail_percent of
+    batches (chosen by a hash of their content and seed) fail their first
+    attempt with TransientError, so retries are exercised reproducibly.
+    """
+
+    name = "mock"
+
+    def __init__(self, latency=0.02, per_char=0.0, fail_percent=0, seed=0):
+        self.latency = float(latency)
+        self.per_char = float(per_char)
+        self.fail_percent = float(fail_percent)
+        self.seed = int(seed)
+        self._attempts = {}
+
+    def _flaky(self, texts, locale):
+        digest = hashlib.sha256(json.dumps([self.seed, locale, texts], ensure_ascii=False).encode("utf-8"))
+        return int(digest.hexdigest()[:8], 16) % 10000 < self.fail_percent * 100
+
+    async def translate(self, texts, locale):
+        key = (locale, tuple(texts))
+        attempt = self._attempts[key] = self._attempts.get(key, 0) + 1
+        await asyncio.sleep(self.latency + self.per_char * sum(len(t) for t in texts))
+        if attempt == 1 and self._flaky(texts, locale):
+            raise TransientError(f"mock: simulated failure for {len(texts)} {locale} strings")
+        return [f"[{locale}] {text}" for text in texts]
+
+
+class ResultCache:
+    """Provider results on disk: {locale: {normalized source: text}}, one file per provider."""
+
+    def __init__(self, provider_name, directory=MT_CACHE_DIR):
+        self.path = os.path.join(directory, f"{provider_name}.json")
+        self.entries = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return
+        if document.get("version") == MT_CACHE_VERSION:
+            self.entries = document["entries"]
+
+    def get(self, locale, source):
+        return self.entries.get(locale, {}).get(source)
+
+    def put(self, locale, source, text):
+        self.entries.setdefault(locale, {})[source] = text
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": MT_CACHE_VERSION, "entries": self.entries}, f, ensure_ascii=False)
+
+
+class RateLimiter:
+    """At most `rate` acquisitions per second across all workers (None: unlimited)."""
+
+    def __init__(self, rate=None):
+        self.interval = 1 / rate if rate else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def gather_pairs(cells, locales, memory=None, cache=None, retranslate=False, redo=()):
+    """Find the work for (name, target, cell) triples (master.localized_cells).
+
+    Returns (pending, needs, known):
+      pending  [(locale, source)] distinct pairs the provider must translate,
+               in first-seen order
+      needs    {(locale, source): [target, ...]} every cell each pair fills
+      known    {(locale, source): text} pairs answered by memory or cache
+    Sources are normalized. retranslate treats every cell as missing; redo
+    is a set of (target, locale) to translate even though present (stale
+    translations, see pipeline/stamps.py).
+    """
+    pending, needs, known = [], {}, {}
+    for _, target, cell in cells:
+        english = cell.get(SOURCE_LOCALE)
+        if not english:
+            continue
+        source = normalize(english)
+        for locale in locales:
+            if cell.get(locale) and not retranslate and (target, locale) not in redo:
+                continue
+            pair = (locale, source)
+            if pair in needs:
+                needs[pair].append(target)
+                continue
+            needs[pair] = [target]
+            text = memory.exact(source, locale) if memory is not None and not retranslate else None
+            if text is None and cache is not None:
+                text = cache.get(locale, source)
+            if text is None:
+                pending.append(pair)
+            else:
+                known[pair] = text
+    return pending, needs, known
+
+
+def plan_batches(pending, max_items, max_chars):
+    """[(locale, [source, ...])]: pending grouped by locale, cut at max_items / max_chars.
+
+    A single string longer than max_chars still goes out, alone.
+    """
+    by_locale = {}
+    for locale, source in pending:
+        by_locale.setdefault(locale, []).append(source)
+    batches = []
+    for locale, sources in by_locale.items():
+        batch, size = [], 0
+        for source in sources:
+            if batch and (len(batch) >= max_items or size + len(source) > max_chars):
+                batches.append((locale, batch))
+                batch, size = [], 0
+            batch.append(source)
+            size += len(source)
+        if batch:
+            batches.append((locale, batch))
+    return batches
+
+
+async def _worker(provider, queue, limiter, retries, backoff, results, stats):
+    while True:
+        item = await queue.get()
+        if item is None:
+            queue.task_done()
+            return
+        locale, sources = item
+        for attempt in range(retries + 1):
+            await limiter.acquire()
+            stats["requests"] += 1
+            try:
+                texts = await provider.translate(sources, locale)
+                if len(texts) != len(sources):
+                    raise ValueError(f"{provider.name}: {len(texts)} results for {len(sources)} {locale} strings")
+            except TransientError:
+                if attempt == retries:
+                    stats["failed"] += len(sources)
+                    break
+                stats["retries"] += 1
+                await asyncio.sleep(backoff * 2 ** attempt)
+                continue
+            except Exception as err:
+                # Not worth retrying, but only this batch is lost: the other
+                # workers' results still get cached and returned
+                stats["failed"] += len(sources)
+                stats["errors"].append(f"{locale}: {err}")
+                break
+            for source, text in zip(sources, texts):
+                results[(locale, source)] = text
+            stats["translated"] += len(sources)
+            break
+        queue.task_done()
+
+
+async def run_batches(provider, batches, jobs=4, rate=None, retries=3, backoff=0.5):
+    """Translate every batch with `jobs` concurrent workers.
+
+    Returns ({(locale, source): text}, stats); pairs whose batch ran out of
+    retries or raised anything else are absent from the results and counted
+    in stats["failed"], with the non-transient errors in stats["errors"].
+    """
+    queue = asyncio.Queue()
+    for batch in batches:
+        queue.put_nowait(batch)
+    workers = max(1, min(jobs, len(batches)))
+    for _ in range(workers):
+        queue.put_nowait(None)
+
+    results = {}
+    stats = {"batches": len(batches), "workers": workers, "requests": 0, "retries": 0,
+             "translated": 0, "failed": 0, "errors": []}
+    limiter = RateLimiter(rate)
+    try:
+        await asyncio.gather(*(
+            _worker(provider, queue, limiter, retries, backoff, results, stats) for _ in range(workers)
+        ))
+    finally:
+        await provider.close()
+    return results, stats
+
+
+def apply_results(index, needs, results):
+    """Write every translated pair into the cells that need it. Returns [(target, locale)] written."""
+    written = []
+    for pair, text in results.items():
+        locale, _ = pair
+        for target in needs.get(pair, ()):
+            index.assign(target, [locale], [text])
+            written.append((target, locale))
+    return written
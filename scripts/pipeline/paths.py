@@ -0,0 +1,31 @@
+"""Repository paths and the locale order shared by every build script."""
+import os
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROOT = os.path.dirname(SCRIPTS_DIR)
+DATA_DIR = os.path.join(ROOT, "public", "data")
+MASTER_PATH = os.path.join(DATA_DIR, "emotion-constellation-more-info-data.json")
+# PHYSICS / LAYOUT live here; offline layout tools read them instead of copying
+CONSTANTS_PATH = os.path.join(ROOT, "src", "core", "constants.js")
+# UI text source table and the locale list (pipeline/ui_strings.py reads both)
+UI_STRINGS_PATH = os.path.join(ROOT, "src", "core", "ui-strings.source.js")
+# ...and what build-ui-strings.py generates from the table
+UI_FALLBACK_PATH = os.path.join(ROOT, "src", "core", "ui-strings-en.js")
+UI_CHUNK_DIR = os.path.join(DATA_DIR, "ui-strings")
+LOCALE_JS_PATH = os.path.join(ROOT, "src", "core", "locale.js")
+# English source → translations store (pipeline/memory.py)
+MEMORY_PATH = os.path.join(SCRIPTS_DIR, "translation-memory.json")
+# Source hash each translation was made from (pipeline/stamps.py)
+STAMPS_PATH = os.path.join(SCRIPTS_DIR, "translation-stamps.json")
+# Which cells each locale takes from its fallback chain (pipeline/fallback.py)
+COVERAGE_PATH = os.path.join(SCRIPTS_DIR, "locale-coverage.json")
+# Extra per-locale search terms for each emotion (pipeline/search.py)
+SEARCH_KEYWORDS_PATH = os.path.join(SCRIPTS_DIR, "search-keywords.json")
+# Codepoints each locale renders, for font subsetting (pipeline/glyphs.py)
+GLYPHS_PATH = os.path.join(SCRIPTS_DIR, "glyph-manifest.json")
+
+# Same order as SUPPORTED_LOCALES in src/core/locale.js
+LOCALES = ["en", "es", "ko", "zh", "ar", "he", "ja", "fr", "pt", "it", "de"]
+
+# Positional order of the translation lists in translate-*.py / tpN.py
+TRANSLATED_LOCALES = ["es", "ko", "zh", "ar", "he", "ja", "fr", "pt", "it", "de"]
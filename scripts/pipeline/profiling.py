@@ -0,0 +1,236 @@
+"""
+Opt-in per-phase profiling for the build scripts.
+
+Every script times its phases with PhaseTimer (pipeline/timing.py); when
+the PIPELINE_PROFILE environment variable names a file, each phase is
+also profiled and a JSON trace is written there when the script exits
+(a directory gets one <script>.json per script):
+
+  wall, cpu     perf_counter and process_time seconds
+  peakBytes     tracemalloc peak above what was live when the phase started
+  netBytes      what the phase left allocated
+  allocations   the top allocation sites (file:line) by net bytes
+  functions     with PIPELINE_CPROFILE=1, the functions with the most self
+                time under cProfile, and a rollup of self time by module,
+                which is where json decoding/encoding, str methods and
+                file I/O show up side by side
+
+With PIPELINE_CPROFILE=1 the call graph is also exported as collapsed
+stacks ("phase;caller;callee microseconds", one per line) next to the
+trace as <trace>.collapsed, ready for flamegraph.pl or speedscope.
+cProfile only records caller/callee pairs, so stacks deeper than two
+frames are reconstructed by splitting each function's time between its
+callers in proportion to what each caller spent in it.
+
+    PIPELINE_PROFILE=.cache/profile PIPELINE_CPROFILE=1 python scripts/build-wisdom.py --no-cache
+
+Profiling slows the phases down (tracemalloc several times over); compare
+wall times from plain runs.
+"""
+import atexit
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from pipeline.paths import ROOT
+
+PROFILE_ENV = "PIPELINE_PROFILE"
+CPROFILE_ENV = "PIPELINE_CPROFILE"
+FORMAT = "pipeline-trace/1"
+
+TOP_ALLOCATIONS = 10
+TOP_FUNCTIONS = 15
+STACK_DEPTH = 40
+# Stack fragments below this many microseconds are dropped from the export
+STACK_FLOOR_US = 50
+
+
+def trace_path(script=None):
+    """The trace file PIPELINE_PROFILE asks for, or None when profiling is off."""
+    target = os.environ.get(PROFILE_ENV)
+    if not target:
+        return None
+    if os.path.isdir(target) or target.endswith(("/", os.sep)):
+        name = os.path.splitext(os.path.basename(script or sys.argv[0] or "python"))[0]
+        return os.path.join(target, f"{name}.json")
+    return target
+
+
+def _short(filename):
+    """Repo files relative to the root, anything else as package/module.py."""
+    path = os.path.abspath(filename)
+    if path.startswith(ROOT + os.sep):
+        return os.path.relpath(path, ROOT).replace(os.sep, "/")
+    return "/".join(os.path.normpath(filename).split(os.sep)[-2:])
+
+
+def _label(func):
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{_short(filename)}:{line}({name})"
+
+
+def _module(func):
+    filename = func[0]
+    if filename == "~":
+        # "<method 'join' of 'str' objects>", "<built-in method _json.scanstring>"
+        name = func[2]
+        if " of '" in name:
+            return "builtins." + name.split(" of '")[1].split("'")[0]
+        return name.strip("<>").replace("built-in method ", "").split(".")[0]
+    parts = os.path.normpath(filename).split(os.sep)
+    return "/".join(parts[-2:]) if parts[-1] == "__init__.py" else parts[-1]
+
+
+def function_table(stats, limit=TOP_FUNCTIONS):
+    """([top functions by self time], {module: self seconds}) from a pstats.Stats."""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    top = [
+        {"function": _label(func), "calls": nc, "self": round(tt, 6), "cumulative": round(ct, 6)}
+        for func, (_, nc, tt, ct, _) in rows[:limit]
+    ]
+    modules = {}
+    for func, (_, _, tt, _, _) in rows:
+        key = _module(func)
+        modules[key] = modules.get(key, 0.0) + tt
+    modules = {k: round(v, 6) for k, v in sorted(modules.items(), key=lambda kv: kv[1], reverse=True) if v >= 1e-4}
+    return top, modules
+
+
+def collapsed_stacks(stats, prefix):
+    """{"prefix;frame;...": microseconds} of self time, reconstructed from caller/callee pairs."""
+    entries = stats.stats
+    callees = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(func)
+
+    stacks = {}
+
+    def walk(func, path, share, seen):
+        _, _, tt, ct, _ = entries[func]
+        path = f"{path};{_label(func)}"
+        own = int(tt * share * 1e6)
+        if own:
+            stacks[path] = stacks.get(path, 0) + own
+        if len(seen) >= STACK_DEPTH:
+            return
+        for callee in callees.get(func, ()):
+            if callee in seen:
+                continue
+            callee_ct = entries[callee][3]
+            if not callee_ct:
+                continue
+            spent = entries[callee][4][func][3]
+            part = share * spent / callee_ct
+            if callee_ct * part * 1e6 < STACK_FLOOR_US:
+                continue
+            walk(callee, path, part, seen | {callee})
+
+    for func, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            walk(func, prefix, 1.0, frozenset((func,)))
+    return stacks
+
+
+class Profiler:
+    """Collects one trace entry per phase and writes the trace at exit."""
+
+    def __init__(self, path, cprofile=False):
+        self.path = path
+        self.cprofile = cprofile
+        self.phases = []
+        self.stacks = {}
+        self.started = time.time()
+        self._depth = 0
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        atexit.register(self.write)
+
+    @classmethod
+    def from_env(cls):
+        path = trace_path()
+        if path is None:
+            return None
+        return cls(path, cprofile=os.environ.get(CPROFILE_ENV, "") not in ("", "0"))
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    @contextmanager
+    def phase(self, name):
+        """Profile the body as the phase `name`; nested phases are only timed."""
+        if self._depth:
+            start, cpu = time.perf_counter(), time.process_time()
+            try:
+                yield
+            finally:
+                self.phases.append({"name": name, "wall": round(time.perf_counter() - start, 6),
+                                    "cpu": round(time.process_time() - cpu, 6), "nested": True})
+            return
+
+        self._depth += 1
+        before = self._snapshot()
+        tracemalloc.reset_peak()
+        live = tracemalloc.get_traced_memory()[0]
+        profile = cProfile.Profile() if self.cprofile else None
+        start, cpu = time.perf_counter(), time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall, cpu = time.perf_counter() - start, time.process_time() - cpu
+            current, peak = tracemalloc.get_traced_memory()
+            self._depth -= 1
+            entry = {"name": name, "wall": round(wall, 6), "cpu": round(cpu, 6),
+                     "peakBytes": peak - live, "netBytes": current - live,
+                     "allocations": self._allocations(before)}
+            if profile is not None:
+                stats = pstats.Stats(profile)
+                entry["functions"], entry["modules"] = function_table(stats)
+                prefix = name.replace(";", ",").replace(" ", "_")
+                for stack, us in collapsed_stacks(stats, prefix).items():
+                    self.stacks[stack] = self.stacks.get(stack, 0) + us
+            self.phases.append(entry)
+
+    def _allocations(self, before):
+        diff = self._snapshot().compare_to(before, "lineno")
+        grown = sorted((d for d in diff if d.size_diff > 0), key=lambda d: d.size_diff, reverse=True)
+        return [
+            {"site": f"{_short(d.traceback[0].filename)}:{d.traceback[0].lineno}",
+             "bytes": d.size_diff, "count": d.count_diff}
+            for d in grown[:TOP_ALLOCATIONS]
+        ]
+
+    def write(self):
+        document = {
+            "format": FORMAT,
+            "script": os.path.basename(sys.argv[0]),
+            "argv": sys.argv[1:],
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "cprofile": self.cprofile,
+            "phases": self.phases,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        message = f"Profile: {os.path.relpath(self.path)}"
+        if self.stacks:
+            collapsed = os.path.splitext(self.path)[0] + ".collapsed"
+            with open(collapsed, "w", encoding="utf-8") as f:
+                for stack, us in sorted(self.stacks.items()):
+                    f.write(f"{stack} {us}\n")
+            message += f" (stacks: {os.path.relpath(collapsed)})"
+        print(message)
@@ -0,0 +1,88 @@
+"""
+Per-emotion wisdom records.
+
+Each emotion's wisdom for one locale (label, readMore, needs[].inquiry)
+becomes its own small record, so the client fetches only the emotion the
+user selects. Two layouts:
+
+  files   wisdom/{locale}/{id}.json — one file per record, CDN-cacheable
+          on its own.
+  packed  wisdom/{locale}.pack holding every record back to back, with
+          wisdom/{locale}.index.json mapping id → [byte offset, length]
+          for HTTP Range requests.
+"""
+import os
+
+from pipeline.emit import dumps, write_if_changed
+from pipeline.paths import DATA_DIR, LOCALES
+from pipeline.shards import emotion_wisdom
+
+RECORDS_DIR = "wisdom"
+LAYOUTS = ("files", "packed")
+
+
+def emotion_record(emotion, locale):
+    record = {"id": emotion.id, **emotion_wisdom(emotion, locale)}
+    record["needs"] = [{"needId": link.need_id, "inquiry": link.inquiry.resolve(locale)} for link in emotion.links]
+    return record
+
+
+def _prune(directory, keep):
+    """Delete build outputs in directory that this build no longer produces."""
+    if not os.path.isdir(directory):
+        return
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if name not in keep and os.path.isfile(path):
+            os.remove(path)
+
+
+def _write_files(model, root, locale):
+    locale_dir = os.path.join(root, locale)
+    names, written = set(), 0
+    for emotion in model.emotions:
+        name = f"{emotion.id}.json"
+        names.add(name)
+        written += write_if_changed(os.path.join(locale_dir, name), dumps(emotion_record(emotion, locale)))
+    _prune(locale_dir, names)
+    return written
+
+
+def _write_packed(model, root, locale):
+    parts, index, offset = [], {}, 0
+    for emotion in model.emotions:
+        blob = dumps(emotion_record(emotion, locale)) + b"\n"
+        index[emotion.id] = [offset, len(blob)]
+        parts.append(blob)
+        offset += len(blob)
+    written = write_if_changed(os.path.join(root, f"{locale}.pack"), b"".join(parts))
+    written += write_if_changed(os.path.join(root, f"{locale}.index.json"), dumps(index))
+    # A previous files build left {locale}/; drop it with its records
+    locale_dir = os.path.join(root, locale)
+    _prune(locale_dir, set())
+    if os.path.isdir(locale_dir) and not os.listdir(locale_dir):
+        os.rmdir(locale_dir)
+    return written
+
+
+def write_emotion_records(model, out_dir=DATA_DIR, locales=LOCALES, layout="files"):
+    """Write every (locale, emotion) record. Returns (manifest entry, files written)."""
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown record layout {layout!r}; expected one of {LAYOUTS}")
+    root = os.path.join(out_dir, RECORDS_DIR)
+    writer = _write_files if layout == "files" else _write_packed
+    written = sum(writer(model, root, locale) for locale in locales)
+
+    if layout == "files":
+        # Drop a previous packed build so the two layouts never coexist
+        _prune(root, set())
+        entry = {"layout": "files", "path": f"{RECORDS_DIR}/{{locale}}/{{id}}.json"}
+    else:
+        keep = {f"{loc}.pack" for loc in locales} | {f"{loc}.index.json" for loc in locales}
+        _prune(root, keep)
+        entry = {
+            "layout": "packed",
+            "pack": f"{RECORDS_DIR}/{{locale}}.pack",
+            "index": f"{RECORDS_DIR}/{{locale}}.index.json",
+        }
+    return entry, written
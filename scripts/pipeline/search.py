@@ -0,0 +1,218 @@
+"""
+Per-locale inverted search index over emotion labels and wisdom text.
+
+search/{locale}.json lets the client match "I feel stuck" to Trapped or
+Frustrated without shipping or scanning the full wisdom text. One document
+per emotion, built from its label and readMore essence/signal/reflection
+(English fallback resolved, as in the shards) plus the locale's own words
+for it in scripts/search-keywords.json, which supply the everyday terms
+("stuck", "scared") the wisdom text does not use. Keywords are never
+displayed, so a locale without its own list gets none rather than
+English ones.
+
+    {"locale": "en", "docs": ["anger", ...], "stopwords": ["and", ...],
+     "terms": {"stuck": [doc, weight, doc, weight, ...], ...}}
+
+Weights are BM25 (k1=1.2, b=0.75) with the label counted LABEL_BOOST
+times and the keywords KEYWORD_BOOST times, rounded to WEIGHT_DIGITS; a
+query scores each doc by summing the weights of its terms. Terms found in
+more than STOPWORD_DF of the documents ("is", "the", "que", Korean
+particle bigrams) say nothing about which emotion is meant but, with their
+high counts, outweighed the one word that did; they are left out of the
+postings and listed as "stopwords", which the client drops from queries,
+together with the locale's QUERY_STOPWORDS. query() scores like the client
+and SEARCH_CHECKS holds the queries search-emotions.py --check expects to
+rank, at least one per locale. Tokenization (mirrored in src/core/search-index.js):
+
+  - NFKC, lowercase; Arabic harakat/tatweel and Hebrew niqqud/cantillation
+    are dropped and Arabic alef/ya/ta-marbuta variants folded, so pointed
+    and unpointed RTL spellings match
+  - Han, kana and Hangul runs become overlapping character bigrams (a
+    one-character run stays a unigram), since zh/ja have no spaces and ko
+    words carry attached particles
+  - every other run of letters/digits is a word; one-letter words are
+    dropped
+"""
+import json
+import math
+import os
+import re
+import unicodedata
+from collections import Counter
+
+from pipeline.emit import dumps, is_production, write_if_changed
+from pipeline.paths import DATA_DIR, LOCALES, SEARCH_KEYWORDS_PATH
+
+SEARCH_DIR = "search"
+SEARCH_FIELDS = ("essence", "signal", "reflection")
+LABEL_BOOST = 3
+KEYWORD_BOOST = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+WEIGHT_DIGITS = 3
+STOPWORD_DF = 0.5
+# The last query word also matches longer terms (as-you-type), at a discount
+PREFIX_MIN = 3
+PREFIX_WEIGHT = 0.5
+
+# Words queries open with ("I feel", "je me sens") that the wisdom text uses
+# too rarely for STOPWORD_DF to catch, where one stray use outscores the
+# word that names the feeling; tokenized like the text
+QUERY_STOPWORDS = {
+    "en": "feel feeling felt really very",
+    "es": "me siento sentir estoy muy",
+    "ko": "너무 정말 느낌",
+    "zh": "我觉得 感觉 真的",
+    "ar": "أشعر أنني بأنني جدا",
+    "he": "אני מרגיש מרגישה מאוד",
+    "ja": "とても 感じる",
+    "fr": "je me sens sentir suis très",
+    "pt": "me sinto sentir estou muito",
+    "it": "mi sento sentire sono molto",
+    "de": "ich fühle mich fühlen bin sehr",
+}
+
+# (locale, query, emotion ids that must be its top results, in any order);
+# at least one per shipped locale
+SEARCH_CHECKS = (
+    ("en", "I feel stuck", ("trapped", "frustrated")),
+    ("es", "me siento atascado", ("trapped", "frustrated")),
+    ("ko", "너무 답답해요", ("trapped", "frustrated")),
+    ("zh", "我觉得被困住了", ("trapped", "frustrated")),
+    ("ar", "أشعر أنني عالق", ("trapped", "frustrated")),
+    ("he", "אני מרגיש תקוע", ("trapped", "frustrated")),
+    ("ja", "行き詰まっている", ("trapped", "frustrated")),
+    ("fr", "je me sens coincé", ("trapped", "frustrated")),
+    ("pt", "me sinto preso", ("trapped", "frustrated")),
+    ("it", "mi sento bloccato", ("trapped", "frustrated")),
+    ("de", "ich fühle mich festgefahren", ("trapped", "frustrated")),
+    ("de", "ich fühle mich gefangen", ("trapped",)),
+)
+
+_CJK = "\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_TOKEN_RE = re.compile(rf"([{_CJK}]+)|((?:(?![{_CJK}])[^\W_])+)")
+# Arabic harakat, superscript alef, tatweel; Hebrew cantillation and niqqud
+_MARKS_RE = re.compile("[\u064b-\u065f\u0670\u0640\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]")
+# Arabic hamza-carrying alefs → bare alef, alef maqsura → ya, ta marbuta → ha
+_FOLD = str.maketrans("\u0623\u0625\u0622\u0649\u0629", "\u0627\u0627\u0627\u064a\u0647")
+
+
+def tokenize(text):
+    text = _MARKS_RE.sub("", unicodedata.normalize("NFKC", text).lower()).translate(_FOLD)
+    tokens = []
+    for cjk, word in _TOKEN_RE.findall(text):
+        if cjk:
+            tokens.extend([cjk] if len(cjk) == 1 else [cjk[i:i + 2] for i in range(len(cjk) - 1)])
+        elif len(word) > 1:
+            tokens.append(word)
+    return tokens
+
+
+def load_keywords(path=SEARCH_KEYWORDS_PATH):
+    """{emotion id: {locale: space-separated search terms}}; {} if the file is absent."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _document(emotion, locale, keywords):
+    counts = Counter()
+    for _ in range(LABEL_BOOST):
+        counts.update(tokenize(emotion.label.resolve(locale, emotion.id)))
+    for fld, text in emotion.read_more.fields():
+        if fld in SEARCH_FIELDS:
+            counts.update(tokenize(text.resolve(locale)))
+    for _ in range(KEYWORD_BOOST):
+        counts.update(tokenize(keywords.get(emotion.id, {}).get(locale, "")))
+    return counts
+
+
+def search_index(model, locale, keywords=None):
+    keywords = load_keywords() if keywords is None else keywords
+    docs = [_document(e, locale, keywords) for e in model.emotions]
+    lengths = [sum(d.values()) for d in docs]
+    average = sum(lengths) / len(lengths) if lengths else 0
+    frequency = Counter(term for d in docs for term in d)
+    stopwords = {term for term, df in frequency.items() if df > STOPWORD_DF * len(docs)}
+    stopwords.update(tokenize(QUERY_STOPWORDS.get(locale, "")))
+
+    postings = {}
+    for i, (doc, length) in enumerate(zip(docs, lengths)):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average) if average else BM25_K1
+        for term, tf in doc.items():
+            if term in stopwords:
+                continue
+            idf = math.log(1 + (len(docs) - frequency[term] + 0.5) / (frequency[term] + 0.5))
+            weight = round(idf * tf * (BM25_K1 + 1) / (tf + norm), WEIGHT_DIGITS)
+            postings.setdefault(term, []).extend((i, weight))
+    return {
+        "locale": locale,
+        "docs": [e.id for e in model.emotions],
+        "stopwords": sorted(stopwords),
+        "terms": {term: postings[term] for term in sorted(postings)},
+    }
+
+
+def query(index, text, limit=5):
+    """[(emotion id, score)] best first, scored as searchEmotions() in search-index.js does."""
+    stopwords = set(index.get("stopwords", ()))
+    tokens = [token for token in tokenize(text) if token not in stopwords]
+    if not tokens:
+        return []
+    scores = Counter()
+
+    def add(term, factor):
+        postings = index["terms"].get(term, ())
+        for i in range(0, len(postings), 2):
+            scores[postings[i]] += postings[i + 1] * factor
+
+    for term in tokens:
+        add(term, 1)
+    last = tokens[-1]
+    if len(last) >= PREFIX_MIN:
+        for term in index["terms"]:
+            if term != last and term.startswith(last):
+                add(term, PREFIX_WEIGHT)
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(index["docs"][doc], score) for doc, score in ranked]
+
+
+def check_queries(indexes, checks=SEARCH_CHECKS):
+    """[(locale, query, expected ids, ranked ids)] for every check whose expected ids are not its top results."""
+    failures = []
+    for locale, text, expected in checks:
+        ranked = [emotion_id for emotion_id, _ in query(indexes[locale], text)]
+        if set(ranked[:len(expected)]) != set(expected):
+            failures.append((locale, text, expected, ranked))
+    return failures
+
+
+def _compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_index(index):
+    """Production: the usual compact form. Development: one term per line, so
+    diffs show which terms changed instead of thousands of lone numbers."""
+    if is_production():
+        return dumps(index)
+    terms = ",\n".join(f"    {_compact(term)}: {_compact(p)}" for term, p in index["terms"].items())
+    return (f'{{\n  "locale": {_compact(index["locale"])},\n  "docs": {_compact(index["docs"])},\n'
+            f'  "stopwords": {_compact(index["stopwords"])},\n'
+            f'  "terms": {{\n{terms}\n  }}\n}}').encode("utf-8")
+
+
+def search_path(locale, out_dir=DATA_DIR):
+    return os.path.join(out_dir, SEARCH_DIR, f"{locale}.json")
+
+
+def write_search_index(model, out_dir=DATA_DIR, locales=LOCALES):
+    """Write search/{locale}.json for every locale. Returns (manifest entry, files written)."""
+    keywords = load_keywords()
+    written = sum(
+        write_if_changed(search_path(locale, out_dir), dumps_index(search_index(model, locale, keywords)))
+        for locale in locales
+    )
+    return {"path": f"{SEARCH_DIR}/{{locale}}.json"}, written
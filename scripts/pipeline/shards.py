@@ -0,0 +1,60 @@
+"""
+Per-locale wisdom shards.
+
+wisdom-{locale}.json holds only what src/ui/wisdom-panel.js shows for one
+locale — label and readMore per emotion of the Model (model.py) — with
+the English fallback already resolved (pipeline/fallback.py), so the panel downloads one language instead of eleven.
+wisdom-manifest.json lists the shards with their size and content hash,
+and where the per-emotion records (records.py) and search indexes
+(search.py) live.
+"""
+import os
+
+from pipeline.emit import dumps, short_hash, write_if_changed
+from pipeline.fallback import FALLBACK_LOCALE
+from pipeline.paths import DATA_DIR, LOCALES
+
+MANIFEST_NAME = "wisdom-manifest.json"
+
+
+def emotion_wisdom(emotion, locale):
+    return {
+        "label": emotion.label.resolve(locale, emotion.id),
+        "readMore": {fld: text.resolve(locale) for fld, text in emotion.read_more.fields()},
+    }
+
+
+def wisdom_for_locale(model, locale):
+    return {
+        "locale": locale,
+        "emotions": {e.id: emotion_wisdom(e, locale) for e in model.emotions},
+    }
+
+
+def shard_name(locale):
+    return f"wisdom-{locale}.json"
+
+
+def write_locale_shards(model, out_dir=DATA_DIR, locales=LOCALES):
+    """Write one shard per locale. Returns (manifest entries by locale, files written)."""
+    entries, written = {}, 0
+    for locale in locales:
+        blob = dumps(wisdom_for_locale(model, locale))
+        written += write_if_changed(os.path.join(out_dir, shard_name(locale)), blob)
+        entries[locale] = {"file": shard_name(locale), "bytes": len(blob), "hash": short_hash(blob)}
+    return entries, written
+
+
+def write_manifest(model, shards, records=None, search=None, out_dir=DATA_DIR):
+    """Write wisdom-manifest.json. Returns True if it changed."""
+    manifest = {
+        "version": model.version,
+        "fallbackLocale": FALLBACK_LOCALE,
+        "emotions": len(model.emotions),
+        "locales": shards,
+    }
+    if records is not None:
+        manifest["records"] = records
+    if search is not None:
+        manifest["search"] = search
+    return write_if_changed(os.path.join(out_dir, MANIFEST_NAME), dumps(manifest))
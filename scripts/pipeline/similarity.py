@@ -0,0 +1,58 @@
+"""
+Related emotions by need profile.
+
+Each emotion is a vector of link strengths over the needs (link_matrix()).
+Cosine similarity between every pair ranks, for each emotion, the others
+whose needs and strengths look most like its own. Rows are processed in
+blocks of `block` emotions, so memory is block × emotions floats rather
+than emotions², and thousands of emotions stay cheap.
+
+Ties (common: every single-link emotion on one need has similarity 1 with
+the others) keep file order, so the output is reproducible.
+"""
+import numpy as np
+
+from pipeline.layout import link_matrix
+
+DEFAULT_K = 8
+SCORE_DIGITS = 6  # rounding before ranking, so float noise can't reorder ties
+TIE_EPSILON = 1e-6
+
+
+def unit_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1.0)
+
+
+def top_k_related(vectors, k=DEFAULT_K, block=256):
+    """For each row: [(column, similarity)] of its k most similar other rows, best first.
+
+    Rows with no similarity above 0 to anything get an empty list.
+    """
+    unit = unit_rows(np.asarray(vectors, dtype=float))
+    count = len(unit)
+    k = min(k, max(count - 1, 0))
+    related = []
+    for start in range(0, count, block):
+        stop = min(start + block, count)
+        scores = unit[start:stop] @ unit.T
+        scores[np.arange(stop - start), np.arange(start, stop)] = -np.inf  # never yourself
+        if k == 0:
+            related.extend([] for _ in range(stop - start))
+            continue
+        # k-th best score per row in O(n); only columns at or near it are ranked
+        kth = np.partition(scores, count - k, axis=1)[:, count - k]
+        candidates = (scores >= (kth - TIE_EPSILON)[:, None]) & (scores > 0)
+        for row, mask in zip(scores, candidates):
+            cols = np.flatnonzero(mask)
+            sims = np.round(row[cols], SCORE_DIGITS)
+            # Stable sort on -score: equal scores stay in column (file) order
+            keep = np.argsort(-sims, kind="stable")[:k]
+            related.append([(int(c), float(v)) for c, v in zip(cols[keep], sims[keep])])
+    return related
+
+
+def related_emotions(model, k=DEFAULT_K, block=256):
+    """{emotion id: [emotion indexes]} — the k emotions with the closest need profiles."""
+    ranked = top_k_related(link_matrix(model), k, block)
+    return {emotion.id: [i for i, _ in row] for emotion, row in zip(model.emotions, ranked)}
@@ -0,0 +1,109 @@
+"""
+Payload size attribution.
+
+Breaks the multilingual corpus down by field and by locale (compact UTF-8
+bytes of each string, raw and gzip-9), and lists every shipped artifact
+under public/data with its raw and gzip size, so it is obvious which
+strings dominate what users download.
+"""
+import glob
+import gzip
+import json
+import os
+
+from pipeline.master import localized_cells
+from pipeline.model import Model
+from pipeline.paths import DATA_DIR, LOCALES
+
+EMOTION_FIELDS = ("label", "readMore.essence", "readMore.signal", "readMore.reflection",
+                  "readMore.bookRef", "inquiry")
+NEED_FIELDS = ("need.label", "need.description")
+STRUCTURE = "structure"
+SIDECAR_EXTS = (".gz", ".br")  # written by compress-data.py
+
+ARTIFACT_GROUPS = (
+    ("master", "emotion-constellation-more-info-data.json"),
+    ("constellation-*", "constellation-??.json"),
+    ("constellation graph", "constellation-graph.json"),
+    ("wisdom shards", "wisdom-??.json"),
+    ("wisdom manifest", "wisdom-manifest.json"),
+    ("layout presets", "layout-presets.json"),
+    ("wisdom records", os.path.join("wisdom", "**", "*.*")),
+    ("search index", os.path.join("search", "*.json")),
+)
+
+
+def gz_len(blob):
+    return len(gzip.compress(blob, compresslevel=9, mtime=0))
+
+
+def _encoded(text):
+    return json.dumps(text, ensure_ascii=False).encode("utf-8")
+
+
+# Report field per patch target kind; readMore cells report as "readMore.<field>"
+_KIND_FIELDS = {"needLabel": "need.label", "needDescription": "need.description", "label": "label",
+                "inquiry": "inquiry"}
+
+
+def field_breakdown(data):
+    """{field: {locale: [encoded strings]}} over every localized string."""
+    table = {}
+    for _, (kind, _, key), text in localized_cells(Model.from_document(data)):
+        fld = f"readMore.{key}" if kind == "readMore" else _KIND_FIELDS[kind]
+        for loc, value in text.items():
+            table.setdefault(fld, {}).setdefault(loc, []).append(_encoded(value))
+    return table
+
+
+def _row(name, parts, total):
+    raw = sum(len(p) for p in parts)
+    gz = gz_len(b"".join(parts)) if parts else 0
+    share = 100 * raw / total if total else 0
+    return f"  {name:<22} {raw:>10,} {gz:>10,} {share:>6.1f}%"
+
+
+def corpus_report(data):
+    compact = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    total = len(compact)
+    table = field_breakdown(data)
+    header = f"  {'':<22} {'raw B':>10} {'gzip B':>10} {'share':>7}"
+
+    lines = [f"Corpus (compact master, {total:,} B raw, {gz_len(compact):,} B gzip)", "", "By field:", header]
+    attributed = 0
+    known = EMOTION_FIELDS + NEED_FIELDS
+    fields = [fld for fld in known + tuple(sorted(set(table) - set(known))) if fld in table]
+    for fld in fields:
+        parts = [p for loc in table[fld] for p in table[fld][loc]]
+        attributed += sum(len(p) for p in parts)
+        lines.append(_row(fld, parts, total))
+    lines.append(f"  {STRUCTURE:<22} {total - attributed:>10,} {'':>10} {100 * (total - attributed) / total:>6.1f}%")
+
+    lines += ["", "By locale:", header]
+    locales = LOCALES + sorted({loc for cells in table.values() for loc in cells} - set(LOCALES))
+    for loc in locales:
+        parts = [p for fld in fields for p in table[fld].get(loc, [])]
+        if parts:
+            lines.append(_row(loc, parts, total))
+    return "\n".join(lines)
+
+
+def artifact_report(out_dir=DATA_DIR):
+    lines = ["Shipped artifacts:", f"  {'':<22} {'files':>6} {'raw B':>10} {'gzip B':>10} {'ratio':>6}"]
+    for name, pattern in ARTIFACT_GROUPS:
+        paths = [p for p in glob.glob(os.path.join(out_dir, pattern), recursive=True)
+                 if os.path.isfile(p) and not p.endswith(SIDECAR_EXTS)]
+        if not paths:
+            continue
+        raw = gz = 0
+        for path in paths:
+            with open(path, "rb") as f:
+                blob = f.read()
+            raw += len(blob)
+            gz += gz_len(blob)
+        lines.append(f"  {name:<22} {len(paths):>6} {raw:>10,} {gz:>10,} {raw / gz if gz else 0:>5.1f}x")
+    return "\n".join(lines)
+
+
+def size_report(data, out_dir=DATA_DIR):
+    return corpus_report(data) + "\n\n" + artifact_report(out_dir)
@@ -0,0 +1,193 @@
+"""
+Normalized SQLite export of the master for server-side lookups.
+
+The chat backend and analytics jobs can open one indexed file instead of
+parsing the multilingual JSON on every cold start:
+
+    locales   (code PK, position)
+    needs     (id PK, position, color, color_secondary)
+    emotions  (id PK, position)
+    links     (emotion_id, position PK; need_id, strength)   index on need_id
+    strings   (id PK; emotion_id, need_id, field, locale, text)
+    meta      (key PK, value)   version, source, sourceUrl
+    wisdom_fts                  FTS5 over label + essence/signal/reflection
+
+A string belongs to an emotion (need_id NULL: label, essence, signal,
+reflection, bookRef), a need (emotion_id NULL: label, description) or a
+link (both set: inquiry). Only strings present in the master are stored;
+a reader falls back to locale 'en' as the client does, e.g.
+
+    SELECT text FROM strings
+    WHERE emotion_id = ? AND need_id IS NULL AND field = ? AND locale IN (?, 'en')
+    ORDER BY locale = 'en' LIMIT 1
+
+wisdom_fts is contentless (rowid = strings.id) and indexes the tokens of
+pipeline.search.tokenize — CJK bigrams, folded Arabic/Hebrew — since
+FTS5's own unicode61 tokenizer treats a whole zh/ja sentence as one word.
+Queries must go through the same tokenizer; fts_query() builds the MATCH
+expression.
+
+The file is built beside the target and renamed over it, so a reader
+never sees a half-written database.
+"""
+import os
+import sqlite3
+
+from pipeline.master import localized_cells
+from pipeline.paths import LOCALES
+from pipeline.search import SEARCH_FIELDS, tokenize
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID;
+CREATE TABLE locales (code TEXT PRIMARY KEY, position INTEGER NOT NULL UNIQUE) WITHOUT ROWID;
+CREATE TABLE needs (
+    id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL UNIQUE,
+    color TEXT,
+    color_secondary TEXT
+) WITHOUT ROWID;
+CREATE TABLE emotions (id TEXT PRIMARY KEY, position INTEGER NOT NULL UNIQUE) WITHOUT ROWID;
+CREATE TABLE links (
+    emotion_id TEXT NOT NULL REFERENCES emotions(id),
+    position INTEGER NOT NULL,
+    need_id TEXT NOT NULL REFERENCES needs(id),
+    strength REAL NOT NULL,
+    PRIMARY KEY (emotion_id, position)
+) WITHOUT ROWID;
+CREATE INDEX links_by_need ON links(need_id, emotion_id);
+CREATE TABLE strings (
+    id INTEGER PRIMARY KEY,
+    emotion_id TEXT REFERENCES emotions(id),
+    need_id TEXT REFERENCES needs(id),
+    field TEXT NOT NULL,
+    locale TEXT NOT NULL REFERENCES locales(code),
+    text TEXT NOT NULL
+);
+CREATE INDEX strings_by_emotion ON strings(emotion_id, need_id, field, locale);
+CREATE INDEX strings_by_need ON strings(need_id, emotion_id, field, locale);
+CREATE VIRTUAL TABLE wisdom_fts USING fts5(terms, content='', tokenize='unicode61 remove_diacritics 0');
+"""
+
+# Emotion fields indexed in wisdom_fts
+FTS_FIELDS = ("label",) + SEARCH_FIELDS
+
+
+def _strings(model):
+    """(emotion_id, need_id, field, locale, text) for every stored string, in master order."""
+    for name, _, text in localized_cells(model):
+        # need/<id>/<field>, emotion/<id>/<field> or emotion/<id>/inquiry/<needId>
+        kind, rid, field, *link = name.split("/")
+        ids = (None, rid) if kind == "need" else (rid, link[0] if link else None)
+        for locale, value in text.items():
+            yield (*ids, field, locale, value)
+
+
+def _populate(db, model):
+    db.executemany("INSERT INTO meta VALUES (?, ?)", [
+        ("version", model.version), ("source", model.source), ("sourceUrl", model.source_url),
+    ])
+    db.executemany("INSERT INTO locales VALUES (?, ?)", [(loc, i) for i, loc in enumerate(LOCALES)])
+    db.executemany("INSERT INTO needs VALUES (?, ?, ?, ?)", [
+        (n.id, i, n.color, n.color_secondary) for i, n in enumerate(model.needs)
+    ])
+    db.executemany("INSERT INTO emotions VALUES (?, ?)", [(e.id, i) for i, e in enumerate(model.emotions)])
+    db.executemany("INSERT INTO links VALUES (?, ?, ?, ?)", [
+        (e.id, i, link.need_id, link.strength) for e in model.emotions for i, link in enumerate(e.links)
+    ])
+
+    rows = list(enumerate(_strings(model), 1))
+    db.executemany("INSERT INTO strings VALUES (?, ?, ?, ?, ?, ?)", [(i, *row) for i, row in rows])
+    db.executemany("INSERT INTO wisdom_fts (rowid, terms) VALUES (?, ?)", [
+        (i, " ".join(tokenize(text)))
+        for i, (emotion_id, need_id, field, _, text) in rows
+        if emotion_id is not None and need_id is None and field in FTS_FIELDS
+    ])
+    db.execute("INSERT INTO wisdom_fts (wisdom_fts) VALUES ('optimize')")
+    return len(rows)
+
+
+def export_sqlite(model, path):
+    """Write the model to a fresh SQLite file at path. Returns the number of strings."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    db = sqlite3.connect(tmp)
+    try:
+        db.execute("PRAGMA journal_mode = OFF")
+        db.execute("PRAGMA synchronous = OFF")
+        with db:
+            db.executescript(SCHEMA)
+            count = _populate(db, model)
+            db.execute("ANALYZE")
+        db.execute("VACUUM")
+    finally:
+        db.close()
+    os.replace(tmp, path)
+    return count
+
+
+def fts_query(text):
+    """MATCH expression for free text: any of its tokens, each quoted. None if it has none."""
+    tokens = dict.fromkeys(tokenize(text))
+    return " OR ".join(f'"{t}"' for t in tokens) or None
+
+
+def search(db, text, locale, limit=5):
+    """[(emotion_id, score)] best first; score is the best FTS5 rank (bm25, lower is better)
+    among the emotion's strings in that locale."""
+    match = fts_query(text)
+    if match is None:
+        return []
+    return db.execute(
+        """SELECT s.emotion_id, min(wisdom_fts.rank) AS best
+           FROM wisdom_fts JOIN strings s ON s.id = wisdom_fts.rowid
+           WHERE wisdom_fts MATCH ? AND s.locale = ?
+           GROUP BY s.emotion_id ORDER BY best, s.emotion_id LIMIT ?""",
+        (match, locale, limit),
+    ).fetchall()
+
+
+def _text(db, emotion_id, need_id, field, locale):
+    row = db.execute(
+        """SELECT text FROM strings
+           WHERE emotion_id IS ? AND need_id IS ? AND field = ? AND locale IN (?, 'en')
+           ORDER BY locale = 'en' LIMIT 1""",
+        (emotion_id, need_id, field, locale),
+    ).fetchone()
+    return row[0] if row else ""
+
+
+def emotion_context(db, emotion_id, locale):
+    """The emotionContext payload of buildEmotionContextPayload() (src/chat/chat-client.js),
+    rebuilt from the database. None for an unknown emotion."""
+    if db.execute("SELECT 1 FROM emotions WHERE id = ?", (emotion_id,)).fetchone() is None:
+        return None
+    links = db.execute(
+        "SELECT need_id, strength FROM links WHERE emotion_id = ? ORDER BY position", (emotion_id,)
+    ).fetchall()
+    inquiries, fellows = [], {}
+    for need_id, strength in links:
+        inquiries.append({
+            "needId": need_id,
+            "needLabel": _text(db, None, need_id, "label", locale),
+            "inquiry": _text(db, emotion_id, need_id, "inquiry", locale),
+            "strength": strength,
+        })
+        labels = [
+            _text(db, other, None, "label", locale) or other
+            for (other,) in db.execute(
+                """SELECT DISTINCT l.emotion_id FROM links l JOIN emotions e ON e.id = l.emotion_id
+                   WHERE l.need_id = ? AND l.emotion_id != ? ORDER BY e.position""",
+                (need_id, emotion_id),
+            )
+        ]
+        if labels:
+            fellows[need_id] = labels
+    return {
+        "label": _text(db, emotion_id, None, "label", locale) or emotion_id,
+        "inquiries": inquiries,
+        "fellowMessengersPerNeed": fellows,
+        "wisdomEssence": _text(db, emotion_id, None, "essence", locale),
+        "wisdomSignal": _text(db, emotion_id, None, "signal", locale),
+    }
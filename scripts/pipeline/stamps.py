@@ -0,0 +1,112 @@
+"""
+Source-hash stamps: which translations were made from the current English.
+
+scripts/translation-stamps.json keeps, for every translated string of the
+master, a short hash of the English source it was translated from and of
+the translation itself ("<source>:<text>", 8 hex digits each). The shipped
+JSON carries none of this.
+
+update_stamps() walks the master once and, per (cell, locale):
+
+  * no stamp yet            stamp against the current English (first
+                            sighting is trusted, so adopting stamps on an
+                            existing master marks nothing stale)
+  * translation text changed  someone retranslated it: restamp against the
+                            current English
+  * accepted                reviewed (or retranslated to the same text) and
+                            still right for the current English: restamp
+  * otherwise               keep the stamp, so an English edit leaves every
+                            untouched translation with an old source hash
+
+and returns the cells whose stamped source hash differs from the current
+English: exactly the translations to redo. Re-applying an old batch
+script's strings doesn't change the text hash, so it can't hide an edit;
+a translation that needs no change after one (a bookRef equal to the
+English, a reviewed string) is cleared by accepting it, with
+stale-translations.py --accept or by machine-translate.py --apply for the
+cells it wrote.
+
+Stamps are keyed by the cell names of master.localized_cells(), which
+carry ids rather than positions, so reordering links or records keeps
+their stamps.
+"""
+import hashlib
+import json
+import os
+
+from pipeline.emit import write_if_changed
+from pipeline.master import localized_cells
+from pipeline.memory import SOURCE_LOCALE, normalize
+from pipeline.paths import STAMPS_PATH, TRANSLATED_LOCALES
+
+FORMAT = "source-stamps/1"
+HASH_DIGITS = 8
+
+
+def short_hash(text):
+    return hashlib.sha256(normalize(text).encode("utf-8")).hexdigest()[:HASH_DIGITS]
+
+
+def update_stamps(model, previous, locales=TRANSLATED_LOCALES, accept=()):
+    """One pass over the master. Returns (stamps, stale).
+
+    stamps  {cell name: {locale: "source:text"}} for every translated string
+    stale   [(cell name, target, locale)] translations of an older English text
+
+    accept holds (cell name, locale) pairs to restamp against the current
+    English whatever their stamp says.
+    """
+    stamps, stale = {}, []
+    for name, target, cell in localized_cells(model):
+        english = cell.get(SOURCE_LOCALE)
+        if not english:
+            continue
+        source = short_hash(english)
+        before = previous.get(name, {})
+        current = {}
+        for locale in locales:
+            text = cell.get(locale)
+            if not text:
+                continue
+            digest = short_hash(text)
+            old = before.get(locale)
+            if old is None or old.partition(":")[2] != digest or (name, locale) in accept:
+                old = f"{source}:{digest}"
+            current[locale] = old
+            if old.partition(":")[0] != source:
+                stale.append((name, target, locale))
+        if current:
+            stamps[name] = current
+    return stamps, stale
+
+
+def load_stamps(path=STAMPS_PATH):
+    """{cell name: {locale: stamp}}; empty when the sidecar doesn't exist yet."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("format") != FORMAT:
+        raise ValueError(f"{path}: expected format {FORMAT!r}, got {document.get('format')!r}")
+    return document["stamps"]
+
+
+def write_stamps(stamps, path=STAMPS_PATH):
+    """Write one cell per line, in master order. Returns True if the file changed."""
+    lines = ",\n".join(
+        f"    {json.dumps(name)}: {json.dumps(by_locale, separators=(', ', ': '))}"
+        for name, by_locale in stamps.items()
+    )
+    blob = f'{{"format": "{FORMAT}", "stamps": {{\n{lines}\n}}}}\n'
+    return write_if_changed(path, blob.encode("utf-8"))
+
+
+def refresh_stamps(model, path=STAMPS_PATH, accept=()):
+    """Update and write the sidecar for a master. Returns (stale, written)."""
+    stamps, stale = update_stamps(model, load_stamps(path), accept=accept)
+    return stale, write_stamps(stamps, path)
+
+
+def cell_names(model):
+    """{target: cell name}, to stamp cells written through a MasterIndex."""
+    return {target: name for name, target, _ in localized_cells(model)}
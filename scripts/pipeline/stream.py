@@ -0,0 +1,205 @@
+"""
+Streaming reader and writer for the master document.
+
+MasterReader parses the top level incrementally and hands out the
+`emotions` array one record at a time; MasterWriter emits records as they
+come. Peak memory is one emotion plus the small head (version, needs, …)
+instead of the whole corpus. Output is byte-identical to write_master().
+
+    with MasterReader(src) as reader, MasterWriter(dst, reader.head) as writer:
+        for emotion in reader.emotions():
+            writer.write_emotion(emotion)
+        writer.tail = reader.tail
+"""
+import json
+import os
+import shutil
+import tempfile
+
+from pipeline.master import assign_record
+from pipeline.paths import MASTER_PATH
+
+STREAM_KEY = "emotions"
+CHUNK = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+
+class MasterReader:
+    def __init__(self, path=MASTER_PATH):
+        self.path = path
+        self.head = {}   # members before "emotions"
+        self.tail = {}   # members after it, filled once emotions() is exhausted
+        self._f = None
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def __enter__(self):
+        self._f = open(self.path, "r", encoding="utf-8")
+        self._expect("{")
+        self._read_members(self.head, stop_at=STREAM_KEY)
+        return self
+
+    def __exit__(self, *exc):
+        self._f.close()
+
+    # ─── Buffer management ───
+
+    def _fill(self):
+        if self._eof:
+            return False
+        chunk = self._f.read(CHUNK)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError(f"{self.path}: unexpected end of file")
+
+    def _expect(self, ch):
+        if self._peek() != ch:
+            raise ValueError(f"{self.path}: expected {ch!r}, found {self._buf[self._pos]!r}")
+        self._pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number can decode "successfully" while cut off by the buffer edge
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    # ─── Structure ───
+
+    def _read_members(self, into, stop_at=None):
+        """Read `"key": value` pairs until `}` or until stop_at's array opens."""
+        if self._peek() == "}":
+            self._pos += 1
+            return False
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == stop_at:
+                self._expect("[")
+                return True
+            into[key] = self._value()
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("}")
+            return False
+
+    def emotions(self):
+        """Yield each emotion record, then read any members that follow."""
+        if self._peek() != "]":
+            while True:
+                yield self._value()
+                if self._peek() == ",":
+                    self._pos += 1
+                    continue
+                break
+        self._expect("]")
+        if self._peek() == ",":
+            self._pos += 1
+            self._read_members(self.tail)
+        else:
+            self._expect("}")
+
+
+def _dump(value, level):
+    """json.dump(indent=2) output for a value nested `level` deep."""
+    text = json.dumps(value, ensure_ascii=False, indent=2)
+    return text.replace("\n", "\n" + "  " * level)
+
+
+class MasterWriter:
+    """Writes to a temp file next to `path` and swaps it in on success,
+    so reading and writing the same master file is safe. path=None
+    discards the output (dry runs)."""
+
+    def __init__(self, path=MASTER_PATH, head=None):
+        self.path = path
+        self.head = head or {}
+        self.tail = {}
+        self._f = None
+        self._tmp = None
+        self.count = 0
+
+    def __enter__(self):
+        if self.path is None:
+            self._f = open(os.devnull, "w", encoding="utf-8")
+            return self._write_head()
+        fd, self._tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), suffix=".tmp")
+        if os.path.exists(self.path):
+            shutil.copymode(self.path, self._tmp)
+        else:
+            os.chmod(self._tmp, 0o644)
+        self._f = os.fdopen(fd, "w", encoding="utf-8")
+        return self._write_head()
+
+    def _write_head(self):
+        self._f.write("{")
+        for key, value in self.head.items():
+            self._f.write(f"\n  {json.dumps(key, ensure_ascii=False)}: {_dump(value, 1)},")
+        self._f.write(f"\n  {json.dumps(STREAM_KEY)}: [")
+        return self
+
+    def write_emotion(self, emotion):
+        self._f.write(("," if self.count else "") + "\n    " + _dump(emotion, 2))
+        self.count += 1
+
+    def __exit__(self, exc_type, *exc):
+        try:
+            if exc_type is None:
+                self._f.write("\n  ]" if self.count else "]")
+                for key, value in self.tail.items():
+                    self._f.write(f",\n  {json.dumps(key, ensure_ascii=False)}: {_dump(value, 1)}")
+                self._f.write("\n}")
+        finally:
+            self._f.close()
+        if self._tmp is None:
+            return
+        if exc_type is None:
+            os.replace(self._tmp, self.path)
+        else:
+            os.remove(self._tmp)
+
+
+def stream_apply(units, src=MASTER_PATH, dst=MASTER_PATH):
+    """Apply grouped patches ({unit: [(locales, target, texts), ...]}, see
+    cache.group_patches) one record at a time. Returns the emotion count.
+    dst=None applies without writing."""
+    pending = dict(units)
+
+    def patch(kind, record):
+        for locales, target, texts in pending.pop((kind, record["id"]), ()):
+            assign_record(record, target, locales, texts)
+
+    with MasterReader(src) as reader:
+        for need in reader.head.get("needs", []):
+            patch("need", need)
+        with MasterWriter(dst, reader.head) as writer:
+            for emotion in reader.emotions():
+                patch("emotion", emotion)
+                writer.write_emotion(emotion)
+            writer.tail = reader.tail
+            if pending:
+                raise KeyError(f"Patches target unknown records: {sorted(pending)}")
+            return writer.count
@@ -0,0 +1,89 @@
+"""
+Synthetic masters for scale runs.
+
+synthetic_master() returns a document shaped exactly like the real master:
+the same needs, and emotions cycled from the real ones up to `emotions`
+(copies get ids suffixed -1, -2, ...). A copy's strings are its
+original's with the words (characters, for text without spaces) shuffled
+by a generator seeded with the copy's id, so every copy brings distinct
+text of the same length and script. That keeps translation-memory lookups,
+search postings and the glyph scan from seeing the same few hundred
+strings over and over. With `locales` above the real 11, extra locales
+take ISO 639 private-use codes (qaa, qab, ...) and every localized cell
+gets a pseudo-translation for them, "<en> [qaa]", so per-locale stages
+see as many strings as a real locale would bring. The extra codes get Text
+slots (model.add_locales), so the document also loads as a Model.
+
+This is the one generator for scale runs: bench-pipeline.py and
+bench-stream.py use the document, and sweep-physics.py loads it with
+Model.from_document().
+"""
+import copy
+import itertools
+import random
+import string
+
+from pipeline.model import add_locales
+from pipeline.paths import LOCALES
+
+SOURCE_LOCALE = "en"
+
+
+def synthetic_locales(count):
+    """LOCALES followed by private-use codes qaa..qtz, count in total."""
+    if count <= len(LOCALES):
+        return LOCALES[:count]
+    extra = ("q" + a + b for a, b in itertools.product(string.ascii_lowercase[:20], string.ascii_lowercase))
+    return LOCALES + list(itertools.islice(extra, count - len(LOCALES)))
+
+
+def _cells(record, is_need):
+    yield record["label"]
+    if is_need:
+        yield record["description"]
+        return
+    for link in record.get("needs", []):
+        yield link["inquiry"]
+    yield from (record.get("readMore") or {}).values()
+
+
+def _shuffled(text, rng):
+    """text with its words (or, without spaces, its characters) in a random order."""
+    words = text.split(" ")
+    parts = words if len(words) > 1 else list(text)
+    rng.shuffle(parts)
+    return (" " if len(words) > 1 else "").join(parts)
+
+
+def _vary(emotion):
+    rng = random.Random(emotion["id"])
+    for cell in _cells(emotion, False):
+        for locale, text in cell.items():
+            cell[locale] = _shuffled(text, rng)
+
+
+def _add_locales(record, is_need, locales):
+    for cell in _cells(record, is_need):
+        source = cell.get(SOURCE_LOCALE, "")
+        for locale in locales:
+            cell[locale] = f"{source} [{locale}]"
+
+
+def synthetic_master(base, emotions, locales=len(LOCALES)):
+    """The base document scaled to `emotions` emotions and `locales` locales."""
+    extra = synthetic_locales(locales)[len(LOCALES):]
+    add_locales(extra)
+    data = {k: copy.deepcopy(v) for k, v in base.items() if k != "emotions"}
+    for need in data["needs"]:
+        _add_locales(need, True, extra)
+
+    originals = base["emotions"]
+    data["emotions"] = []
+    for i in range(emotions):
+        emotion = copy.deepcopy(originals[i % len(originals)])
+        if i >= len(originals):
+            emotion["id"] = f"{emotion['id']}-{i // len(originals)}"
+            _vary(emotion)
+        _add_locales(emotion, False, extra)
+        data["emotions"].append(emotion)
+    return data
@@ -0,0 +1,34 @@
+"""Wall-clock timing for build phases.
+
+Set PIPELINE_PROFILE to also profile every phase (CPU time, allocations,
+optionally cProfile) into a JSON trace; see pipeline/profiling.py.
+"""
+import time
+from contextlib import contextmanager
+
+from pipeline.profiling import Profiler
+
+
+class PhaseTimer:
+    def __init__(self, profiler=None):
+        self.phases = []
+        self.profiler = profiler if profiler is not None else Profiler.from_env()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            if self.profiler is None:
+                yield
+            else:
+                with self.profiler.phase(name):
+                    yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self):
+        width = max((len(name) for name, _ in self.phases), default=0)
+        total = sum(sec for _, sec in self.phases)
+        lines = [f"  {name:<{width}}  {sec * 1000:8.1f} ms" for name, sec in self.phases]
+        lines.append(f"  {'total':<{width}}  {total * 1000:8.1f} ms")
+        return "\n".join(lines)
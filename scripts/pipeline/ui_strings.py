@@ -0,0 +1,170 @@
+"""
+The UI text of src/core/ui-strings.source.js and src/core/locale.js, read from Python.
+
+ui-strings.source.js holds `const strings = { en: {...}, es: {...}, ... };`,
+an object literal of nested objects with identifier keys and quoted string
+values. read_ui_strings() tokenizes just that literal (comments, '...' and
+"..." strings with their JS escapes) rather than evaluating the file, and
+flatten() turns a locale into {"welcome.greeting": text}, the key paths
+t() is called with.
+
+The runtime never sees the nested table. write_ui_chunks() emits what
+src/core/ui-strings.js serves: English as a flat object in
+src/core/ui-strings-en.js, bundled so t() always has a fallback, and every
+other locale as public/data/ui-strings/{locale}.json, fetched when that
+locale is chosen. Chunks are complete: a key the locale lacks is filled
+along its fallback chain (pipeline/fallback.py) at build time, so t() is a
+single property read. missing_keys() lists the gaps in the source table.
+"""
+import json
+import os
+import re
+
+from pipeline.emit import dumps, write_if_changed
+from pipeline.fallback import FALLBACK_LOCALE, resolve_cell
+from pipeline.paths import LOCALE_JS_PATH, LOCALES, UI_CHUNK_DIR, UI_FALLBACK_PATH, UI_STRINGS_PATH
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}:,])
+""", re.VERBOSE | re.DOTALL)
+
+_ESCAPE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)", re.DOTALL)
+_SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0", "\n": ""}
+
+_NATIVE_LABEL_RE = re.compile(r"\{\s*code:\s*'([\w-]+)'[^}]*?nativeLabel:\s*'([^']*)'")
+
+
+def js_string(literal):
+    """The value of a quoted JS string literal."""
+    def unescape(match):
+        esc = match.group(1)
+        if esc[0] == "u":
+            return chr(int(esc[1:].strip("{}"), 16))
+        if esc[0] == "x":
+            return chr(int(esc[1:], 16))
+        return _SIMPLE_ESCAPES.get(esc, esc)
+    text = _ESCAPE.sub(unescape, literal[1:-1])
+    # \ud83d\ude00 pairs come out as two surrogates; join them
+    return text.encode("utf-16", "surrogatepass").decode("utf-16")
+
+
+def _tokens(source, pos):
+    while pos < len(source):
+        match = _TOKEN.match(source, pos)
+        if match is None:
+            raise ValueError(f"Unexpected {source[pos:pos + 20]!r} at offset {pos}")
+        pos = match.end()
+        if match.lastgroup != "space":
+            yield match.lastgroup, match.group()
+
+
+def _parse_object(tokens):
+    obj = {}
+    for kind, text in tokens:
+        if text == "}":
+            return obj
+        if text == ",":
+            continue
+        if kind not in ("name", "string"):
+            raise ValueError(f"Expected a key, got {text!r}")
+        key = js_string(text) if kind == "string" else text
+        if next(tokens)[1] != ":":
+            raise ValueError(f"Expected ':' after {key!r}")
+        kind, value = next(tokens)
+        if value == "{":
+            obj[key] = _parse_object(tokens)
+        elif kind == "string":
+            obj[key] = js_string(value)
+        else:
+            raise ValueError(f"Unsupported value {value!r} for {key!r}")
+    raise ValueError("Unterminated object literal")
+
+
+def parse_js_object(source, name):
+    """The object literal assigned by `const NAME = {...}` in a JS source."""
+    match = re.search(r"\bconst\s+" + re.escape(name) + r"\s*=\s*\{", source)
+    if match is None:
+        raise KeyError(f"const {name} not found")
+    return _parse_object(_tokens(source, match.end()))
+
+
+def read_ui_strings(path=UI_STRINGS_PATH):
+    """{locale: nested strings} as written in ui-strings.js."""
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_js_object(f.read(), "strings")
+
+
+def flatten(obj, prefix=""):
+    """{"dot.separated.path": text} for every string in a nested table."""
+    flat = {}
+    for key, value in obj.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, path + "."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def native_labels(path=LOCALE_JS_PATH):
+    """{code: nativeLabel} from SUPPORTED_LOCALES; the language menu shows all of them in every locale."""
+    with open(path, "r", encoding="utf-8") as f:
+        return dict(_NATIVE_LABEL_RE.findall(f.read()))
+
+
+def missing_keys(table):
+    """{locale: (keys English has that the locale lacks, keys only the locale has)}, for locales with either."""
+    reference = flatten(table[FALLBACK_LOCALE])
+    report = {}
+    for locale, strings in table.items():
+        flat = flatten(strings)
+        missing = [key for key in reference if not flat.get(key)]
+        extra = [key for key in flat if key not in reference]
+        if missing or extra:
+            report[locale] = (missing, extra)
+    return report
+
+
+def ui_cells(table):
+    """(key, {locale: text}) for every English key, like a master cell."""
+    flats = {locale: flatten(strings) for locale, strings in table.items()}
+    for key in flats[FALLBACK_LOCALE]:
+        yield key, {locale: flat[key] for locale, flat in flats.items() if key in flat}
+
+
+def resolved_ui_strings(table, locale):
+    """{key: text} for every English key, each resolved along the locale's fallback chain."""
+    return {key: resolve_cell(cell, locale)[0] for key, cell in ui_cells(table)}
+
+
+def fallback_module(flat):
+    """src/core/ui-strings-en.js: the English strings as one flat object literal."""
+    lines = [
+        "// Generated by scripts/build-ui-strings.py from ui-strings.source.js. Do not edit.",
+        "",
+        "export default {",
+    ]
+    lines += [f"  {json.dumps(key)}: {json.dumps(text, ensure_ascii=False)}," for key, text in flat.items()]
+    lines += ["};", ""]
+    return "\n".join(lines).encode("utf-8")
+
+
+def write_ui_chunks(table, locales=LOCALES, out_dir=UI_CHUNK_DIR, fallback_path=UI_FALLBACK_PATH):
+    """Write the inlined English module and one complete flat chunk per other locale.
+
+    Returns ({locale: bytes}, files written).
+    """
+    sizes, written = {}, 0
+    blob = fallback_module(flatten(table[FALLBACK_LOCALE]))
+    written += write_if_changed(fallback_path, blob)
+    sizes[FALLBACK_LOCALE] = len(blob)
+    for locale in locales:
+        if locale == FALLBACK_LOCALE:
+            continue
+        blob = dumps(resolved_ui_strings(table, locale))
+        written += write_if_changed(os.path.join(out_dir, f"{locale}.json"), blob)
+        sizes[locale] = len(blob)
+    return sizes, written
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Rank emotions for a free-text query against the built search indexes.
+
+Reads public/data/search/{locale}.json (written by build-wisdom.py) and
+scores the query as src/core/search-index.js does — stopwords dropped,
+BM25 weights summed, the last word also matched as a prefix — so ranking
+changes from edits to the wisdom text or scripts/search-keywords.json can
+be tried without the browser. --check runs SEARCH_CHECKS from
+pipeline/search.py instead and exits 1 if any query no longer ranks its
+expected emotions first; rebuild the indexes before checking.
+
+Usage:
+    python scripts/search-emotions.py [--locale CODE] [--limit N] QUERY...
+    python scripts/search-emotions.py --check
+"""
+import argparse
+import json
+import os
+import sys
+
+from pipeline.paths import LOCALES
+from pipeline.search import SEARCH_CHECKS, check_queries, query, search_path
+
+
+def load_index(locale):
+    with open(search_path(locale), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("query", nargs="*", help="free text, e.g. I feel stuck")
+    parser.add_argument("--locale", default="en", choices=LOCALES)
+    parser.add_argument("--limit", type=int, default=5, help="results to show (default 5)")
+    parser.add_argument("--check", action="store_true", help="run the expected-ranking checks")
+    args = parser.parse_args(argv)
+    if not args.check and not args.query:
+        parser.error("give a query or --check")
+
+    if args.check:
+        indexes = {locale: load_index(locale) for locale in dict.fromkeys(c[0] for c in SEARCH_CHECKS)}
+        failures = check_queries(indexes)
+        for locale, text, expected, ranked in failures:
+            print(f"  {locale} {text!r}: expected {', '.join(expected)} first, got {', '.join(ranked) or 'nothing'}")
+        print(f"{len(SEARCH_CHECKS) - len(failures)}/{len(SEARCH_CHECKS)} search checks pass"
+              f" ({os.path.relpath(search_path('{locale}'))})")
+        return 1 if failures else 0
+
+    for emotion_id, score in query(load_index(args.locale), " ".join(args.query), args.limit):
+        print(f"  {score:7.3f}  {emotion_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
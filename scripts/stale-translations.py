@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+List translations made from an older version of their English source.
+
+Compares the master against the source-hash stamps in
+scripts/translation-stamps.json (pipeline/stamps.py) in one pass and
+prints the stale (cell, locale) pairs grouped by cell. build-wisdom.py
+refreshes the stamps on every build; --update does it here without a
+build. Retranslate the listed cells (machine-translate.py --stale, or a
+batch script) and they drop off the list.
+
+A translation that is still right for the new English (reviewed, or
+equal to the English like most bookRef cells) keeps its text, so no
+rebuild clears it. --accept CELL[:LOCALE] restamps it against the current
+English and writes the stamps; without a locale every translation of the
+cell is accepted. Repeat it for several cells.
+
+Usage:
+    python scripts/stale-translations.py [--update] [--json PATH]
+        [--accept emotion/trapped/essence:ja ...]
+"""
+import argparse
+import json
+import os
+import sys
+
+from pipeline import PhaseTimer, load_model
+from pipeline.paths import STAMPS_PATH, TRANSLATED_LOCALES
+from pipeline.master import localized_cells
+from pipeline.stamps import load_stamps, update_stamps, write_stamps
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--update", action="store_true", help="write the refreshed stamps")
+    parser.add_argument("--json", metavar="PATH", help="also write the stale cells as JSON")
+    parser.add_argument("--accept", action="append", default=[], metavar="CELL[:LOCALE]",
+                        help="mark a translation current for the present English (implies --update)")
+    args = parser.parse_args(argv)
+
+    timer = PhaseTimer()
+    with timer.phase("load"):
+        model = load_model()
+        previous = load_stamps()
+    names = {name for name, _, _ in localized_cells(model)}
+    accept = set()
+    for spec in args.accept:
+        name, _, locale = spec.partition(":")
+        if name not in names:
+            parser.error(f"--accept: no cell {name!r} (e.g. emotion/trapped/essence, need/safety/label)")
+        if locale and locale not in TRANSLATED_LOCALES:
+            parser.error(f"--accept: {locale!r} is not a translated locale")
+        accept.update((name, loc) for loc in ([locale] if locale else TRANSLATED_LOCALES))
+    with timer.phase("compare"):
+        stamps, stale = update_stamps(model, previous, accept=accept)
+
+    by_cell = {}
+    for name, _, locale in stale:
+        by_cell.setdefault(name, []).append(locale)
+    for name, locales in by_cell.items():
+        print(f"  {name}: {', '.join(locales)}")
+    print(f"{len(stale)} stale translations in {len(by_cell)} cells")
+
+    if accept:
+        print(f"Accepted {len(accept)} translations as current")
+    if args.update or accept:
+        with timer.phase("write"):
+            written = write_stamps(stamps)
+        print(f"{os.path.relpath(STAMPS_PATH)}: {'written' if written else 'unchanged'}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"stale": by_cell}, f, indent=2)
+    print(timer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Sweep PHYSICS / LAYOUT constants headlessly and rank the results.
+
+Every combination of the --vary grids is replayed with the NumPy force
+model (pipeline/layout.py, needs NumPy) at each --emotions scale, across a
+process pool. Starting values are the current ones in src/core/constants.js;
+larger scales are synthetic masters cycled from the real 39 emotions
+(pipeline/synthetic.py). Each run is scored on:
+
+  settle    first tick after which mean emotion speed stays under
+            --settle-speed px/tick for the rest of the run
+  overlaps  emotion pairs closer than --overlap-px (default twice the
+            run's collisionRadiusEmotion) on the first frame
+            (after warmupTicks)
+  min px    smallest emotion-to-emotion distance on the first frame
+  drift     mean kinetic energy per emotion over the last DRIFT_WINDOW
+            ticks — the ambient motion left once settled
+
+Combinations are ranked by their worst scale: total overlaps, then the
+slowest settle, then the tightest spacing, then drift.
+
+Usage:
+    python scripts/sweep-physics.py --vary gravityStrength=0.02,0.03,0.05 \\
+        --vary chargeStrength=-30,-50,-80 [--emotions 39,200] [--jobs N] \\
+        [--viewport 1440x900] [--horizon 600] [--top 10] [--json out.json]
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pipeline import Model, PhaseTimer, load_master
+from pipeline.layout import EMOTION_RADIUS_KEY, read_js_constants, simulate
+from pipeline.synthetic import synthetic_master
+
+DRIFT_WINDOW = 60
+
+# Set once per worker by the pool initializer
+_worker_models = None
+_worker_base = None
+_worker_options = None
+
+
+def _init_worker(models, base, options):
+    global _worker_models, _worker_base, _worker_options
+    _worker_models, _worker_base, _worker_options = models, base, options
+
+
+def parse_vary(specs, physics, layout):
+    """["key=v1,v2", ...] → [(key, [v1, v2])], keys checked against constants.js."""
+    grid = []
+    for spec in specs:
+        key, sep, values = spec.partition("=")
+        if not sep or not values:
+            raise ValueError(f"Expected KEY=v1,v2,..., got {spec!r}")
+        if key not in physics and key not in layout:
+            raise ValueError(f"Unknown constant {key!r}; PHYSICS has {sorted(physics)}, LAYOUT has {sorted(layout)}")
+        grid.append((key, [float(v) for v in values.split(",")]))
+    return grid
+
+
+def score_run(model, physics, layout, options):
+    """Replay one parameter set and return its metrics."""
+    warmup = int(physics["warmupTicks"])
+    horizon = max(warmup, options["horizon"])
+    speeds, energy, first_frame = np.empty(horizon), np.empty(horizon), {}
+
+    def observe(tick, x, y, vx, vy):
+        v2 = vx * vx + vy * vy
+        speeds[tick - 1] = np.sqrt(v2).mean()
+        energy[tick - 1] = 0.5 * v2.mean()
+        if tick == warmup:
+            first_frame["x"], first_frame["y"] = x.copy(), y.copy()
+
+    width, height = options["viewport"]
+    simulate(model, width, height, physics, layout, ticks=horizon, seed=options["seed"], observe=observe)
+
+    # Settled from the tick where every later speed is under the threshold
+    over = np.nonzero(speeds > options["settle_speed"])[0]
+    settle = 0 if over.size == 0 else int(over[-1]) + 1
+    settle = None if settle >= horizon else settle
+
+    x, y = first_frame.get("x", np.zeros(1)), first_frame.get("y", np.zeros(1))
+    dist = np.hypot(x[:, None] - x[None, :], y[:, None] - y[None, :])
+    upper = dist[np.triu_indices(len(x), k=1)]
+    # Unless fixed on the command line, overlap tracks this run's radius
+    overlap_px = options["overlap_px"] or 2 * physics[EMOTION_RADIUS_KEY]
+    return {
+        "settle": settle,
+        "overlaps": int((upper < overlap_px).sum()),
+        "minPx": round(float(upper.min()), 2) if upper.size else None,
+        "drift": round(float(energy[-DRIFT_WINDOW:].mean()), 4),
+    }
+
+
+def _run(task):
+    combo, overrides, scale = task
+    physics = {**_worker_base["PHYSICS"]}
+    layout = {**_worker_base["LAYOUT"]}
+    for key, value in overrides.items():
+        (physics if key in physics else layout)[key] = value
+    return combo, scale, score_run(_worker_models[scale], physics, layout, _worker_options)
+
+
+def rank_key(by_scale):
+    """Worst case across scales: overlaps, settle tick, spacing, drift."""
+    runs = by_scale.values()
+    return (
+        sum(r["overlaps"] for r in runs),
+        max(math.inf if r["settle"] is None else r["settle"] for r in runs),
+        -min(r["minPx"] if r["minPx"] is not None else 0 for r in runs),
+        max(r["drift"] for r in runs),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--vary", action="append", default=[], metavar="KEY=V1,V2",
+                        help="constant and the values to try (repeatable; grids are crossed)")
+    parser.add_argument("--emotions", default="39,200", help="comma-separated emotion counts")
+    parser.add_argument("--viewport", default="1440x900", help="WIDTHxHEIGHT in CSS px")
+    parser.add_argument("--horizon", type=int, default=600, help="ticks per run (at least warmupTicks)")
+    parser.add_argument("--settle-speed", type=float, default=0.5, help="px/tick counted as settled")
+    parser.add_argument("--overlap-px", type=float,
+                        help="first-frame distance counted as overlap (default 2 × each run's collisionRadiusEmotion)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--top", type=int, default=10, help="rows to print")
+    parser.add_argument("--json", metavar="PATH", help="also write every result as JSON")
+    args = parser.parse_args(argv)
+
+    base = {"PHYSICS": read_js_constants("PHYSICS"), "LAYOUT": read_js_constants("LAYOUT")}
+    try:
+        grid = parse_vary(args.vary, base["PHYSICS"], base["LAYOUT"])
+    except ValueError as err:
+        parser.error(str(err))
+    width, height = (int(v) for v in args.viewport.lower().split("x"))
+    options = {
+        "viewport": (width, height),
+        "horizon": args.horizon,
+        "settle_speed": args.settle_speed,
+        "overlap_px": args.overlap_px,
+        "seed": args.seed,
+    }
+
+    timer = PhaseTimer()
+    with timer.phase("load master"):
+        data = load_master()
+        scales = [int(n) for n in args.emotions.split(",") if n]
+        models = {n: Model.from_document(synthetic_master(data, n)) for n in scales}
+
+    keys = [key for key, _ in grid]
+    combos = [dict(zip(keys, values)) for values in itertools.product(*(v for _, v in grid))]
+    tasks = [(i, combo, scale) for i, combo in enumerate(combos) for scale in scales]
+
+    with timer.phase("sweep"):
+        jobs = max(1, min(args.jobs, len(tasks)))
+        if jobs == 1:
+            _init_worker(models, base, options)
+            results = [_run(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(jobs, initializer=_init_worker, initargs=(models, base, options)) as pool:
+                results = list(pool.map(_run, tasks))
+
+    by_combo = {}
+    for combo, scale, metrics in results:
+        by_combo.setdefault(combo, {})[scale] = metrics
+    ranked = sorted(by_combo, key=lambda c: rank_key(by_combo[c]))
+
+    header = "".join(f" {key[:16]:>16}" for key in keys)
+    for scale in scales:
+        header += f" | {f'{scale}:settle':>11} {'overlap':>7} {'min px':>7} {'drift':>7}"
+    print(f"{'rank':>4}{header}")
+    for rank, combo in enumerate(ranked[:args.top], 1):
+        row = "".join(f" {combos[combo][key]:>16g}" for key in keys)
+        for scale in scales:
+            m = by_combo[combo][scale]
+            settle = "never" if m["settle"] is None else m["settle"]
+            row += f" | {settle:>11} {m['overlaps']:>7} {m['minPx']:>7} {m['drift']:>7}"
+        print(f"{rank:>4}{row}")
+    print(f"{len(combos)} combinations × {len(scales)} scales = {len(tasks)} runs ({jobs} jobs)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "base": base, "options": {**options, "viewport": args.viewport},
+                "results": [{"constants": combos[c], "rank": r, "scales": by_combo[c]}
+                            for r, c in enumerate(ranked, 1)],
+            }, f, indent=2)
+    print(timer.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
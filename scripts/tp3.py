@@ -1,15 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Part 3: frustrated, guilty, free, trapped, anger, excitement"""
-import json, os
-F = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data", "emotion-constellation-more-info-data.json")
-with open(F, "r", encoding="utf-8") as f: data = json.load(f)
-L = ["es","ko","zh","ar","he","ja","fr","pt","it","de"]
-M = {e["id"]: e for e in data["emotions"]}
-def at(eid, fld, t):
-    for i, loc in enumerate(L): M[eid]["readMore"][fld][loc] = t[i]
-def ai(eid, idx, t):
-    for i, loc in enumerate(L): M[eid]["needs"][idx]["inquiry"][loc] = t[i]
+from pipeline.batch import TranslationBatch
+BATCH = TranslationBatch("Part 3", "frustrated, guilty, free, trapped, anger, excitement")
+at, ai = BATCH.at, BATCH.ai
 
 # ═══ FRUSTRATED ═══
 at("frustrated","essence",["Una tensión creciente cuando algo bloquea tu camino — una señal de que quieres avanzar pero algo se interpone.","무언가가 길을 막을 때 쌓이는 긴장감 — 앞으로 나아가고 싶지만 무언가 방해하고 있다는 신호입니다.","当某物阻挡你的道路时产生的紧张感——你想前进但有东西挡住了路的信号。","توتر متصاعد عندما يعيق شيء ما طريقك — إشارة إلى أنك تريد التقدم لكن شيئًا يقف في الطريق.","מתח הולך וגובר כשמשהו חוסם את דרכך — אות שאתה רוצה להתקדם אך משהו מפריע.","何かが道を塞いでいるときに高まる緊張 — 前に進みたいのに何かが邪魔をしているというシグナルです。","Une tension croissante quand quelque chose bloque votre chemin — un signal que vous voulez avancer mais quelque chose vous en empêche.","Uma tensão crescente quando algo bloqueia seu caminho — um sinal de que você quer avançar mas algo está no caminho.","Una tensione crescente quando qualcosa blocca il tuo cammino — un segnale che vuoi andare avanti ma qualcosa è di ostacolo.","Eine wachsende Spannung, wenn etwas deinen Weg blockiert — ein Signal, dass du vorankommen willst, aber etwas im Weg steht."])
@@ -52,5 +46,5 @@ at("excitement","reflection",["¿Hacia dónde te señala este entusiasmo — y c
 ai("excitement",0,["¿Qué me impulsa a moverme?","무엇이 나를 움직이게 하는가?","什么在驱动我前进？","ما الذي يدفعني للتحرك؟","מה מניע אותי לנוע?","何が私を動かしていますか？","Qu'est-ce qui me pousse à bouger ?","O que está me impulsionando a me mover?","Cosa mi spinge a muovermi?","Was treibt mich zum Handeln an?"])
 ai("excitement",1,["¿Qué nueva posibilidad estoy percibiendo?","어떤 새로운 가능성을 감지하고 있는가?","我在感知什么新的可能性？","ما الإمكانية الجديدة التي أستشعرها؟","איזו אפשרות חדשה אני חש?","どんな新しい可能性を感じていますか？","Quelle nouvelle possibilité est-ce que je perçois ?","Que nova possibilidade estou percebendo?","Quale nuova possibilità sto percependo?","Welche neue Möglichkeit nehme ich wahr?"])
 
-with open(F, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False, indent=2)
-print("Part 3 done: frustrated, guilty, free, trapped, anger, excitement")
+if __name__ == "__main__":
+    BATCH.run()
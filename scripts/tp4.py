@@ -1,15 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Part 4: urgency, pride, doubt, awe, despair, inspiration"""
-import json, os
-F = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data", "emotion-constellation-more-info-data.json")
-with open(F, "r", encoding="utf-8") as f: data = json.load(f)
-L = ["es","ko","zh","ar","he","ja","fr","pt","it","de"]
-M = {e["id"]: e for e in data["emotions"]}
-def at(eid, fld, t):
-    for i, loc in enumerate(L): M[eid]["readMore"][fld][loc] = t[i]
-def ai(eid, idx, t):
-    for i, loc in enumerate(L): M[eid]["needs"][idx]["inquiry"][loc] = t[i]
+from pipeline.batch import TranslationBatch
+BATCH = TranslationBatch("Part 4", "urgency, pride, doubt, awe, despair, inspiration")
+at, ai = BATCH.at, BATCH.ai
 
 # ═══ URGENCY ═══
 at("urgency","essence",["Una sensación apremiante de que el tiempo se agota — una señal para enfocar tu energía en lo que más importa ahora.","시간이 부족하다는 절박한 느낌 — 지금 가장 중요한 것에 에너지를 집중하라는 신호입니다.","一种时间不够用的紧迫感——让你把精力集中在现在最重要的事情上的信号。","شعور ملح بأن الوقت ينفد — إشارة لتركيز طاقتك على ما يهم أكثر الآن.","תחושה דוחקת שהזמן אוזל — אות למקד את האנרגיה שלך במה שחשוב ביותר עכשיו.","時間がなくなっていくという差し迫った感覚 — 今最も重要なことにエネルギーを集中するようにというシグナルです。","Un sentiment pressant que le temps s'écoule — un signal pour concentrer votre énergie sur ce qui compte le plus maintenant.","Uma sensação premente de que o tempo está acabando — um sinal para focar sua energia no que mais importa agora.","Una sensazione pressante che il tempo sta scadendo — un segnale per concentrare la tua energia su ciò che conta di più adesso.","Ein drängendes Gefühl, dass die Zeit davonläuft — ein Signal, deine Energie auf das zu fokussieren, was jetzt am wichtigsten ist."])
@@ -51,5 +45,5 @@ at("inspiration","reflection",["¿Hacia qué te llama esta inspiración — y cu
 ai("inspiration",0,["¿Qué me llama hacia adelante?","무엇이 나를 앞으로 부르고 있는가?","什么在呼唤我前进？","ما الذي يدعوني للأمام؟","מה קורא לי קדימה?","何が私を前へと呼んでいますか？","Qu'est-ce qui m'appelle en avant ?","O que está me chamando para frente?","Cosa mi chiama avanti?","Was ruft mich vorwärts?"])
 ai("inspiration",1,["¿En qué estoy listo para convertirme?","무엇이 될 준비가 되어 있는가?","我准备好成为什么？","ماذا أنا مستعد لأصبح؟","למה אני מוכן להפוך?","何になる準備ができていますか？","Que suis-je prêt à devenir ?","No que estou pronto para me tornar?","Cosa sono pronto a diventare?","Was bin ich bereit zu werden?"])
 
-with open(F, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False, indent=2)
-print("Part 4 done: urgency, pride, doubt, awe, despair, inspiration")
+if __name__ == "__main__":
+    BATCH.run()
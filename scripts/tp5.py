@@ -1,15 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Part 5: emptiness, delight, curiosity, joy, impatience, depression, boredom"""
-import json, os
-F = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data", "emotion-constellation-more-info-data.json")
-with open(F, "r", encoding="utf-8") as f: data = json.load(f)
-L = ["es","ko","zh","ar","he","ja","fr","pt","it","de"]
-M = {e["id"]: e for e in data["emotions"]}
-def at(eid, fld, t):
-    for i, loc in enumerate(L): M[eid]["readMore"][fld][loc] = t[i]
-def ai(eid, idx, t):
-    for i, loc in enumerate(L): M[eid]["needs"][idx]["inquiry"][loc] = t[i]
+from pipeline.batch import TranslationBatch
+BATCH = TranslationBatch("Part 5", "emptiness, delight, curiosity, joy, impatience, depression, boredom")
+at, ai = BATCH.at, BATCH.ai
 
 # ═══ EMPTINESS ═══
 at("emptiness","essence",["Un sentimiento hueco y vacante — una señal de que algo esencial para tu sentido de propósito o conexión se ha silenciado.","텅 비고 공허한 느낌 — 목적감이나 연결감에 필수적인 무언가가 조용해졌다는 신호입니다.","一种空洞、空缺的感觉——对你的目的感或连接感至关重要的东西变得沉默的信号。","شعور أجوف وفارغ — إشارة إلى أن شيئًا جوهريًا لإحساسك بالهدف أو التواصل قد صمت.","תחושה חלולה וריקה — אות שמשהו חיוני לתחושת המטרה או החיבור שלך השתתק.","空洞で虚ろな感覚 — 目的感やつながりに不可欠な何かが静まったというシグナルです。","Un sentiment creux et vacant — un signal que quelque chose d'essentiel à votre sens du but ou de la connexion s'est tu.","Um sentimento oco e vazio — um sinal de que algo essencial ao seu senso de propósito ou conexão ficou em silêncio.","Un sentimento vuoto e vacante — un segnale che qualcosa di essenziale per il tuo senso di scopo o connessione si è zittito.","Ein hohles, leeres Gefühl — ein Signal, dass etwas Wesentliches für dein Sinn- oder Verbundenheitsgefühl verstummt ist."])
@@ -48,7 +42,7 @@ ai("impatience",1,["¿Por qué el progreso no ocurre más rápido?","왜 진전
 # ═══ DEPRESSION ═══
 at("depression","essence",["Un estado pesado y de baja energía donde avanzar parece imposible — una señal de que algo fundamental puede necesitar cambiar.","앞으로 나아가는 것이 불가능하게 느껴지는 무겁고 저에너지 상태 — 근본적인 무언가가 변해야 할 수 있다는 신호입니다.","一种沉重的、低能量的状态，前进感觉不可能——某些根本性的东西可能需要改变的信号。","حالة ثقيلة ومنخفضة الطاقة حيث يبدو التحرك للأمام مستحيلاً — إشارة إلى أن شيئًا جوهريًا قد يحتاج للتغيير.","מצב כבד ודל-אנרגיה שבו תנועה קדימה נראית בלתי אפשרית — אות שמשהו יסודי עשוי להצטרך להשתנות.","前に進むことが不可能に感じる重く低エネルギーな状態 — 何か根本的なことが変わる必要があるかもしれないというシグナルです。","Un état lourd et peu énergique où avancer semble impossible — un signal que quelque chose de fondamental pourrait devoir changer.","Um estado pesado e de baixa energia onde avançar parece impossível — um sinal de que algo fundamental pode precisar mudar.","Uno stato pesante e a bassa energia dove andare avanti sembra impossibile — un segnale che qualcosa di fondamentale potrebbe dover cambiare.","Ein schwerer, energiearmer Zustand, in dem Vorankommen unmöglich erscheint — ein Signal, dass sich etwas Grundlegendes ändern muss."])
 at("depression","signal",["La depresión se sitúa entre el crecimiento y el significado, haciendo preguntas profundas sobre si la dirección en la que has ido aún tiene sentido. Puede ser señal de que lo que solía impulsarte se ha agotado. Aunque la depresión persistente necesita apoyo profesional, la señal emocional misma a menudo lleva información importante sobre desalineación entre tu vida y tus necesidades.","우울은 성장과 의미 사이에 자리잡고 있으며, 지금까지 향하던 방향이 여전히 의미가 있는지에 대해 깊은 질문을 합니다. 한때 당신에게 동력을 주었던 것이 고갈되었다는 징후일 수 있습니다. 지속적인 우울은 전문적 도움이 필요하지만, 감정적 신호 자체는 삶과 욕구 사이의 불일치에 대한 중요한 정보를 담고 있는 경우가 많습니다.","抑郁处于成长和意义之间，深刻地质问你一直前进的方向是否仍然合理。它可能表明曾经驱动你的东西已经耗尽。虽然持续的抑郁需要专业支持，但情感信号本身往往携带着关于生活与需求之间失调的重要信息。","الاكتئاب يقع بين النمو والمعنى، يطرح أسئلة عميقة عما إذا كان الاتجاه الذي كنت تسير فيه لا يزال منطقيًا. قد يكون إشارة إلى أن ما كان يغذيك قد نضب. رغم أن الاكتئاب المستمر يحتاج دعمًا مهنيًا، إلا أن الإشارة العاطفية نفسها غالبًا ما تحمل معلومات مهمة عن عدم التوافق بين حياتك واحتياجاتك.","דיכאון יושב בין צמיחה ומשמעות, שואל שאלות עמוקות על האם הכיוון שהלכת בו עדיין הגיוני. הוא יכול להיות סימן שמה שפעם הניע אותך התייבש. בעוד שדיכאון מתמשך זקוק לתמיכה מקצועית, האות הרגשי עצמו לעיתים קרובות נושא מידע חשוב על חוסר התאמה בין חייך לצרכיך.","うつは成長と意味の間に位置し、これまで向かっていた方向がまだ意味があるかについて深い問いを投げかけます。かつてあなたを動かしていたものが枯渇した兆候かもしれません。持続的なうつには専門的なサポートが必要ですが、感情的シグナル自体は、人生と欲求の間のミスアラインメントについての重要な情報を持っていることが多いです。","La dépression se situe entre la croissance et le sens, posant des questions profondes sur la pertinence de la direction que vous suiviez. Elle peut signaler que ce qui vous alimentait s'est épuisé. Bien que la dépression persistante nécessite un soutien professionnel, le signal émotionnel lui-même porte souvent des informations importantes sur le désalignement entre votre vie et vos besoins.","A depressão fica entre crescimento e significado, fazendo perguntas profundas sobre se a direção que você vinha seguindo ainda faz sentido. Pode ser um sinal de que o que costumava alimentá-lo se esgotou. Embora a depressão persistente precise de apoio profissional, o sinal emocional em si frequentemente carrega informações importantes sobre o desalinhamento entre sua vida e suas necessidades.","La depressione si colloca tra crescita e significato, ponendo domande profonde sul fatto che la direzione che stavi seguendo abbia ancora senso. Può essere un segnale che ciò che ti alimentava si è esaurito. Sebbene la depressione persistente necessiti di supporto professionale, il segnale emotivo stesso spesso porta informazioni importanti sul disallineamento tra la tua vita e i tuoi bisogni.","Depression liegt zwischen Wachstum und Sinn und stellt tiefe Fragen darüber, ob die Richtung, in die du gegangen bist, noch Sinn ergibt. Sie kann ein Zeichen sein, dass das, was dich antrieb, versiegt ist. Während anhaltende Depression professionelle Unterstützung braucht, trägt das emotionale Signal selbst oft wichtige Informationen über die Dissonanz zwischen deinem Leben und deinen Bedürfnissen."])
-at("depression","reflection",["Si esta Schwere sprechen könnte, was würde sie dich bitten zu ändern — oder zu betrauern?","이 무거움이 말할 수 있다면, 무엇을 바꾸거나 슬퍼하라고 할까요?","如果这种沉重能说话，它会要求你改变什么——或者悲悼什么？","لو استطاع هذا الثقل أن يتحدث، ما الذي قد يطلب منك تغييره — أو الحداد عليه؟","אם הכובד הזה יכול היה לדבר, מה הוא היה מבקש ממך לשנות — או לאבול עליו?","この重さが話せるとしたら、何を変えるよう——あるいは何を悲しむよう求めるでしょうか？","Si cette lourdeur pouvait parler, que vous demanderait-elle de changer — ou de pleurer ?","Se essa pesadez pudesse falar, o que pediria para você mudar — ou lamentar?","Se questa pesantezza potesse parlare, cosa ti chiederebbe di cambiare — o di piangere?","Wenn diese Schwere sprechen könnte, was würde sie dich bitten zu ändern — oder zu betrauern?"])
+at("depression","reflection",["Si esta pesadez pudiera hablar, ¿qué te pediría cambiar — o llorar?","이 무거움이 말할 수 있다면, 무엇을 바꾸거나 슬퍼하라고 할까요?","如果这种沉重能说话，它会要求你改变什么——或者悲悼什么？","لو استطاع هذا الثقل أن يتحدث، ما الذي قد يطلب منك تغييره — أو الحداد عليه؟","אם הכובד הזה יכול היה לדבר, מה הוא היה מבקש ממך לשנות — או לאבול עליו?","この重さが話せるとしたら、何を変えるよう——あるいは何を悲しむよう求めるでしょうか？","Si cette lourdeur pouvait parler, que vous demanderait-elle de changer — ou de pleurer ?","Se essa pesadez pudesse falar, o que pediria para você mudar — ou lamentar?","Se questa pesantezza potesse parlare, cosa ti chiederebbe di cambiare — o di piangere?","Wenn diese Schwere sprechen könnte, was würde sie dich bitten zu ändern — oder zu betrauern?"])
 ai("depression",0,["¿Realmente quiero avanzar?","정말로 앞으로 나아가고 싶은가?","我真的想前进吗？","هل أريد حقًا المضي قدمًا؟","האם אני באמת רוצה להתקדם?","本当に前に進みたいですか？","Est-ce que je veux vraiment avancer ?","Eu realmente quero seguir em frente?","Voglio davvero andare avanti?","Will ich wirklich vorankommen?"])
 ai("depression",1,["¿Qué ha perdido su propósito?","무엇이 목적을 잃었는가?","什么失去了它的目的？","ما الذي فقد هدفه؟","מה איבד את מטרתו?","何が目的を失いましたか？","Qu'est-ce qui a perdu son sens ?","O que perdeu seu propósito?","Cosa ha perso il suo scopo?","Was hat seinen Zweck verloren?"])
 
@@ -58,5 +52,5 @@ at("boredom","signal",["El aburrimiento tiene mala reputación, pero cumple dos
 at("boredom","reflection",["¿Te pide este aburrimiento que descanses, o que busques algo nuevo?","이 지루함은 쉬라고 하는 건가요, 새로운 것을 찾으라고 하는 건가요?","这种无聊是在要求你休息，还是寻找新事物？","هل يطلب منك هذا الملل أن تستريح، أم أن تبحث عن شيء جديد؟","האם השעמום הזה מבקש ממך לנוח, או לחפש משהו חדש?","この退屈は休むことを求めていますか、新しいものを探すことを求めていますか？","Cet ennui vous demande-t-il de vous reposer ou de chercher quelque chose de nouveau ?","Esse tédio está pedindo para descansar ou para buscar algo novo?","Questa noia ti chiede di riposare o di cercare qualcosa di nuovo?","Bittet dich diese Langeweile auszuruhen oder etwas Neues zu suchen?"])
 ai("boredom",0,["¿Es hora de aprender o explorar?","배우거나 탐험할 때인가?","是时候学习或探索了吗？","هل حان وقت التعلم أو الاستكشاف؟","האם הגיע הזמן ללמוד או לחקור?","学んだり探索したりする時ですか？","Est-il temps d'apprendre ou d'explorer ?","É hora de aprender ou explorar?","È ora di imparare o esplorare?","Ist es Zeit zu lernen oder zu erkunden?"])
 
-with open(F, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False, indent=2)
-print("Part 5 done: emptiness, delight, curiosity, joy, impatience, depression, boredom")
+if __name__ == "__main__":
+    BATCH.run()
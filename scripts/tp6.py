@@ -1,15 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Part 6: sadness, anxiety, gratitude, hope, compassion, grief"""
-import json, os
-F = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data", "emotion-constellation-more-info-data.json")
-with open(F, "r", encoding="utf-8") as f: data = json.load(f)
-L = ["es","ko","zh","ar","he","ja","fr","pt","it","de"]
-M = {e["id"]: e for e in data["emotions"]}
-def at(eid, fld, t):
-    for i, loc in enumerate(L): M[eid]["readMore"][fld][loc] = t[i]
-def ai(eid, idx, t):
-    for i, loc in enumerate(L): M[eid]["needs"][idx]["inquiry"][loc] = t[i]
+from pipeline.batch import TranslationBatch
+BATCH = TranslationBatch("Part 6", "sadness, anxiety, gratitude, hope, compassion, grief")
+at, ai = BATCH.at, BATCH.ai
 
 # ═══ SADNESS ═══
 at("sadness","essence",["Un sentimiento profundo y hundido de pérdida o ausencia — una señal de que algo precioso para ti ha cambiado o se está escapando.","깊고 가라앉는 상실이나 부재의 느낌 — 당신에게 소중한 무언가가 변했거나 사라지고 있다는 신호입니다.","一种深沉的、下沉的失去或缺失的感觉——对你珍贵的东西已经改变或正在消逝的信号。","شعور عميق بالفقدان أو الغياب — إشارة إلى أن شيئًا ثمينًا لك قد تغير أو يفلت.","תחושה עמוקה ושוקעת של אובדן או היעדרות — אות שמשהו יקר לך השתנה או חומק.","深く沈むような喪失や不在の感覚 — あなたにとって大切なものが変わった、または失われつつあるというシグナルです。","Un sentiment profond et pesant de perte ou d'absence — un signal que quelque chose de précieux pour vous a changé ou vous échappe.","Um sentimento profundo e pesado de perda ou ausência — um sinal de que algo precioso para você mudou ou está escapando.","Un sentimento profondo e sprofondante di perdita o assenza — un segnale che qualcosa di prezioso per te è cambiato o sta sfuggendo.","Ein tiefes, sinkendes Gefühl von Verlust oder Abwesenheit — ein Signal, dass etwas Kostbares sich verändert hat oder entgleitet."])
@@ -53,5 +47,5 @@ at("grief","reflection",["¿Qué te está enseñando este duelo sobre lo que má
 ai("grief",0,["¿Qué vínculo se ha roto o transformado?","어떤 유대가 끊어졌거나 변형되었는가?","什么纽带被打破或转变了？","أي رابطة كُسرت أو تحولت؟","איזה קשר נשבר או השתנה?","どの絆が壊れたか、変容しましたか？","Quel lien a été brisé ou transformé ?","Que laço foi quebrado ou transformado?","Quale legame è stato spezzato o trasformato?","Welche Bindung wurde zerbrochen oder verändert?"])
 ai("grief",1,["¿Cómo le doy sentido a esta pérdida?","이 상실을 어떻게 이해할 수 있는가?","我如何理解这次失去？","كيف أفهم هذه الخسارة؟","איך אני מפנים את האובדן הזה?","この喪失にどう意味を見出しますか？","Comment donner un sens à cette perte ?","Como faço sentido dessa perda?","Come do un senso a questa perdita?","Wie gebe ich diesem Verlust einen Sinn?"])
 
-with open(F, "w", encoding="utf-8") as f: json.dump(data, f, ensure_ascii=False, indent=2)
-print("Part 6 done: sadness, anxiety, gratitude, hope, compassion, grief")
+if __name__ == "__main__":
+    BATCH.run()
@@ -1,15 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Part 7: stress, overwhelm, contentment, courage, disgust, exhaustion"""
-import json, os
-F = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data", "emotion-constellation-more-info-data.json")
-with open(F, "r", encoding="utf-8") as f: data = json.load(f)
-L = ["es","ko","zh","ar","he","ja","fr","pt","it","de"]
-M = {e["id"]: e for e in data["emotions"]}
-def at(eid, fld, t):
-    for i, loc in enumerate(L): M[eid]["readMore"][fld][loc] = t[i]
-def ai(eid, idx, t):
-    for i, loc in enumerate(L): M[eid]["needs"][idx]["inquiry"][loc] = t[i]
+from pipeline.batch import TranslationBatch
+BATCH = TranslationBatch("Part 7", "stress, overwhelm, contentment, courage, disgust, exhaustion")
+at, ai = BATCH.at, BATCH.ai
 
 # ═══ STRESS ═══
 at("stress","essence",[
@@ -396,6 +390,5 @@ ai("exhaustion",2,[
 ])
 
 # ═══ SAVE ═══
-with open(F, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-print("Part 7 done: stress, overwhelm, contentment, courage, disgust, exhaustion")
+if __name__ == "__main__":
+    BATCH.run()
@@ -1,25 +1,11 @@
 #!/usr/bin/env python3
 """Part 2: Add readMore + inquiry translations for emotions 1-13 (trust through anger)."""
-import json, os
+from pipeline.batch import TranslationBatch
 
-F = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data", "emotion-constellation-more-info-data.json")
-with open(F, "r", encoding="utf-8") as f:
-    data = json.load(f)
+BATCH = TranslationBatch("Part 2", "translated trust through shame (8 emotions).")
 
-LOCALES = ["es","ko","zh","ar","he","ja","fr","pt","it","de"]
-
-# Build a lookup by emotion id
-emo_map = {e["id"]: e for e in data["emotions"]}
-
-def add_translations(eid, field, translations):
-    """Add locale translations to emo_map[eid]["readMore"][field]."""
-    for i, loc in enumerate(LOCALES):
-        emo_map[eid]["readMore"][field][loc] = translations[i]
-
-def add_inquiry(eid, need_idx, translations):
-    """Add locale translations to inquiry at given need index."""
-    for i, loc in enumerate(LOCALES):
-        emo_map[eid]["needs"][need_idx]["inquiry"][loc] = translations[i]
+# readMore[field] and needs[need_idx].inquiry, positional in BATCH.locales order
+add_translations, add_inquiry = BATCH.at, BATCH.ai
 
 # ═══ TRUST ═══
 add_translations("trust", "essence", [
@@ -481,7 +467,5 @@ add_inquiry("shame", 1, [
     "Lebe ich nach meinen eigenen Maßstäben?",
 ])
 
-# Save progress
-with open(F, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
-print(f"Part 2 done: translated trust through shame (8 emotions). File saved.")
+if __name__ == "__main__":
+    BATCH.run()
@@ -1,19 +1,11 @@
 #!/usr/bin/env python3
 """
-Reads the existing English-only wisdom JSON and adds translations for all locales.
+Phase 1: need labels/descriptions and emotion labels for all locales.
 Uses compact translation tables to keep the script manageable.
 """
-import json
-import os
-import copy
+from pipeline.batch import TranslationBatch
 
-INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "public", "data", "emotion-constellation-more-info-data.json")
-OUTPUT = INPUT  # overwrite in place
-
-with open(INPUT, "r", encoding="utf-8") as f:
-    data = json.load(f)
-
-LOCALES = ["es","ko","zh","ar","he","ja","fr","pt","it","de"]
+BATCH = TranslationBatch("Phase 1", "labels + need translations.")
 
 # ────────────────────────────────────────────────────────────────────
 # NEED translations
@@ -102,17 +94,11 @@ NEED_DESCS = {
   ],
 }
 
-# Apply need translations
-for need in data["needs"]:
-    nid = need["id"]
-    if nid in NEED_LABELS:
-        for i, loc in enumerate(LOCALES):
-            need["label"][loc] = NEED_LABELS[nid][i]
-    if nid in NEED_DESCS:
-        for i, loc in enumerate(LOCALES):
-            need["description"][loc] = NEED_DESCS[nid][i]
-
-print(f"Translated {len(data['needs'])} needs.")
+# Queue need translations
+for nid, t in NEED_LABELS.items():
+    BATCH.need_label(nid, t)
+for nid, t in NEED_DESCS.items():
+    BATCH.need_description(nid, t)
 
 # ────────────────────────────────────────────────────────────────────
 # EMOTION translations
@@ -162,29 +148,11 @@ EMOTION_LABELS = {
   "exhaustion":["Agotamiento","소진","疲惫","إنهاك","תשישות","疲弊","Épuisement","Exaustão","Esaurimento","Erschöpfung"],
 }
 
-# Apply emotion label translations
-for emo in data["emotions"]:
-    eid = emo["id"]
-    if eid in EMOTION_LABELS:
-        for i, loc in enumerate(LOCALES):
-            emo["label"][loc] = EMOTION_LABELS[eid][i]
-
-print(f"Translated labels for {len(data['emotions'])} emotions.")
-
-# Now we need essence, signal, reflection, and inquiry translations.
-# These are long strings. We'll load them from a separate JSON file.
-# For now, let's build the translation data structure and write it.
-
-# We'll create a helper that adds translations from a lookup table.
-# The lookup table will be a separate JSON file we generate.
-
-# Instead, let's do it inline but using exec to load from a data file.
-# Actually, let's just use a separate data file approach.
-
-print("Phase 1 complete. Need to run part 2 for readMore + inquiry translations.")
-print(f"Writing intermediate output to {OUTPUT}")
+# Queue emotion label translations
+for eid, t in EMOTION_LABELS.items():
+    BATCH.label(eid, t)
 
-with open(OUTPUT, "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+# readMore + inquiry translations live in translate-part2.py and tp3-tp7.py.
 
-print("Done with labels + need translations. Part 2 will add readMore and inquiry translations.")
+if __name__ == "__main__":
+    BATCH.run()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Maintain and query the translation memory (scripts/translation-memory.json).
+
+The memory maps each normalized English source string to its translations
+(pipeline/memory.py). `import` fills it from everything that holds
+translations today, oldest first so newer text wins:
+
+  1. literal tables in generate-translations.py / build-translations.py
+     (dict displays and ml(...) calls, read with ast — never executed)
+  2. the batch scripts build-wisdom.py applies (at()/ai() lists), keyed on
+     the English text of each target in the master
+  3. the master itself
+
+Afterwards build-wisdom.py --memory translates from the store alone, and
+edited English text can be checked against it with `lookup`.
+
+Usage:
+    python scripts/translation-memory.py import [--no-literals] [--no-batches]
+    python scripts/translation-memory.py lookup TEXT [--locale es] [--threshold 0.7] [--limit 3]
+    python scripts/translation-memory.py stats
+"""
+import argparse
+import os
+import sys
+
+from pipeline import MasterIndex, Model, PhaseTimer, load_batch, load_master
+from pipeline.batch import BATCH_SCRIPTS
+from pipeline.master import localized_cells
+from pipeline.memory import FUZZY_THRESHOLD, harvest_batch, literal_cells, load_memory, write_memory
+from pipeline.paths import MEMORY_PATH, SCRIPTS_DIR, TRANSLATED_LOCALES
+
+LITERAL_SCRIPTS = ["generate-translations.py", "build-translations.py"]
+
+
+def run_import(args, memory, timer):
+    if not args.no_literals:
+        with timer.phase("literal tables"):
+            for name in LITERAL_SCRIPTS:
+                cells = list(literal_cells(os.path.join(SCRIPTS_DIR, name)))
+                changed = sum(memory.merge_cell(cell) for cell in cells)
+                print(f"  {name}: {len(cells)} cells, {changed} strings added or changed")
+    with timer.phase("load master"):
+        data = load_master()
+        index = MasterIndex(data)
+    if not args.no_batches:
+        with timer.phase("batch scripts"):
+            for name in BATCH_SCRIPTS:
+                batch = load_batch(os.path.join(SCRIPTS_DIR, name))
+                changed, skipped = harvest_batch(memory, batch, index)
+                note = f", {skipped} patches without English text" if skipped else ""
+                print(f"  {name}: {len(batch.patches)} patches, {changed} strings added or changed{note}")
+    with timer.phase("master"):
+        changed = sum(memory.merge_cell(cell) for _, _, cell in localized_cells(Model.from_document(data)))
+        print(f"  master: {changed} strings added or changed")
+    with timer.phase("write"):
+        written = write_memory(memory, args.memory)
+    print(f"{os.path.relpath(args.memory)}: {len(memory)} sources"
+          f" ({'written' if written else 'unchanged'})")
+
+
+def run_lookup(args, memory):
+    hit = memory.exact(args.text, args.locale)
+    if hit is not None:
+        print("exact:")
+        for locale, text in ({args.locale: hit} if args.locale else hit).items():
+            print(f"  {locale}: {text}")
+        return
+    matches = memory.fuzzy(args.text, args.locale, threshold=args.threshold, limit=args.limit)
+    if not matches:
+        print(f"no entry within Dice {args.threshold}")
+        return
+    for score, source, targets in matches:
+        print(f"fuzzy {score:.2f}: {source}")
+        for locale, text in ({args.locale: targets} if args.locale else targets).items():
+            print(f"  {locale}: {text}")
+
+
+def run_stats(memory):
+    print(f"{len(memory)} sources")
+    for locale in TRANSLATED_LOCALES:
+        have = sum(locale in targets for targets in memory.entries.values())
+        print(f"  {locale}: {have} translated, {len(memory) - have} missing")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--memory", default=MEMORY_PATH, help="store path")
+    commands = parser.add_subparsers(dest="command", required=True)
+    imp = commands.add_parser("import", help="merge translations from the scripts and the master")
+    imp.add_argument("--no-literals", action="store_true", help="skip the legacy literal tables")
+    imp.add_argument("--no-batches", action="store_true", help="skip the batch scripts")
+    lookup = commands.add_parser("lookup", help="exact, else fuzzy, translations for an English string")
+    lookup.add_argument("text")
+    lookup.add_argument("--locale", choices=TRANSLATED_LOCALES)
+    lookup.add_argument("--threshold", type=float, default=FUZZY_THRESHOLD, help="minimum Dice score")
+    lookup.add_argument("--limit", type=int, default=3)
+    commands.add_parser("stats", help="entries per locale")
+    args = parser.parse_args(argv)
+
+    timer = PhaseTimer()
+    with timer.phase("load memory"):
+        memory = load_memory(args.memory)
+    if args.command == "import":
+        run_import(args, memory, timer)
+        print(timer.report())
+    elif args.command == "lookup":
+        run_lookup(args, memory)
+    else:
+        run_stats(memory)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
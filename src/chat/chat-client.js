@@ -38,19 +38,23 @@ function buildEmotionContextPayload(emotionData) {
     return { isWelcome: true };
   }
 
-  const { emotion, inquiries = [], fellowMessengers = [], wisdom = {}, emotionNodes = [] } = emotionData;
-
-  // Pre-resolve fellow messenger IDs → labels grouped by need (matching server expectation)
+  const {
+    emotion, inquiries = [], fellowMessengers = [], fellowMessengersPerNeed: perNeedIds = null,
+    wisdom = {}, emotionNodes = [],
+  } = emotionData;
+  const nodesById = new Map(emotionNodes.map(e => [e.id, e]));
+
+  // Pre-resolve fellow messenger IDs → labels grouped by need (matching server expectation).
+  // Selection state supplies the per-need grouping; older callers only pass the flat list.
   const fellowMessengersPerNeed = {};
   for (const inq of inquiries) {
+    const ids = perNeedIds
+      ? perNeedIds[inq.needId] || []
+      : fellowMessengers.filter(id => nodesById.get(id)?.links?.some(l => l.needId === inq.needId));
     const fellows = [];
-    for (const fellowId of fellowMessengers) {
-      const fellowNode = emotionNodes.find(e => e.id === fellowId);
-      if (!fellowNode) continue;
-      const sharesNeed = fellowNode.links?.some(l => l.needId === inq.needId);
-      if (sharesNeed) {
-        fellows.push(fellowNode.label || fellowId);
-      }
+    for (const fellowId of ids) {
+      const fellowNode = nodesById.get(fellowId);
+      if (fellowNode) fellows.push(fellowNode.label || fellowId);
     }
     if (fellows.length > 0) {
       fellowMessengersPerNeed[inq.needId] = fellows;
@@ -84,7 +88,7 @@ export function createChatClient() {
      * Clears any existing conversation.
      *
      * @param {Object} emotionData - Combined data:
-     *   { emotion, inquiries, fellowMessengers, wisdom, emotionNodes }
+     *   { emotion, inquiries, fellowMessengers, fellowMessengersPerNeed, wisdom, emotionNodes }
      */
     startConversation(emotionData) {
       this.reset();
@@ -15,7 +15,7 @@ import { t } from '../core/ui-strings.js';
 
 /**
  * @param {Object} emotion       - The emotion node ({ id, label, links })
- * @param {Array}  fellowMessengers - Array of fellow messenger emotion IDs
+ * @param {Array}  fellowMessengers - Fellow messenger emotion IDs, most related first when ranked
  * @param {Array}  emotionNodes  - All emotion nodes (for label lookup)
  * @returns {string[]} 2-3 starter prompt strings
  */
@@ -1,11 +1,39 @@
 /**
  * Load and parse constellation data.
  * Supports i18n via locale parameter (defaults to 'en').
+ *
+ * constellation-{locale}.json carries the localized text; what every
+ * locale shares (emotion appearance, selection adjacency, layout presets)
+ * is in constellation-graph.json, fetched once and merged into each locale.
  */
 
+let graphRequest = null;  // Promise<graph | null>
+
+/**
+ * Fetch the locale-independent graph once; later calls reuse it.
+ * Without it the simulation and selection derive the same values at runtime,
+ * so a failed fetch resolves to null and is retried on the next load.
+ */
+function loadGraph() {
+  if (!graphRequest) {
+    const url = `${import.meta.env.BASE_URL}data/constellation-graph.json`;
+    graphRequest = fetch(url)
+      .then((resp) => {
+        if (!resp.ok) throw new Error(resp.statusText);
+        return resp.json();
+      })
+      .catch((err) => {
+        console.warn('Failed to load constellation graph:', err);
+        graphRequest = null;
+        return null;
+      });
+  }
+  return graphRequest;
+}
+
 export async function loadConstellationData(locale = 'en') {
   const url = `${import.meta.env.BASE_URL}data/constellation-${locale}.json`;
-  const response = await fetch(url);
+  const [response, graph] = await Promise.all([fetch(url), loadGraph()]);
 
   if (!response.ok) {
     // Fallback to English if locale not found
@@ -17,23 +45,31 @@ export async function loadConstellationData(locale = 'en') {
   }
 
   const data = await response.json();
-  return processData(data);
+  return processData(data, graph);
 }
 
 /**
  * Process raw JSON into runtime-friendly structures.
  * Pre-computes lookups and color vectors.
  */
-function processData(data) {
+function processData(data, graph) {
   const needsById = new Map();
 
   for (const need of data.needs) {
     needsById.set(need.id, need);
   }
 
-  // Enrich emotions with resolved need references
+  // The graph's adjacency indexes the emotions list, so only use one
+  // built from the same master as this file
+  if (graph && graph.meta?.version !== data.meta?.version) {
+    console.warn(`Constellation graph ${graph.meta?.version} does not match data ${data.meta?.version}; ignoring it`);
+    graph = null;
+  }
+
+  // Enrich emotions with build-time appearance and resolved need references
   const emotions = data.emotions.map(emotion => ({
     ...emotion,
+    ...graph?.emotions?.[emotion.id],
     links: emotion.links.map(link => ({
       ...link,
       need: needsById.get(link.needId),
@@ -45,5 +81,7 @@ function processData(data) {
     emotions,
     needsById,
     meta: data.meta,
+    layouts: graph?.layouts || null,
+    adjacency: graph?.adjacency || null,
   };
 }
@@ -0,0 +1,109 @@
+/**
+ * Emotion search over the prebuilt per-locale inverted index.
+ *
+ * scripts/pipeline/search.py writes data/search/{locale}.json: the emotion
+ * ids ("docs") and, per term, a flat [doc, weight, doc, weight, ...]
+ * posting list with BM25 weights over each emotion's label, wisdom text and
+ * search keywords, plus the "stopwords" too common to rank by, which are
+ * dropped from queries. Only the active locale's index is fetched, once.
+ * query() in search.py scores the same way, for search-emotions.py. tokenize() must stay in
+ * step with the Python tokenizer — same normalization, CJK bigrams and
+ * RTL mark stripping — or queries will miss.
+ */
+
+const CJK = '\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff';
+const TOKEN_RE = new RegExp(`([${CJK}]+)|((?:(?![${CJK}])[\\p{L}\\p{N}])+)`, 'gu');
+// Arabic harakat, superscript alef, tatweel; Hebrew cantillation and niqqud
+const MARKS_RE = /[\u064b-\u065f\u0670\u0640\u0591-\u05bd\u05bf\u05c1\u05c2\u05c4\u05c5\u05c7]/g;
+// Arabic hamza-carrying alefs → bare alef, alef maqsura → ya, ta marbuta → ha
+const FOLD = { '\u0623': '\u0627', '\u0625': '\u0627', '\u0622': '\u0627', '\u0649': '\u064a', '\u0629': '\u0647' };
+const FOLD_RE = new RegExp(`[${Object.keys(FOLD).join('')}]`, 'g');
+
+// The last query word also matches longer terms (as-you-type), at a discount
+const PREFIX_MIN = 3;
+const PREFIX_WEIGHT = 0.5;
+
+const indexes = new Map();  // locale → Promise<{ docs, terms, sorted, stopwords }|null>
+
+export function tokenize(text) {
+  const normalized = text.normalize('NFKC').toLowerCase()
+    .replace(MARKS_RE, '')
+    .replace(FOLD_RE, ch => FOLD[ch]);
+  const tokens = [];
+  for (const [, cjk, word] of normalized.matchAll(TOKEN_RE)) {
+    if (cjk) {
+      if (cjk.length === 1) tokens.push(cjk);
+      for (let i = 0; i + 1 < cjk.length; i++) tokens.push(cjk.slice(i, i + 2));
+    } else if (word.length > 1) {
+      tokens.push(word);
+    }
+  }
+  return tokens;
+}
+
+async function loadIndex(locale) {
+  if (!indexes.has(locale)) {
+    const url = `${import.meta.env.BASE_URL}data/search/${locale}.json`;
+    indexes.set(locale, fetch(url)
+      .then((resp) => {
+        if (!resp.ok) throw new Error(resp.statusText);
+        return resp.json();
+      })
+      .then(index => ({
+        ...index,
+        sorted: Object.keys(index.terms).sort(),
+        stopwords: new Set(index.stopwords || []),
+      }))
+      .catch((err) => {
+        console.warn(`Search index for '${locale}' unavailable:`, err);
+        indexes.delete(locale);
+        return null;
+      }));
+  }
+  return indexes.get(locale);
+}
+
+/** Terms starting with prefix, via binary search over the sorted term list. */
+function prefixTerms(sorted, prefix) {
+  let lo = 0, hi = sorted.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (sorted[mid] < prefix) lo = mid + 1; else hi = mid;
+  }
+  const found = [];
+  for (let i = lo; i < sorted.length && sorted[i].startsWith(prefix); i++) found.push(sorted[i]);
+  return found;
+}
+
+/**
+ * Rank emotions for a free-text query in the given locale.
+ * @returns {Promise<Array<{ id: string, score: number }>>} best first
+ */
+export async function searchEmotions(query, locale, limit = 5) {
+  const index = await loadIndex(locale);
+  if (!index) return [];
+  const tokens = tokenize(query).filter(term => !index.stopwords.has(term));
+  if (tokens.length === 0) return [];
+
+  const scores = new Map();
+  const add = (term, factor) => {
+    const postings = index.terms[term];
+    if (!postings) return;
+    for (let i = 0; i < postings.length; i += 2) {
+      scores.set(postings[i], (scores.get(postings[i]) || 0) + postings[i + 1] * factor);
+    }
+  };
+
+  for (const term of tokens) add(term, 1);
+  const last = tokens[tokens.length - 1];
+  if (last.length >= PREFIX_MIN) {
+    for (const term of prefixTerms(index.sorted, last)) {
+      if (term !== last) add(term, PREFIX_WEIGHT);
+    }
+  }
+
+  return [...scores]
+    .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+    .slice(0, limit)
+    .map(([doc, score]) => ({ id: index.docs[doc], score }));
+}
@@ -0,0 +1,41 @@
+// Generated by scripts/build-ui-strings.py from ui-strings.source.js. Do not edit.
+
+export default {
+  "welcome.greeting": "What would you like to discover about emotions?",
+  "welcome.introBtn": "Give me an intro to this tool",
+  "welcome.emotionsBtn": "What are emotions?",
+  "welcome.helpBtn": "How can emotions help me?",
+  "help.tooltip": "Click for Help",
+  "wisdom.title": "Emotional Wisdom",
+  "wisdom.close": "Close panel",
+  "wisdom.inputPlaceholder": "Ask about this feeling...",
+  "wisdom.send": "Send",
+  "wisdom.privacyNotice": "This conversation uses AI (Claude by Anthropic) to help you explore your emotions. Messages are not stored. This is not therapy.",
+  "starters.feeling": "I'm feeling {emotion} right now — what might it be telling me?",
+  "starters.relate": "How do {emotion} and {fellow} relate?",
+  "starters.need": "Help me explore what need this connects to for me",
+  "hud.fellowMessengers": "{emotion}'s Fellow Messengers",
+  "hud.explore": "explore:",
+  "entry.hint": "tap to explore",
+  "chat.turnLimit": "You've been doing wonderful exploration! If you'd like to go deeper, you might enjoy the book — emotionrules.com",
+  "chat.error": "Something went wrong. Please try again.",
+  "subscription.title": "Continue Exploring",
+  "subscription.copy": "Enter your name and email to unlock unlimited exploration of the Emotion Constellation.",
+  "subscription.firstName": "First name",
+  "subscription.email": "Email",
+  "subscription.country": "Country",
+  "subscription.submit": "Unlock Full Access",
+  "subscription.consent": "By submitting this form, you agree to receive email communications from Six Seconds. You can unsubscribe anytime. See our",
+  "subscription.privacyPolicy": "Privacy Policy",
+  "subscription.successTitle": "Access Granted",
+  "subscription.dismiss": "Maybe later",
+  "book.credit": "From Emotion Rules by",
+  "copyright.line": "© {author}, based on the book {book} | made with {tool}",
+  "about.btnLabel": "About this App",
+  "about.p1": "This app was created by Joshua Freedman & Claude to illustrate one of the key ideas in the book, {book}: There are no negative feelings — they’re all messages from us, for us.",
+  "about.p2": "The map shows six of the basic human needs (such as safety), and how various feelings can help us with those needs. Click around to explore, or ask Claude a question:",
+  "about.starter1": "How does this map help me?",
+  "about.starter2": "What do you mean by ‘there are no negative feelings’?",
+  "about.starter3": "What is Emotion Rules all about?",
+  "language.label": "Language",
+};
@@ -0,0 +1,124 @@
+/**
+ * Lazy wisdom loader.
+ *
+ * scripts/build-wisdom.py emits each emotion's wisdom for a locale as its
+ * own record (label, readMore, needs[].inquiry). data/wisdom-manifest.json
+ * says how they are laid out:
+ *   files  — data/wisdom/{locale}/{id}.json
+ *   packed — byte ranges of data/wisdom/{locale}.pack, indexed by
+ *            data/wisdom/{locale}.index.json
+ *
+ * Records are fetched on first selection and cached per locale, so first
+ * paint does not depend on how large the wisdom corpus grows. If a record
+ * can't be fetched, the whole-locale shard (data/wisdom-{locale}.json) is
+ * used instead.
+ */
+
+const records = new Map();       // `${locale}/${id}` → wisdom record
+const pending = new Map();       // `${locale}/${id}` → Promise<record|null>
+const packIndexes = new Map();   // locale → Promise<{ id: [offset, length] }>
+const shards = new Map();        // locale → Promise<Map(id → record)>
+let manifestPromise = null;
+
+function dataUrl(path) {
+  return `${import.meta.env.BASE_URL}data/${path}`;
+}
+
+function fill(template, locale, id) {
+  return template.replace('{locale}', locale).replace('{id}', encodeURIComponent(id));
+}
+
+async function fetchJson(path) {
+  const resp = await fetch(dataUrl(path));
+  if (!resp.ok) throw new Error(`${path}: ${resp.statusText}`);
+  return resp.json();
+}
+
+function loadManifest() {
+  if (!manifestPromise) {
+    manifestPromise = fetchJson('wisdom-manifest.json').catch((err) => {
+      console.warn('Failed to load wisdom manifest:', err);
+      return null;
+    });
+  }
+  return manifestPromise;
+}
+
+async function fetchPackedRecord(layout, locale, id) {
+  if (!packIndexes.has(locale)) {
+    packIndexes.set(locale, fetchJson(fill(layout.index, locale, id)).catch((err) => {
+      packIndexes.delete(locale);
+      throw err;
+    }));
+  }
+  const entry = (await packIndexes.get(locale))[id];
+  if (!entry) throw new Error(`No wisdom record for '${id}' (${locale})`);
+
+  const [offset, length] = entry;
+  const resp = await fetch(dataUrl(fill(layout.pack, locale, id)), {
+    headers: { Range: `bytes=${offset}-${offset + length - 1}` },
+  });
+  if (!resp.ok) throw new Error(resp.statusText);
+  const bytes = new Uint8Array(await resp.arrayBuffer());
+  // A server that ignores Range answers 200 with the whole pack
+  const slice = resp.status === 206 ? bytes : bytes.subarray(offset, offset + length);
+  return JSON.parse(new TextDecoder().decode(slice));
+}
+
+function loadShard(locale) {
+  if (!shards.has(locale)) {
+    shards.set(locale, fetchJson(`wisdom-${locale}.json`)
+      .then(shard => new Map(Object.entries(shard.emotions)))
+      .catch((err) => {
+        shards.delete(locale);
+        throw err;
+      }));
+  }
+  return shards.get(locale);
+}
+
+async function fetchRecord(locale, id) {
+  const manifest = await loadManifest();
+  const layout = manifest?.records;
+  try {
+    if (layout?.layout === 'packed') return await fetchPackedRecord(layout, locale, id);
+    if (layout?.layout === 'files') return await fetchJson(fill(layout.path, locale, id));
+  } catch (err) {
+    console.warn(`Wisdom record '${id}' (${locale}) unavailable, loading locale shard:`, err);
+  }
+  const shard = await loadShard(locale);
+  return shard.get(id) || null;
+}
+
+/**
+ * Cached wisdom for one emotion, or undefined if not fetched yet.
+ * @param {string} id
+ * @param {string} locale
+ */
+export function peekEmotionWisdom(id, locale) {
+  return records.get(`${locale}/${id}`);
+}
+
+/**
+ * Fetch (once) the wisdom record for one emotion in one locale.
+ * @param {string} id
+ * @param {string} locale
+ * @returns {Promise<object|null>}
+ */
+export function loadEmotionWisdom(id, locale) {
+  const key = `${locale}/${id}`;
+  if (records.has(key)) return Promise.resolve(records.get(key));
+  if (!pending.has(key)) {
+    pending.set(key, fetchRecord(locale, id)
+      .then((record) => {
+        if (record) records.set(key, record);
+        return record;
+      })
+      .catch((err) => {
+        console.warn(`Failed to load wisdom for '${id}' (${locale}):`, err);
+        return null;
+      })
+      .finally(() => pending.delete(key)));
+  }
+  return pending.get(key);
+}
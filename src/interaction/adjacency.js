@@ -0,0 +1,77 @@
+/**
+ * Selection lookups over emotion → need links.
+ *
+ * The data build ships these as index arrays into the emotions list
+ * (scripts/pipeline/adjacency.py), so a selection resolves a need's
+ * emotions with a map lookup, and an emotion's fellow messengers by
+ * filtering itself out of its needs' lists, instead of scanning every
+ * emotion's links. Data without the index gets the same tables
+ * built once here (except the similarity-ranked related list).
+ */
+
+/** Build { needEmotions } from the links (same shape as the shipped index). */
+function buildIndex(emotionNodes) {
+  const needEmotions = {};
+  emotionNodes.forEach((emotion, i) => {
+    for (const needId of new Set(emotion.links.map(l => l.needId))) {
+      (needEmotions[needId] ||= []).push(i);
+    }
+  });
+  return { needEmotions };
+}
+
+/**
+ * @param {Array} emotionNodes — in the data file's order (the index refers to it)
+ * @param {Object|null} index — data.adjacency from the constellation file
+ */
+export function createAdjacency(emotionNodes, index) {
+  const { needEmotions } = index || buildIndex(emotionNodes);
+  const related = index?.related || {};
+  const emotionsById = new Map(emotionNodes.map(e => [e.id, e]));
+  const indexById = new Map(emotionNodes.map((e, i) => [e.id, i]));
+
+  const toIds = (indexes) => indexes.map(i => emotionNodes[i].id);
+
+  return {
+    /** Emotion node by id */
+    emotion(id) {
+      return emotionsById.get(id);
+    },
+
+    /** Emotion nodes linked to a need, in data order */
+    needEmotions(needId) {
+      return (needEmotions[needId] || []).map(i => emotionNodes[i]);
+    },
+
+    /** { needId: [fellow emotion ids] } — other emotions sharing each of this emotion's needs */
+    fellowsByNeed(emotionId) {
+      const self = indexById.get(emotionId);
+      const emotion = emotionNodes[self];
+      const result = {};
+      if (!emotion) return result;
+      for (const link of emotion.links) {
+        result[link.needId] ||= toIds((needEmotions[link.needId] || []).filter(j => j !== self));
+      }
+      return result;
+    },
+
+    /** Fellow messenger ids (every emotion sharing any need), in data order */
+    fellows(emotionId) {
+      const self = indexById.get(emotionId);
+      const emotion = emotionNodes[self];
+      if (!emotion) return [];
+      const merged = new Set();
+      for (const link of emotion.links) {
+        for (const i of needEmotions[link.needId] || []) {
+          if (i !== self) merged.add(i);
+        }
+      }
+      return toIds([...merged].sort((a, b) => a - b));
+    },
+
+    /** Emotion ids with the most similar need profile, best first ([] without the shipped index) */
+    related(emotionId) {
+      return toIds(related[emotionId] || []);
+    },
+  };
+}
@@ -14,9 +14,15 @@
 
 import { easeCubicInOut } from 'd3-ease';
 import { emit } from '../core/events.js';
+import { getLocale } from '../core/locale.js';
+import { loadEmotionWisdom } from '../core/wisdom-loader.js';
+import { createAdjacency } from './adjacency.js';
 import { INTERACTION, CONNECTIONS } from '../core/constants.js';
 
-export function createSelectionState(emotionNodes, needNodes, needNodesById) {
+export function createSelectionState(emotionNodes, needNodes, needNodesById, adjacencyIndex = null) {
+  // Precomputed need/emotion lookups (see adjacency.js)
+  const adjacency = createAdjacency(emotionNodes, adjacencyIndex);
+
   // --- Internal state ---
   let mode = 'idle';           // 'idle' | 'emotion' | 'need'
   let selectedId = null;
@@ -39,29 +45,9 @@ export function createSelectionState(emotionNodes, needNodes, needNodesById) {
 
   // --- Helpers ---
 
-  /** Find fellow messengers: emotions that share any need with the selected emotion */
-  function computeFellowMessengers(emotionId) {
-    const fellows = new Set();
-    const emotion = emotionNodes.find(e => e.id === emotionId);
-    if (!emotion) return fellows;
-
-    const myNeedIds = new Set(emotion.links.map(l => l.needId));
-
-    for (const other of emotionNodes) {
-      if (other.id === emotionId) continue;
-      for (const link of other.links) {
-        if (myNeedIds.has(link.needId)) {
-          fellows.add(other.id);
-          break;
-        }
-      }
-    }
-    return fellows;
-  }
-
   /** Collect inquiry data for the current selection */
   function collectInquiries(emotionId) {
-    const emotion = emotionNodes.find(e => e.id === emotionId);
+    const emotion = adjacency.emotion(emotionId);
     if (!emotion) return [];
     return emotion.links.map(link => {
       const need = needNodesById.get(link.needId);
@@ -78,7 +64,7 @@ export function createSelectionState(emotionNodes, needNodes, needNodesById) {
   /** Collect all emotions linked to a need, with their inquiries */
   function collectNeedEmotions(needId) {
     const result = [];
-    for (const emotion of emotionNodes) {
+    for (const emotion of adjacency.needEmotions(needId)) {
       for (const link of emotion.links) {
         if (link.needId === needId) {
           result.push({
@@ -113,22 +99,18 @@ export function createSelectionState(emotionNodes, needNodes, needNodesById) {
       transitionProgress = 0;
 
       // Find linked needs
-      const emotion = emotionNodes.find(e => e.id === id);
+      const emotion = adjacency.emotion(id);
       linkedNeedIds = new Set(emotion ? emotion.links.map(l => l.needId) : []);
 
-      // Find all emotions linked to those needs (including this one)
-      linkedEmotionIds = new Set();
-      linkedEmotionIds.add(id);
-      for (const other of emotionNodes) {
-        for (const link of other.links) {
-          if (linkedNeedIds.has(link.needId)) {
-            linkedEmotionIds.add(other.id);
-          }
-        }
-      }
+      // Fellow messengers: emotions that share any need with this one
+      const fellowsPerNeed = adjacency.fellowsByNeed(id);
+      fellowMessengerIds = new Set(adjacency.fellows(id));
+
+      // All emotions linked to those needs (including this one)
+      linkedEmotionIds = new Set([id, ...fellowMessengerIds]);
 
-      // Fellow messengers (linked emotions minus self)
-      fellowMessengerIds = computeFellowMessengers(id);
+      // Warm this emotion's wisdom record so the panel can open without waiting
+      loadEmotionWisdom(id, getLocale());
 
       emit('selection:changed', {
         mode: 'emotion',
@@ -137,6 +119,8 @@ export function createSelectionState(emotionNodes, needNodes, needNodesById) {
         linkedNeeds: [...linkedNeedIds],
         linkedEmotions: [...linkedEmotionIds],
         fellowMessengers: [...fellowMessengerIds],
+        fellowMessengersPerNeed: fellowsPerNeed,
+        relatedEmotions: adjacency.related(id),
         inquiries: collectInquiries(id),
       });
     },
@@ -157,14 +141,7 @@ export function createSelectionState(emotionNodes, needNodes, needNodesById) {
       linkedNeedIds = new Set([id]);
 
       // Find all emotions linked to this need
-      linkedEmotionIds = new Set();
-      for (const emotion of emotionNodes) {
-        for (const link of emotion.links) {
-          if (link.needId === id) {
-            linkedEmotionIds.add(emotion.id);
-          }
-        }
-      }
+      linkedEmotionIds = new Set(adjacency.needEmotions(id).map(e => e.id));
 
       fellowMessengerIds = new Set();
 
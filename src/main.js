@@ -25,7 +25,7 @@ import { createLanguageSelector } from './ui/language-selector.js';
 import { findHit } from './interaction/hit-test.js';
 import { on, emit } from './core/events.js';
 import { initLocale, getLocale } from './core/locale.js';
-import { t } from './core/ui-strings.js';
+import { t, loadUiStrings } from './core/ui-strings.js';
 
 const VERIFY_ENDPOINT = import.meta.env.VITE_VERIFY_ENDPOINT
   || 'https://us-central1-emotion-rules-quiz.cloudfunctions.net/constellationVerifyToken';
@@ -125,8 +125,9 @@ async function init() {
   console.log('WebGL2 context created:', gl.getParameter(gl.VERSION));
   console.log(`Canvas: ${context.width}x${context.height} @ ${context.pixelRatio}x`);
 
-  // 2. Load constellation data (locale-aware with English fallback)
-  const data = await loadConstellationData(locale);
+  // 2. Load constellation data (locale-aware with English fallback) and
+  //    the locale's UI strings, so the first render is already translated
+  const [data] = await Promise.all([loadConstellationData(locale), loadUiStrings(locale)]);
   console.log(`Loaded: ${data.needs.length} needs, ${data.emotions.length} emotions`);
 
   // 3. Create simulation
@@ -145,7 +146,7 @@ async function init() {
 
   // 6. Create interaction system
   const selectionState = createSelectionState(
-    sim.emotionNodes, sim.needNodes, sim.needNodesById
+    sim.emotionNodes, sim.needNodes, sim.needNodesById, data.adjacency
   );
   const inputHandler = createInputHandler(context.canvas);
   const floatingInquiries = createFloatingInquiries(labelContainer);
@@ -32,6 +32,24 @@ function weightedCentroid(links, needNodesById) {
   return { x: sumX / sumW, y: sumY / sumW };
 }
 
+/**
+ * Pick the build-time preset (scripts/build-layout.py) whose aspect ratio
+ * is closest to the viewport's, or null if the data carries none.
+ */
+function nearestPreset(layouts, width, height) {
+  if (!layouts || !layouts.presets || layouts.presets.length === 0) return null;
+  const aspect = Math.log(width / height);
+  let best = null, bestDistance = Infinity;
+  for (const preset of layouts.presets) {
+    const distance = Math.abs(Math.log(preset.width / preset.height) - aspect);
+    if (distance < bestDistance) {
+      best = preset;
+      bestDistance = distance;
+    }
+  }
+  return best;
+}
+
 export function createSimulation(data, width, height) {
   const needNodesById = new Map();
 
@@ -61,23 +79,40 @@ export function createSimulation(data, width, height) {
     return node;
   });
 
-  // Create emotion nodes
-  const emotionNodes = data.emotions.map((emotion) => {
-    const centroid = weightedCentroid(emotion.links, needNodesById);
+  // Settled positions are stored relative to the need ring, so they scale
+  // to this viewport. A preset that predates an emotion is ignored.
+  let preset = nearestPreset(data.layouts, width, height);
+  if (preset && !data.emotions.every(e => preset.positions[e.id])) preset = null;
 
-    // Compute display color: blend of linked need colors, weighted by strength
-    const displayColor = computeEmotionColor(emotion.links, needNodesById);
+  // Create emotion nodes. Color, size and centroid are precomputed by the
+  // data build (scripts/pipeline/appearance.py); older files fall back to
+  // computing them here.
+  const emotionNodes = data.emotions.map((emotion) => {
+    const settled = preset ? preset.positions[emotion.id] : null;
+    let start = null;
+    if (settled) {
+      start = { x: cx + settled[0] * ringRadius, y: cy + settled[1] * ringRadius };
+    } else {
+      // Near the centroid with a small random offset
+      const centroid = emotion.centroid
+        ? { x: cx + emotion.centroid[0] * ringRadius, y: cy + emotion.centroid[1] * ringRadius }
+        : weightedCentroid(emotion.links, needNodesById);
+      start = {
+        x: centroid.x + (Math.random() - 0.5) * 30,
+        y: centroid.y + (Math.random() - 0.5) * 30,
+      };
+    }
 
     return {
       id: emotion.id,
       type: 'emotion',
       label: emotion.label,
       links: emotion.links,
-      displayColor,
-      displaySize: emotion.links.length > 1 ? 32 : 24, // bridge emotions notably larger
-      // Initial position near centroid with small random offset
-      x: centroid.x + (Math.random() - 0.5) * 30,
-      y: centroid.y + (Math.random() - 0.5) * 30,
+      // Blend of linked need colors, weighted by strength
+      displayColor: emotion.displayColor || computeEmotionColor(emotion.links, needNodesById),
+      displaySize: emotion.displaySize || (emotion.links.length > 1 ? 32 : 24), // bridge emotions notably larger
+      x: start.x,
+      y: start.y,
     };
   });
 
@@ -98,9 +133,15 @@ export function createSimulation(data, width, height) {
     .alphaTarget(PHYSICS.alphaTarget)
     .velocityDecay(PHYSICS.velocityDecay);
 
-  // Warmup: pre-settle before first render
-  for (let i = 0; i < PHYSICS.warmupTicks; i++) {
-    simulation.tick();
+  // Warmup: pre-settle before first render. A preset already ran these
+  // ticks offline, so only fast-forward alpha to where the warmup leaves it.
+  if (preset) {
+    const decay = Math.pow(1 - PHYSICS.alphaDecay, data.layouts.ticks);
+    simulation.alpha(PHYSICS.alphaTarget + (1 - PHYSICS.alphaTarget) * decay);
+  } else {
+    for (let i = 0; i < PHYSICS.warmupTicks; i++) {
+      simulation.tick();
+    }
   }
 
   // Ambient rotation state
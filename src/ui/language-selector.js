@@ -6,11 +6,13 @@
  *
  * Shifts left when the wisdom panel is open so it doesn't overlap.
  *
- * Calls setLocale() on selection, which emits 'locale:changed'.
+ * On selection, loads the locale's UI strings, then calls setLocale(),
+ * which emits 'locale:changed'. Only the latest pick is applied, so a slow
+ * load finishing after a quicker later one can't switch the app back.
  */
 
 import { getLocale, setLocale, SUPPORTED_LOCALES } from '../core/locale.js';
-import { t } from '../core/ui-strings.js';
+import { t, loadUiStrings } from '../core/ui-strings.js';
 import { on } from '../core/events.js';
 
 export function createLanguageSelector(container) {
@@ -21,6 +23,7 @@ export function createLanguageSelector(container) {
   btn.className = 'lang-selector__btn';
   btn.setAttribute('aria-label', t('language.label'));
   btn.textContent = getLocale().toUpperCase();
+  let requested = getLocale();  // Last picked code; older string loads are ignored
 
   const dropdown = document.createElement('div');
   dropdown.className = 'lang-selector__dropdown';
@@ -35,7 +38,11 @@ export function createLanguageSelector(container) {
     item.textContent = loc.nativeLabel;
     item.addEventListener('click', (e) => {
       e.stopPropagation();
-      setLocale(loc.code);
+      // Strings first: 'locale:changed' listeners re-render with t() right away
+      requested = loc.code;
+      loadUiStrings(loc.code).then(() => {
+        if (requested === loc.code) setLocale(loc.code);
+      });
       btn.textContent = loc.code.toUpperCase();
       closeDropdown();
       // Update active state
@@ -5,6 +5,8 @@
  *
  * - idle:    Panel hidden.
  * - welcome: Generic greeting + 3 intro starter buttons. No emotion selected.
+ *            Typing offers the best-matching emotions (search-index.js);
+ *            picking one selects it and opens its wisdom.
  * - wisdom:  Wisdom text types word-by-word, starter prompts appear, input visible.
  * - chat:    Messages flow, input at bottom, wisdom collapsed above.
  *
@@ -22,41 +24,10 @@ import { createChatClient } from '../chat/chat-client.js';
 import { generateStarterPrompts } from '../chat/starter-prompts.js';
 import { t } from '../core/ui-strings.js';
 import { getLocale } from '../core/locale.js';
+import { loadEmotionWisdom, peekEmotionWisdom } from '../core/wisdom-loader.js';
+import { searchEmotions } from '../core/search-index.js';
 
-// ─── Wisdom data loader ──────────────────────────────────────────────────────
-
-let wisdomData = null;
-let rawWisdomJson = null;
-
-async function loadWisdomData() {
-  try {
-    const resp = await fetch(`${import.meta.env.BASE_URL}data/emotion-constellation-more-info-data.json`);
-    rawWisdomJson = await resp.json();
-    buildWisdomForLocale(getLocale());
-    console.log(`Wisdom data loaded: ${wisdomData.size} emotions`);
-  } catch (err) {
-    console.warn('Failed to load wisdom data:', err);
-  }
-}
-
-function buildWisdomForLocale(locale) {
-  if (!rawWisdomJson) return;
-  wisdomData = new Map();
-  for (const emotion of rawWisdomJson.emotions) {
-    wisdomData.set(emotion.id, {
-      label: emotion.label?.[locale] || emotion.label?.en || emotion.id,
-      readMore: {
-        essence: emotion.readMore?.essence?.[locale] || emotion.readMore?.essence?.en || '',
-        signal: emotion.readMore?.signal?.[locale] || emotion.readMore?.signal?.en || '',
-        reflection: emotion.readMore?.reflection?.[locale] || emotion.readMore?.reflection?.en || '',
-        bookRef: emotion.readMore?.bookRef?.[locale] || emotion.readMore?.bookRef?.en || '',
-      },
-    });
-  }
-}
-
-// Start loading immediately
-const dataReady = loadWisdomData();
+const MATCH_LIMIT = 3;
 
 // ─── Panel factory ───────────────────────────────────────────────────────────
 
@@ -72,6 +43,7 @@ export function createWisdomPanel(container) {
   let typingTimeoutId = null;
   let privacyShown = false;
   let allEmotionNodes = [];        // Cached for fellow messenger label lookup
+  let matchQuery = '';             // Latest welcome input searched; older results are dropped
 
   // ─── Build DOM ─────────────────────────────────────────────────────────────
 
@@ -87,6 +59,7 @@ export function createWisdomPanel(container) {
       <div class="wisdom-panel__welcome-section" style="display:none;">
         <p class="wisdom-panel__welcome-greeting"></p>
         <div class="wisdom-panel__welcome-starters"></div>
+        <div class="wisdom-panel__welcome-matches"></div>
       </div>
       <div class="wisdom-panel__wisdom-section">
         <h3 class="wisdom-panel__emotion-name"></h3>
@@ -112,6 +85,7 @@ export function createWisdomPanel(container) {
   const welcomeSection = panelEl.querySelector('.wisdom-panel__welcome-section');
   const welcomeGreeting = panelEl.querySelector('.wisdom-panel__welcome-greeting');
   const welcomeStarters = panelEl.querySelector('.wisdom-panel__welcome-starters');
+  const welcomeMatches = panelEl.querySelector('.wisdom-panel__welcome-matches');
   const wisdomSection = panelEl.querySelector('.wisdom-panel__wisdom-section');
   const nameEl = panelEl.querySelector('.wisdom-panel__emotion-name');
   const bodyEl = panelEl.querySelector('.wisdom-panel__body');
@@ -148,6 +122,11 @@ export function createWisdomPanel(container) {
     handleInputSubmit();
   });
 
+  // Welcome: suggest emotions matching what's typed so far
+  inputEl.addEventListener('input', () => {
+    if (panelState === 'welcome') showMatches(inputEl.value.trim());
+  });
+
   // Selection events
   const unsubSelection = on('selection:changed', (data) => {
     if (data.mode === 'emotion') {
@@ -194,9 +173,8 @@ export function createWisdomPanel(container) {
     showAbout();
   });
 
-  // Locale change: rebuild wisdom data for new locale, refresh UI strings
-  const unsubLocale = on('locale:changed', ({ locale }) => {
-    buildWisdomForLocale(locale);
+  // Locale change: refresh UI strings; wisdom records reload per locale on demand
+  const unsubLocale = on('locale:changed', () => {
     updateLocaleStrings();
     // Refresh visible panel content for the new locale
     if (isVisible && panelState === 'welcome') {
@@ -344,6 +322,7 @@ export function createWisdomPanel(container) {
     // Build welcome content
     welcomeGreeting.textContent = t('welcome.greeting');
     welcomeStarters.innerHTML = '';
+    clearMatches();
 
     const welcomeButtons = [
       { key: 'welcome.introBtn', text: t('welcome.introBtn') },
@@ -371,6 +350,34 @@ export function createWisdomPanel(container) {
     });
   }
 
+  /** Emotion buttons for the welcome input's best search matches. */
+  async function showMatches(query) {
+    matchQuery = query;
+    const matches = query ? await searchEmotions(query, getLocale(), MATCH_LIMIT) : [];
+    if (query !== matchQuery || panelState !== 'welcome') return;
+
+    welcomeMatches.innerHTML = '';
+    for (const { id } of matches) {
+      const emotion = allEmotionNodes.find(e => e.id === id);
+      if (!emotion) continue;
+      const btn = document.createElement('button');
+      btn.className = 'wisdom-panel__starter-btn';
+      btn.textContent = emotion.label;
+      btn.addEventListener('click', (e) => {
+        e.stopPropagation();
+        inputEl.value = '';
+        clearMatches();
+        emit('input:emotion-click', { id });
+      });
+      welcomeMatches.appendChild(btn);
+    }
+  }
+
+  function clearMatches() {
+    matchQuery = '';
+    welcomeMatches.innerHTML = '';
+  }
+
   function showPanel(emotionId) {
     if (!emotionId) return;
     showWisdom(emotionId);
@@ -410,10 +417,23 @@ export function createWisdomPanel(container) {
     welcomeSection.style.display = 'none';
     wisdomSection.style.display = '';
 
-    if (!wisdomData) return;
-    const wisdom = wisdomData.get(emotionId);
-    if (!wisdom) return;
+    const locale = getLocale();
+    const cached = peekEmotionWisdom(emotionId, locale);
+    if (cached) {
+      renderWisdom(emotionId, cached);
+      return;
+    }
+    nameEl.textContent = '';
+    bodyEl.innerHTML = '';
+    loadEmotionWisdom(emotionId, locale).then((wisdom) => {
+      // Ignore if the user moved on while the record was in flight
+      if (!wisdom || panelState !== 'wisdom' || getLocale() !== locale) return;
+      if (currentEmotionId && currentEmotionId !== emotionId) return;
+      renderWisdom(emotionId, wisdom);
+    });
+  }
 
+  function renderWisdom(emotionId, wisdom) {
     nameEl.textContent = wisdom.label;
     bodyEl.innerHTML = '';
 
@@ -529,7 +549,9 @@ export function createWisdomPanel(container) {
     startersEl.innerHTML = '';
 
     const emotion = currentSelectionData?.emotion;
-    const fellows = currentSelectionData?.fellowMessengers || [];
+    // Most similar emotions first (build-time ranking), else plain fellow messengers
+    const related = currentSelectionData?.relatedEmotions || [];
+    const fellows = related.length > 0 ? related : currentSelectionData?.fellowMessengers || [];
     const prompts = generateStarterPrompts(emotion, fellows, allEmotionNodes);
 
     for (const promptText of prompts) {
@@ -558,6 +580,7 @@ export function createWisdomPanel(container) {
     panelState = 'chat';
     welcomeStarters.innerHTML = '';
     welcomeStarters.classList.remove('wisdom-panel__welcome-starters--visible');
+    clearMatches();
 
     // Show privacy notice once
     if (!privacyShown) {
@@ -591,12 +614,13 @@ export function createWisdomPanel(container) {
       privacyShown = true;
     }
 
-    const wisdom = wisdomData?.get(currentEmotionId);
+    const wisdom = peekEmotionWisdom(currentEmotionId, getLocale());
     const chatData = {
       emotion: currentSelectionData?.emotion,
       id: currentEmotionId,
       inquiries: currentSelectionData?.inquiries || [],
       fellowMessengers: currentSelectionData?.fellowMessengers || [],
+      fellowMessengersPerNeed: currentSelectionData?.fellowMessengersPerNeed || null,
       wisdom: wisdom?.readMore || {},
       emotionNodes: allEmotionNodes,
     };